@@ -0,0 +1,76 @@
+"""
+Benchmark of the conversion of projected edges into PyKEEN triples. It compares the previous
+implementation of ``Edge.as_pykeen``, which mapped every edge with a Python closure, with the
+current one, which factorizes the name columns and fills a single int64 array.
+
+Usage: python benchmarks/as_pykeen.py [NUM_EDGES ...] from the root of the repository, with mOWL
+installed or in PYTHONPATH.
+"""
+
+import sys
+import time
+
+import numpy as np
+import torch as th
+from pykeen.triples import TriplesFactory
+
+import mowl
+mowl.init_jvm("4g")
+from mowl.projection.edge import Edge  # noqa: E402
+from mowl.projection.edge_table import EdgeTable  # noqa: E402
+
+
+def legacy_as_pykeen(edges, create_inverse_triples=True, entity_to_id=None,
+                     relation_to_id=None):
+    entities, relations = set(), set()
+    for edge in edges:
+        entities |= {edge.src, edge.dst}
+        relations |= {edge.rel}
+
+    if entity_to_id is None:
+        entity_to_id = {v: k for k, v in enumerate(list(entities))}
+    if relation_to_id is None:
+        relation_to_id = {v: k for k, v in enumerate(list(relations))}
+
+    def map_edge(edge):
+        return [entity_to_id[edge.src], relation_to_id[edge.rel], entity_to_id[edge.dst]]
+
+    triples = np.array([map_edge(edge) for edge in edges], dtype=int)
+    return TriplesFactory(th.tensor(triples), entity_to_id=entity_to_id,
+                          relation_to_id=relation_to_id,
+                          create_inverse_triples=create_inverse_triples)
+
+
+def synthetic_edges(num_edges, num_entities, num_relations, seed=0):
+    rng = np.random.default_rng(seed)
+    names = [f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(num_entities)]
+    rel_names = [f"http://purl.obolibrary.org/obo/RO_{i:07d}" for i in range(num_relations)]
+    src = rng.integers(0, num_entities, num_edges).tolist()
+    rel = rng.integers(0, num_relations, num_edges).tolist()
+    dst = rng.integers(0, num_entities, num_edges).tolist()
+    return [Edge(names[s], rel_names[r], names[d]) for s, r, d in zip(src, rel, dst)]
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(sizes):
+    print("edges\tlegacy_s\tedges_s\tedge_table_s\tspeedup")
+    for num_edges in sizes:
+        edges = synthetic_edges(num_edges, max(num_edges // 10, 10), 20)
+        table = EdgeTable.from_edges(edges)
+
+        legacy, legacy_time = timed(legacy_as_pykeen, edges, create_inverse_triples=False)
+        current, current_time = timed(Edge.as_pykeen, edges, create_inverse_triples=False)
+        _, table_time = timed(table.as_pykeen, create_inverse_triples=False)
+
+        assert legacy.num_triples == current.num_triples == num_edges
+        print(f"{num_edges}\t{legacy_time:.3f}\t{current_time:.3f}\t{table_time:.3f}\t"
+              f"{legacy_time / current_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000, 5_000_000])
@@ -0,0 +1,69 @@
+"""
+Benchmark of the walk backends. For each graph size, walker and backend it reports the time to
+write the walks of one round to a file, with the walks per second of each worker. The ``numpy``
+backend runs in Python without the JVM and generates the shards of the workers one after another,
+so it runs with one worker; the ``jvm`` backend runs with ``--workers`` threads, 1 by default.
+Node2Vec includes the time to build its alias tables.
+
+Usage: python benchmarks/walk_backends.py [NUM_EDGES ...] [--workers N] from the root of the
+repository, with mOWL installed or in PYTHONPATH.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import mowl
+mowl.init_jvm("4g")
+from mowl.projection.edge_table import EdgeTable  # noqa: E402
+from mowl.walking import DeepWalk, Node2Vec  # noqa: E402
+
+
+def synthetic_edges(num_edges, num_entities, num_relations, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(num_entities)])
+    rel_names = np.array([f"http://purl.obolibrary.org/obo/RO_{i:07d}"
+                          for i in range(num_relations)])
+    src = np.concatenate([np.arange(num_entities), rng.integers(0, num_entities,
+                                                                num_edges - num_entities)])
+    rel = rng.integers(0, num_relations, num_edges)
+    dst = rng.integers(0, num_entities, num_edges)
+    return EdgeTable(src, rel, dst, names, rel_names)
+
+
+WALKERS = {
+    "deepwalk": lambda backend, **kwargs: DeepWalk(1, 20, alpha=0.1, backend=backend, **kwargs),
+    "node2vec": lambda backend, **kwargs: Node2Vec(1, 20, p=2., q=0.5, backend=backend,
+                                                   **kwargs),
+}
+
+
+def main(sizes, workers):
+    print("edges\twalker\tbackend\tworkers\tseconds\twalks_per_second\tmb")
+    with tempfile.TemporaryDirectory() as tmp:
+        outfile = os.path.join(tmp, "walks")
+        for num_edges in sizes:
+            edges = synthetic_edges(num_edges, max(num_edges // 10, 10), 20)
+            for name, walker in WALKERS.items():
+                for backend, backend_workers in [("jvm", workers), ("numpy", 1)]:
+                    model = walker(backend, outfile=outfile, workers=backend_workers, seed=0)
+                    start = time.perf_counter()
+                    model.walk(edges)
+                    seconds = time.perf_counter() - start
+                    rate = sum(model.walks_per_second)
+                    size = os.path.getsize(outfile) / 2**20
+                    print(f"{num_edges}\t{name}\t{backend}\t{backend_workers}\t{seconds:.2f}\t"
+                          f"{rate:.0f}\t{size:.1f}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    workers = 1
+    if "--workers" in args:
+        index = args.index("--workers")
+        workers = int(args[index + 1])
+        del args[index:index + 2]
+    main([int(arg) for arg in args] or [100_000, 1_000_000], workers)
@@ -0,0 +1,77 @@
+"""
+Benchmark of the text and binary formats of random walks. For each format it reports the size of
+the output, the time to generate the walks with DeepWalk and the time to read them and count the
+occurrences of each token, which is the first pass of Word2Vec over a corpus. Text walks are read
+line by line and their tokens hashed into a dictionary; binary walks are memory-mapped with
+``WalkCorpus`` and counted with ``WalkCorpus.counts``.
+
+Usage: python benchmarks/walk_corpus.py [NUM_EDGES ...] from the root of the repository, with mOWL
+installed or in PYTHONPATH.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+
+import mowl
+mowl.init_jvm("4g")
+from mowl.projection.edge_table import EdgeTable  # noqa: E402
+from mowl.walking import DeepWalk, Walks, WalkCorpus  # noqa: E402
+
+
+def synthetic_edges(num_edges, num_entities, num_relations, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(num_entities)])
+    rel_names = np.array([f"http://purl.obolibrary.org/obo/RO_{i:07d}"
+                          for i in range(num_relations)])
+    src = np.concatenate([np.arange(num_entities), rng.integers(0, num_entities,
+                                                                num_edges - num_entities)])
+    rel = rng.integers(0, num_relations, num_edges)
+    dst = rng.integers(0, num_entities, num_edges)
+    return EdgeTable.from_triples(names[src], rel_names[rel], names[dst])
+
+
+def output_size(outfile):
+    files = [outfile, outfile + ".offsets", outfile + ".vocab"]
+    return sum(os.path.getsize(f) for f in files if os.path.exists(f))
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def count_text(outfile):
+    counts = Counter()
+    for walk in Walks(outfile):
+        counts.update(walk)
+    return len(counts)
+
+
+def count_binary(outfile):
+    return int(np.count_nonzero(WalkCorpus(outfile).counts()))
+
+
+def main(sizes):
+    print("edges\tformat\toutput_mb\twrite_s\tcount_s")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_edges in sizes:
+            edges = list(synthetic_edges(num_edges, max(num_edges // 10, 10), 20))
+            tokens = {}
+            for walks_format, count in [("text", count_text), ("binary", count_binary)]:
+                outfile = os.path.join(tmp, f"walks_{walks_format}")
+                walker = DeepWalk(1, 20, alpha=0.1, outfile=outfile, walks_format=walks_format)
+                _, write_time = timed(walker.walk, edges)
+                tokens[walks_format], count_time = timed(count, outfile)
+                print(f"{num_edges}\t{walks_format}\t{output_size(outfile) / 2**20:.1f}\t"
+                      f"{write_time:.3f}\t{count_time:.3f}")
+            assert tokens["text"] == tokens["binary"]
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,68 @@
+"""
+Benchmark of the time to pass edges to the walkers, before any walk is generated. The ``list``
+method converts each edge into an ``org.mowl.Edge`` object, which the JVM hashes by name; this was
+how the walkers took their edges. The ``table`` method passes an ``EdgeTable`` as integer columns
+and a packed vocabulary, which is what ``DeepWalk.walk`` and ``Node2Vec.walk`` do now. Both
+methods build the same graph.
+
+Usage: python benchmarks/walk_setup.py [NUM_EDGES ...] from the root of the repository, with mOWL
+installed or in PYTHONPATH. Sizes above 1M edges skip the ``list`` method unless ``--list`` is
+given, since it needs a Java object per edge.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import mowl
+mowl.init_jvm("4g")
+from java.util import ArrayList  # noqa: E402
+from org.mowl import Edge  # noqa: E402
+from org.mowl.Walking import DeepWalk as DW  # noqa: E402
+from mowl.projection.edge_table import EdgeTable  # noqa: E402
+
+
+def synthetic_edges(num_edges, num_entities, num_relations, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(num_entities)])
+    rel_names = np.array([f"http://purl.obolibrary.org/obo/RO_{i:07d}"
+                          for i in range(num_relations)])
+    src = np.concatenate([np.arange(num_entities), rng.integers(0, num_entities,
+                                                                num_edges - num_entities)])
+    rel = rng.integers(0, num_relations, num_edges)
+    dst = rng.integers(0, num_entities, num_edges)
+    return EdgeTable(src, rel, dst, names, rel_names)
+
+
+def walker(edges):
+    return DW(edges, 1, 20, 0.1, 1, "/dev/null", ArrayList(), True, "text", None, ArrayList())
+
+
+def from_list(table):
+    edges = ArrayList()
+    for edge in table:
+        edges.add(Edge(edge.src, edge.rel, edge.dst))
+    return walker(edges)
+
+
+def from_table(table):
+    return walker(table.to_java())
+
+
+def main(sizes, with_list):
+    print("edges\tmethod\tsetup_s\tnodes")
+    for num_edges in sizes:
+        table = synthetic_edges(num_edges, max(num_edges // 10, 10), 20)
+        methods = [("table", from_table)]
+        if with_list or num_edges <= 1_000_000:
+            methods.insert(0, ("list", from_list))
+        for name, method in methods:
+            start = time.perf_counter()
+            graph = method(table).graph()
+            print(f"{num_edges}\t{name}\t{time.perf_counter() - start:.2f}\t{graph.numNodes()}")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--list"]
+    main([int(arg) for arg in args] or [100_000, 1_000_000, 10_000_000], "--list" in sys.argv)
@@ -0,0 +1,73 @@
+"""
+Benchmark of Word2Vec trained on random walks written to a file and on random walks streamed from
+the walker. It reports the time until the first walk reaches Python, the total time to generate
+the walks and train one epoch of Word2Vec and the bytes written to disk. Streamed walks are
+generated again for each pass of Word2Vec over the corpus: one to build the vocabulary and one per
+epoch.
+
+Usage: python benchmarks/walk_stream.py [NUM_EDGES ...] from the root of the repository, with mOWL
+installed or in PYTHONPATH.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from gensim.models import Word2Vec
+
+import mowl
+mowl.init_jvm("4g")
+from mowl.projection.edge_table import EdgeTable  # noqa: E402
+from mowl.walking import DeepWalk, Walks  # noqa: E402
+
+
+def synthetic_edges(num_edges, num_entities, num_relations, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"http://purl.obolibrary.org/obo/GO_{i:07d}" for i in range(num_entities)])
+    rel_names = np.array([f"http://purl.obolibrary.org/obo/RO_{i:07d}"
+                          for i in range(num_relations)])
+    src = np.concatenate([np.arange(num_entities), rng.integers(0, num_entities,
+                                                                num_edges - num_entities)])
+    rel = rng.integers(0, num_relations, num_edges)
+    dst = rng.integers(0, num_entities, num_edges)
+    return EdgeTable.from_triples(names[src], rel_names[rel], names[dst])
+
+
+def train(walks):
+    return Word2Vec(walks, vector_size=32, window=5, min_count=1, epochs=1, workers=1)
+
+
+def from_file(edges, outfile):
+    start = time.perf_counter()
+    walker = DeepWalk(1, 20, alpha=0.1, outfile=outfile)
+    walker.walk(edges)
+    walks = Walks(outfile)
+    first = time.perf_counter() - start
+    train(walks)
+    return first, time.perf_counter() - start, os.path.getsize(outfile)
+
+
+def from_stream(edges):
+    start = time.perf_counter()
+    stream = DeepWalk(1, 20, alpha=0.1).stream(edges)
+    next(iter(stream))
+    first = time.perf_counter() - start
+    train(stream)
+    return first, time.perf_counter() - start, 0
+
+
+def main(sizes):
+    print("edges\tmode\tfirst_walk_s\ttotal_s\tdisk_mb")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_edges in sizes:
+            edges = list(synthetic_edges(num_edges, max(num_edges // 10, 10), 20))
+            for mode, run in [("file", lambda: from_file(edges, os.path.join(tmp, "walks"))),
+                              ("stream", lambda: from_stream(edges))]:
+                first, total, disk = run()
+                print(f"{num_edges}\t{mode}\t{first:.3f}\t{total:.3f}\t{disk / 2**20:.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
@@ -12,6 +12,7 @@ import java.io.File
 
 
 import collection.JavaConverters._
+import scala.collection.mutable.ArrayBuffer
 
 import org.mowl.Types._
 
@@ -36,14 +37,14 @@ class CatParser(var ontology: OWLOntology) {
         println(s"INFO: Number of GO classes: ${go_classes.length}")
        
         
-        val edges = go_classes.foldLeft(List[Triple]()){(acc, x) => acc ::: processGOClass(x)}
+        val edges = ArrayBuffer[Triple]()
+        for (go_class <- go_classes) edges ++= processGOClass(go_class)
 
-        val nodes = getNodes(edges)
+        val nodes = getNodes(edges.toList)
 
-        val id_edges = nodes.map((x) => new Triple(x, "id", x)).toList
+        val id_edges = nodes.map((x) => new Triple(x, "id", x))
 
-
-        (id_edges ::: edges).asJava
+        (ArrayBuffer[Triple]() ++= id_edges ++= edges).asJava
     }
 
     
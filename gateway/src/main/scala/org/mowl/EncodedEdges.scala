@@ -0,0 +1,146 @@
+package org.mowl
+
+// Java imports
+import collection.JavaConverters._
+
+import org.mowl.Types._
+
+
+/** Edge list encoded as integer columns. src(i), rel(i) and dst(i) are
+  * positions in the entities and relations vocabularies, which are packed in
+  * first-seen order. Python reads the columns as primitive arrays instead of
+  * converting one Triple object at a time. If provenance is not null,
+  * provenance(i) is the Provenance.axiomId of the axiom that produced edge i.
+  * If weight is not null, weight(i) is the weight of edge i, otherwise all
+  * edges have weight 1.
+  */
+class EncodedEdges(val src: Array[Int], val rel: Array[Int], val dst: Array[Int],
+  val entities: PackedStrings, val relations: PackedStrings, val provenance: Array[Long],
+  val weight: Array[Float]) {
+
+  def this(src: Array[Int], rel: Array[Int], dst: Array[Int], entities: PackedStrings, relations: PackedStrings,
+    provenance: Array[Long]) =
+    this(src, rel, dst, entities, relations, provenance, null)
+
+  def this(src: Array[Int], rel: Array[Int], dst: Array[Int], entities: PackedStrings, relations: PackedStrings) =
+    this(src, rel, dst, entities, relations, null)
+
+  def size: Int = src.length
+}
+
+object EncodedEdges {
+
+  /** Edges of columns written by Python as direct buffers in native byte
+    * order, such as the ones of EdgeTable.to_java. weight can be null.
+    */
+  def fromBuffers(src: java.nio.ByteBuffer, rel: java.nio.ByteBuffer, dst: java.nio.ByteBuffer,
+    weight: java.nio.ByteBuffer, entities: PackedStrings, relations: PackedStrings): EncodedEdges = {
+
+    val weights = if (weight == null) null else {
+      val floats = weight.duplicate().order(java.nio.ByteOrder.nativeOrder).asFloatBuffer
+      val array = new Array[Float](floats.remaining)
+      floats.get(array)
+      array
+    }
+    new EncodedEdges(intArray(src), intArray(rel), intArray(dst), entities, relations, null, weights)
+  }
+
+  /** Encodes a list of edges with their weights. */
+  def fromEdges(edges: java.util.List[Edge]): EncodedEdges = {
+    val builder = new Builder(new Interner(), new Interner())
+    val weight = new Array[Float](edges.size)
+    var i = 0
+    for (edge <- edges.asScala) {
+      builder += new Triple(edge.src, edge.rel, edge.dst)
+      weight(i) = edge.weight
+      i += 1
+    }
+    val encoded = builder.result()
+    new EncodedEdges(encoded.src, encoded.rel, encoded.dst, encoded.entities, encoded.relations, null, weight)
+  }
+
+  /** Copies the int32 values of a buffer in native byte order. */
+  def intArray(buffer: java.nio.ByteBuffer): Array[Int] = {
+    val ints = buffer.duplicate().order(java.nio.ByteOrder.nativeOrder).asIntBuffer
+    val array = new Array[Int](ints.remaining)
+    ints.get(array)
+    array
+  }
+
+  def encode(triples: java.util.List[Triple]): EncodedEdges = {
+    val builder = new Builder(new Interner(), new Interner())
+    for (triple <- triples.asScala) builder += triple
+    builder.result()
+  }
+
+  /** Appends triples to integer columns. Several builders can share the same
+    * interners, in which case their results have the same vocabularies.
+    */
+  class Builder(val entities: Interner, val relations: Interner) {
+    private val src = new scala.collection.mutable.ArrayBuilder.ofInt()
+    private val rel = new scala.collection.mutable.ArrayBuilder.ofInt()
+    private val dst = new scala.collection.mutable.ArrayBuilder.ofInt()
+    private var provenance: scala.collection.mutable.ArrayBuilder.ofLong = null
+
+    def +=(triple: Triple): this.type = {
+      src += entities.id(triple.src)
+      rel += relations.id(triple.rel)
+      dst += entities.id(triple.dst)
+      this
+    }
+
+    def ++=(triples: TraversableOnce[Triple]): this.type = {
+      triples.foreach(this += _)
+      this
+    }
+
+    /** Makes the builder record the provenance of each triple. Triples must
+      * then be appended with add.
+      */
+    def withProvenance(): this.type = {
+      provenance = new scala.collection.mutable.ArrayBuilder.ofLong()
+      this
+    }
+
+    /** Appends the triples produced by an axiom and records their provenance. */
+    def add(triples: TraversableOnce[Triple], axiomId: Long): this.type = {
+      for (triple <- triples) {
+        this += triple
+        provenance += axiomId
+      }
+      this
+    }
+
+    def result(): EncodedEdges = result(entities.packed, relations.packed)
+
+    /** Result with vocabularies packed beforehand, so that builders sharing
+      * the interners also share the packed vocabularies.
+      */
+    def result(entityNames: PackedStrings, relationNames: PackedStrings): EncodedEdges =
+      new EncodedEdges(src.result(), rel.result(), dst.result(), entityNames, relationNames,
+        if (provenance == null) null else provenance.result())
+  }
+
+  /** Assigns consecutive ids to strings in first-seen order. Null strings are
+    * interned as the empty string.
+    */
+  class Interner {
+    private val ids = new java.util.HashMap[String, Integer]()
+    private val names = new java.util.ArrayList[String]()
+
+    def id(name: String): Int = {
+      val key = if (name == null) "" else name
+      val existing = ids.get(key)
+      if (existing != null) {
+        existing
+      } else {
+        val newId = names.size
+        ids.put(key, newId)
+        names.add(key)
+        newId
+      }
+    }
+
+    def packed: PackedStrings = PackedStrings(names.toArray(new Array[String](names.size)))
+  }
+}
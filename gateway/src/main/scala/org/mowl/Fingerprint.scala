@@ -0,0 +1,31 @@
+package org.mowl
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.model.parameters.Imports
+
+// Java imports
+import java.nio.charset.StandardCharsets
+import java.security.MessageDigest
+import collection.JavaConverters._
+
+
+/** Content fingerprints of ontologies. The fingerprint is the SHA-256 digest
+  * of the sorted string forms of the axioms in the imports closure, so it
+  * does not depend on the order in which the axioms were loaded, on the
+  * ontology IRI or on the file the ontology was read from.
+  */
+object Fingerprint {
+
+  def ontology(ontology: OWLOntology): String = {
+    val axioms = ontology.getAxioms(Imports.INCLUDED).asScala.toArray.map(_.toString)
+    java.util.Arrays.sort(axioms.asInstanceOf[Array[Object]])
+
+    val digest = MessageDigest.getInstance("SHA-256")
+    for (axiom <- axioms) {
+      digest.update(axiom.getBytes(StandardCharsets.UTF_8))
+      digest.update('\n'.toByte)
+    }
+    digest.digest.map("%02x".format(_)).mkString
+  }
+}
@@ -8,6 +8,8 @@ import org.semanticweb.owlapi.model.parameters.Imports
 
 // Java imports
 import collection.JavaConverters._
+import scala.collection.mutable.ArrayBuffer
+import java.util.concurrent.{Callable, Executors}
 
 import org.mowl.Types._
 
@@ -17,6 +19,8 @@ trait AbstractProjector{
   val dataFactory = ontManager.getOWLDataFactory()
   val imports = Imports.fromBoolean(true)
 
+  /** Number of threads used by project. */
+  def workers: Int = 1
 
   def project(ontology: OWLOntology) = {
     val imports = Imports.fromBoolean(true)
@@ -24,11 +28,43 @@ trait AbstractProjector{
     val ontClasses = ontology.getClassesInSignature(imports).asScala.toList
     printf("INFO: Number of ontology classes: %d\n", ontClasses.length)
 
-    val edges = ontClasses.foldLeft(List[Triple]()){(acc, x) => acc ::: processOntClass(x, ontology)}
-
+    val edges = projectInParallel(ontClasses)(processOntClass(_, ontology))
     edges.asJava
   }
 
+  /** Projects the items with `workers` threads. Items are split into
+    * contiguous chunks and the edges of the chunks are appended in order, so
+    * the result is the same as projecting the items one after the other.
+    */
+  def projectInParallel[A](items: Seq[A])(projectItem: A => Seq[Triple]): ArrayBuffer[Triple] = {
+    val edges = ArrayBuffer[Triple]()
+
+    if (workers <= 1 || items.length < 2) {
+      for (item <- items) edges ++= projectItem(item)
+    } else {
+      val indexed = items.toIndexedSeq
+      val numChunks = math.min(indexed.length, workers * 4)
+      val chunkSize = (indexed.length + numChunks - 1) / numChunks
+      val executor = Executors.newFixedThreadPool(workers)
+
+      try {
+        val futures = indexed.grouped(chunkSize).toList.map { chunk =>
+          executor.submit(new Callable[ArrayBuffer[Triple]] {
+            def call() = {
+              val chunkEdges = ArrayBuffer[Triple]()
+              for (item <- chunk) chunkEdges ++= projectItem(item)
+              chunkEdges
+            }
+          })
+        }
+        for (future <- futures) edges ++= future.get
+      } finally {
+        executor.shutdown()
+      }
+    }
+    edges
+  }
+
   //Abstract methods
   def projectAxiom(ontClass: OWLClass, axiom: OWLClassAxiom): List[Triple]
   def projectAxiom(ontClass: OWLClass, axiom: OWLClassAxiom, ontology: OWLOntology): List[Triple]
@@ -0,0 +1,91 @@
+package org.mowl.Projectors
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+
+// Java imports
+import collection.JavaConverters._
+import scala.collection.mutable.ArrayBuffer
+
+import org.mowl.Types._
+
+
+/** Annotation assertions of one projection grouped by subject IRI. The index
+  * is filled in a single pass over the AnnotationAssertion axioms and converts
+  * each assertion to its lexical edge once. It lives as long as the projection
+  * that fills it.
+  *
+  * The index is not thread-safe while it is being filled. Lookups are safe
+  * once all the axioms were added.
+  */
+class AnnotationIndex(projector: OWL2VecStarProjector) {
+
+  /** Assertions and lexical edges of one subject. The name of the subject
+    * is rendered once and shared by its edges.
+    */
+  class Entry(val name: String) {
+    val axioms = new ArrayBuffer[OWLAnnotationAssertionAxiom](4)
+    val edges = new ArrayBuffer[Triple](4)
+  }
+
+  private val entries = new java.util.HashMap[OWLAnnotationSubject, Entry]()
+
+  /** Lexical edges of all the assertions, in the order they were added. */
+  val edges = ArrayBuffer[Triple]()
+
+  def add(axiom: OWLAnnotationAssertionAxiom): Unit = {
+    val subject = axiom.getSubject
+    var entry = entries.get(subject)
+    if (entry == null) {
+      entry = new Entry(annotationSubject2Str(subject))
+      entries.put(subject, entry)
+    }
+    entry.axioms += axiom
+    for (edge <- projector.processAnnotationAxiom(axiom, entry.name)) {
+      entry.edges += edge
+      edges += edge
+    }
+  }
+
+  def annotationAxioms(subject: OWLAnnotationSubject): Seq[OWLAnnotationAssertionAxiom] =
+    Option(entries.get(subject)).map(_.axioms).getOrElse(Nil)
+
+  def lexicalEdges(subject: OWLAnnotationSubject): Seq[Triple] =
+    Option(entries.get(subject)).map(_.edges).getOrElse(Nil)
+
+  /** Edges of all the annotations of the subject, lexical or not. */
+  def annotationEdges(subject: OWLAnnotationSubject): List[Triple] = entries.get(subject) match {
+    case null => Nil
+    case entry => entry.axioms.iterator.flatMap(projector.annotationAxiom2Edge(_, entry.name)).toList
+  }
+
+  def numSubjects: Int = entries.size
+
+  def numAxioms: Int = entries.values.asScala.map(_.axioms.length).sum
+
+  /** Approximate heap used by the index, counting the entries, the edges and
+    * the characters of their strings, but not the axioms, which belong to
+    * the ontology. Objects are assumed to take a 16-byte header and 4-byte
+    * compressed references, and strings one byte per character.
+    */
+  def estimatedBytes: Long = {
+    def stringBytes(value: String) = 40L + value.length
+
+    val entryBytes = entries.values.asScala.map { entry =>
+      // Hash table node, entry, name and two buffers with their arrays.
+      32L + 24L + stringBytes(entry.name) + 2 * 40L + 4L * (entry.axioms.size + entry.edges.size)
+    }.sum
+
+    // Subject and relation names are shared, so only the values are counted.
+    val edgeBytes = edges.iterator.map(edge => 32L + stringBytes(edge.dst)).sum
+
+    entryBytes + 4L * edges.length + edgeBytes
+  }
+
+  def stats: java.util.Map[String, java.lang.Long] = Map[String, java.lang.Long](
+    "subjects" -> numSubjects.toLong,
+    "axioms" -> numAxioms.toLong,
+    "edges" -> edges.length.toLong,
+    "bytes" -> estimatedBytes
+  ).asJava
+}
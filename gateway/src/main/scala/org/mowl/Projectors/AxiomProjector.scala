@@ -0,0 +1,35 @@
+package org.mowl.Projectors
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+
+// Java imports
+import collection.JavaConverters._
+
+import org.mowl.{EncodedEdges, Provenance}
+import org.mowl.Types._
+
+
+/** Projectors whose edges derive from individual axioms. They record the
+  * axiom that produced each edge, so that when the ontology changes only the
+  * edges of the added and removed axioms need to be computed or dropped.
+  */
+trait AxiomProjector extends AbstractProjector {
+
+  /** Edges produced by a single axiom of the ontology. */
+  def projectSingleAxiom(axiom: OWLAxiom): List[Triple]
+
+  /** Edges of the ontology, in the same order as project, together with
+    * their provenance.
+    */
+  def projectWithProvenance(ontology: OWLOntology): EncodedEdges
+
+  /** Edges produced by the given axioms together with their provenance. */
+  def projectAxioms(axioms: java.util.Collection[_ <: OWLAxiom]): EncodedEdges = {
+    val builder = newBuilder()
+    for (axiom <- axioms.asScala) builder.add(projectSingleAxiom(axiom), Provenance.axiomId(axiom))
+    builder.result()
+  }
+
+  def newBuilder() = new EncodedEdges.Builder(new EncodedEdges.Interner(), new EncodedEdges.Interner()).withProvenance()
+}
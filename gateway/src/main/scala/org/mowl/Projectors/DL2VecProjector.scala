@@ -17,7 +17,9 @@ import collection.JavaConverters._
 import org.mowl.Types._
 import org.mowl.Utils._
 
-class DL2VecProjector(var bidirectional_taxonomy: Boolean = false) extends AbstractProjector{
+class DL2VecProjector(var bidirectional_taxonomy: Boolean = false, override val workers: Int = 1) extends AxiomProjector{
+
+  def this(bidirectional_taxonomy: Boolean) = this(bidirectional_taxonomy, 1)
 
   val quantityModifiers = List("ObjectSomeValuesFrom", "ObjectAllValuesFrom", "ObjectMaxCardinality", "ObjectMinCardinality")
 
@@ -27,10 +29,14 @@ class DL2VecProjector(var bidirectional_taxonomy: Boolean = false) extends Abstr
     val imports = Imports.fromBoolean(true)
     val axioms = ontology.getAxioms(imports).asScala.toList
 
-    val edges = axioms.foldLeft(List[Triple]()){(acc, x) => acc ::: projectAxiom(x)}
+    val edges = projectInParallel(axioms)(projectAxiom(_: OWLAxiom))
     edges.asJava
   }
 
+  def projectSingleAxiom(axiom: OWLAxiom) = projectAxiom(axiom)
+
+  def projectWithProvenance(ontology: OWLOntology) = projectAxioms(ontology.getAxioms(imports))
+
   def projectAxiom(ontClass: OWLClass, axiom: OWLClassAxiom): List[Triple] = {Nil}
   def projectAxiom(ontClass: OWLClass, axiom: OWLClassAxiom, ontology: OWLOntology): List[Triple] = {Nil}
   def projectAxiom(axiom: OWLClassAxiom): List[Triple] = {Nil}
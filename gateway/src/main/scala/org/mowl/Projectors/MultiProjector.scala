@@ -0,0 +1,130 @@
+package org.mowl.Projectors
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.model.parameters.Imports
+
+// Java imports
+import collection.JavaConverters._
+import scala.collection.mutable.{ArrayBuffer, HashMap}
+
+import org.mowl.EncodedEdges
+import org.mowl.Types._
+
+
+/** Projects an ontology with several projectors in one traversal of its
+  * axioms. The type and the named classes of each axiom are read once and
+  * the axiom is given to the projectors that use it. All the resulting edge
+  * lists are encoded with the same entity and relation vocabularies.
+  *
+  * Each edge list has the same edges, in the same order, as the project
+  * method of its projector.
+  */
+class MultiProjector(val projectors: java.util.List[AbstractProjector]) {
+
+  val imports = Imports.fromBoolean(true)
+
+  def project(ontology: OWLOntology): Array[EncodedEdges] = {
+    val entities = new EncodedEdges.Interner()
+    val relations = new EncodedEdges.Interner()
+    val outputs = projectors.asScala.map(output(_, ontology)).toArray
+
+    for (axiom <- ontology.getAxioms(imports).asScala) {
+      val axiomType = axiom.getAxiomType.getName
+      val namedClasses = if (axiom.isInstanceOf[OWLClassAxiom]) classesOf(axiom.asInstanceOf[OWLClassAxiom]) else Nil
+
+      for (out <- outputs) out.add(axiom, axiomType, namedClasses)
+    }
+
+    val ontClasses = ontology.getClassesInSignature(imports).asScala.toList
+    val builders = outputs.map(_.result(ontClasses, new EncodedEdges.Builder(entities, relations)))
+    val entityNames = entities.packed
+    val relationNames = relations.packed
+    builders.map(_.result(entityNames, relationNames))
+  }
+
+  /** Named classes for which ontology.getAxioms(ontClass) returns the axiom. */
+  def classesOf(axiom: OWLClassAxiom): List[OWLClass] = axiom match {
+    case ax: OWLSubClassOfAxiom =>
+      if (ax.getSubClass.isAnonymous) Nil else ax.getSubClass.asOWLClass :: Nil
+    case ax: OWLEquivalentClassesAxiom => ax.getNamedClasses.asScala.toList
+    case ax: OWLDisjointClassesAxiom =>
+      ax.getClassExpressions.asScala.filter(!_.isAnonymous).map(_.asOWLClass).toList
+    case ax: OWLDisjointUnionAxiom => ax.getOWLClass :: Nil
+    case _ => Nil
+  }
+
+  def output(projector: AbstractProjector, ontology: OWLOntology): Output = projector match {
+    case p: DL2VecProjector => new AxiomOutput(p)
+    case p: OWL2VecStarProjector => new OWL2VecStarOutput(p, ontology)
+    case p => new ClassOutput(p, ontology)
+  }
+
+  sealed trait Output {
+    def add(axiom: OWLAxiom, axiomType: String, namedClasses: List[OWLClass]): Unit
+    def result(ontClasses: List[OWLClass], builder: EncodedEdges.Builder): EncodedEdges.Builder
+  }
+
+  /** Projectors of single axioms, such as DL2VecProjector. */
+  class AxiomOutput(projector: DL2VecProjector) extends Output {
+    private val edges = ArrayBuffer[Triple]()
+
+    def add(axiom: OWLAxiom, axiomType: String, namedClasses: List[OWLClass]) =
+      axiomType match {
+        case "SubClassOf" | "EquivalentClasses" => edges ++= projector.projectAxiom(axiom)
+        case _ =>
+      }
+
+    def result(ontClasses: List[OWLClass], builder: EncodedEdges.Builder) = builder ++= edges
+  }
+
+  /** OWL2VecStarProjector groups subclass, equivalence and annotation edges. */
+  class OWL2VecStarOutput(projector: OWL2VecStarProjector, ontology: OWLOntology) extends Output {
+    private val subClassEdges = ArrayBuffer[Triple]()
+    private val equivalenceEdges = ArrayBuffer[Triple]()
+    private val annotations = new AnnotationIndex(projector)
+
+    def add(axiom: OWLAxiom, axiomType: String, namedClasses: List[OWLClass]) =
+      axiomType match {
+        case "SubClassOf" => {
+          val ax = axiom.asInstanceOf[OWLSubClassOfAxiom]
+          subClassEdges ++= projector.processSubClassAxiom(ax.getSubClass, ax.getSuperClass, ontology)
+        }
+        case "EquivalentClasses" =>
+          equivalenceEdges ++= projector.processEquivalenceAxiom(axiom.asInstanceOf[OWLEquivalentClassesAxiom], ontology)
+        case "AnnotationAssertion" if projector.include_literals =>
+          annotations.add(axiom.asInstanceOf[OWLAnnotationAssertionAxiom])
+        case _ =>
+      }
+
+    def result(ontClasses: List[OWLClass], builder: EncodedEdges.Builder) =
+      builder ++= subClassEdges ++= equivalenceEdges ++= annotations.edges
+  }
+
+  /** Projectors that process the axioms of each class, such as
+    * TaxonomyProjector and TaxonomyWithRelsProjector. When several axioms of
+    * a class produce edges, they are sorted in the order of
+    * ontology.getAxioms(ontClass), which is the order of the projector.
+    */
+  class ClassOutput(projector: AbstractProjector, ontology: OWLOntology) extends Output {
+    private val edgesByClass = HashMap[OWLClass, ArrayBuffer[(OWLAxiom, List[Triple])]]()
+
+    def add(axiom: OWLAxiom, axiomType: String, namedClasses: List[OWLClass]) =
+      for (ontClass <- namedClasses) {
+        val edges = projector.projectAxiom(ontClass, axiom.asInstanceOf[OWLClassAxiom])
+        if (!edges.isEmpty) edgesByClass.getOrElseUpdate(ontClass, ArrayBuffer()) += ((axiom, edges))
+      }
+
+    def result(ontClasses: List[OWLClass], builder: EncodedEdges.Builder) = {
+      for (ontClass <- ontClasses; axiomEdges <- edgesByClass.get(ontClass)) {
+        if (axiomEdges.size == 1) {
+          builder ++= axiomEdges.head._2
+        } else {
+          val position = ontology.getAxioms(ontClass, imports).asScala.zipWithIndex.toMap[OWLAxiom, Int]
+          for ((_, edges) <- axiomEdges.sortBy(x => position(x._1))) builder ++= edges
+        }
+      }
+      builder
+    }
+  }
+}
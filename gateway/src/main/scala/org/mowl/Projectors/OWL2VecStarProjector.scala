@@ -21,16 +21,29 @@ import org.mowl.Utils._
 class OWL2VecStarProjector(
   var bidirectional_taxonomy: Boolean,
   var only_taxonomy: Boolean,
-  var include_literals: Boolean
+  var include_literals: Boolean,
+  override val workers: Int
   // var avoid_properties: java.util.HashSet[String],
   // var additional_preferred_labels_annotations: java.util.HashSet[String],
   // var additional_synonyms_annotations: java.util.HashSet[String],
   // var memory_reasoner: String = "10240"
 ) extends AbstractProjector{
 
-  val inverseRelations = scala.collection.mutable.Map[String, Option[String]]()
+  def this(bidirectional_taxonomy: Boolean, only_taxonomy: Boolean, include_literals: Boolean) =
+    this(bidirectional_taxonomy, only_taxonomy, include_literals, 1)
+
+  val inverseRelations = scala.collection.concurrent.TrieMap[String, Option[String]]()
+  val lexicalNames = new java.util.concurrent.ConcurrentHashMap[IRI, Option[String]]()
   val searcher = new EntitySearcher()
 
+  /** Statistics of the annotation index of the last projection, or null if
+    * literals were not included. Only the statistics are kept: the index
+    * refers to the axioms of the ontology and is dropped when project returns.
+    */
+  @volatile private var lastAnnotationIndexStats: java.util.Map[String, java.lang.Long] = null
+
+  def annotationIndexStats: java.util.Map[String, java.lang.Long] = lastAnnotationIndexStats
+
   override def project(ontology: OWLOntology) = {
 
     var edgesFromObjectProperties = List[Triple]()
@@ -38,7 +51,7 @@ class OWL2VecStarProjector(
 
     var subclassOfAxioms = ListBuffer[OWLSubClassOfAxiom]()
     var equivalenceAxioms = ListBuffer[OWLEquivalentClassesAxiom]()
-    var annotationAxioms = ListBuffer[OWLAnnotationAssertionAxiom]()
+    val index = new AnnotationIndex(this)
     var otherAxioms = ListBuffer[OWLAxiom]()
 
     for (axiom <- axioms){
@@ -47,7 +60,7 @@ class OWL2VecStarProjector(
         case "SubClassOf" => subclassOfAxioms += axiom.asInstanceOf[OWLSubClassOfAxiom]
         case "AnnotationAssertion" => {
           if (include_literals)
-          annotationAxioms += axiom.asInstanceOf[OWLAnnotationAssertionAxiom]
+          index.add(axiom.asInstanceOf[OWLAnnotationAssertionAxiom])
         }
         case "EquivalentClasses" => equivalenceAxioms += axiom.asInstanceOf[OWLEquivalentClassesAxiom]
         case _ => {
@@ -57,18 +70,21 @@ class OWL2VecStarProjector(
       }
     }
 
-    val subclassOfTriples = subclassOfAxioms.flatMap(x => processSubClassAxiom(x.getSubClass, x.getSuperClass, ontology))
-    val equivalenceTriples = equivalenceAxioms.flatMap(
-      x => {
-        val subClass::superClass::rest= x.getClassExpressionsAsList.asScala.toList
-        superClass.getClassExpressionType.getName match{
-          case "ObjectIntersectionOf" => superClass.asInstanceOf[OWLObjectIntersectionOf].getOperands.asScala.toList.flatMap(processSubClassAxiom(subClass, _, ontology))
-          case _ => Nil
-        }
-      }
-    )
-    val annotationTriples = annotationAxioms.map(processAnnotationAxiom(_)).flatten
-    (subclassOfTriples.toList ::: equivalenceTriples.toList ::: annotationTriples.toList).asJava
+    if (include_literals) lastAnnotationIndexStats = index.stats
+
+    val subclassOfTriples = projectInParallel(subclassOfAxioms)(x => processSubClassAxiom(x.getSubClass, x.getSuperClass, ontology))
+    val equivalenceTriples = projectInParallel(equivalenceAxioms)(processEquivalenceAxiom(_, ontology))
+    (subclassOfTriples ++= equivalenceTriples ++= index.edges).asJava
+  }
+
+  /** Edges of the annotations of one subject, read from the ontology and its
+    * imports. Used outside of project, which reads them from its own index.
+    */
+  def annotationEdgesOf(subject: IRI, ontology: OWLOntology): List[Triple] = {
+    val name = annotationSubject2Str(subject)
+    ontology.getImportsClosure.asScala.iterator
+      .flatMap(_.getAnnotationAssertionAxioms(subject).asScala)
+      .flatMap(annotationAxiom2Edge(_, name)).toList
   }
 
   // CLASSES PROCESSING
@@ -78,9 +94,7 @@ class OWL2VecStarProjector(
     var annotationEdges = List[Triple]()
 
     if (include_literals){ //ANNOTATION PROCESSSING
-      val annotProperties = ontClass.getAnnotationPropertiesInSignature.asScala.toList
-      val annotationAxioms = ontology.getAnnotationAssertionAxioms(ontClass.getIRI).asScala.toList
-      annotationEdges = annotationAxioms.map(annotationAxiom2Edge).flatten
+      annotationEdges = annotationEdgesOf(ontClass.getIRI, ontology)
     }
 
     val axioms = ontology.getAxioms(ontClass, imports).asScala.toList
@@ -109,6 +123,14 @@ class OWL2VecStarProjector(
     }
   }
 
+  def processEquivalenceAxiom(axiom: OWLEquivalentClassesAxiom, ontology: OWLOntology): List[Triple] = {
+    val subClass::superClass::rest= axiom.getClassExpressionsAsList.asScala.toList
+    superClass.getClassExpressionType.getName match{
+      case "ObjectIntersectionOf" => superClass.asInstanceOf[OWLObjectIntersectionOf].getOperands.asScala.toList.flatMap(processSubClassAxiom(subClass, _, ontology))
+      case _ => Nil
+    }
+  }
+
   def processSubClassAxiom(subClass: OWLClassExpression, superClass: OWLClassExpression, ontology: OWLOntology): List[Triple] = {
 
     val firstCase = processSubClassAxiomComplexSubClass(subClass, superClass, ontology)
@@ -207,20 +229,34 @@ class OWL2VecStarProjector(
 
 
 
-  def processAnnotationAxiom(axiom: OWLAnnotationAssertionAxiom): Option[Triple]= {
-    val property = stripValue(axiom.getProperty.toString)
+  /** Name of an annotation property if it is a lexical annotation. Names are
+    * computed once per property IRI.
+    */
+  def lexicalName(property: OWLAnnotationProperty): Option[String] = {
+    val iri = property.getIRI
+    var name = lexicalNames.get(iri)
+    if (name == null) {
+      name = Some(stripValue(property.toString)).filter(lexicalAnnotationURISet.contains)
+      lexicalNames.put(iri, name)
+    }
+    name
+  }
+
+  def processAnnotationAxiom(axiom: OWLAnnotationAssertionAxiom): Option[Triple] =
+    processAnnotationAxiom(axiom, annotationSubject2Str(axiom.getSubject))
+
+  def processAnnotationAxiom(axiom: OWLAnnotationAssertionAxiom, subject: String): Option[Triple]= {
 
-    property match {
-      case m if (lexicalAnnotationURIs contains m) => {
-        val subject = axiom.getSubject.toString
+    lexicalName(axiom.getProperty) match {
+      case Some(m) => {
         val value = axiom.getValue
        
         val valueStr = value.isLiteral match {
           case true => {
-            val datatype = value.asLiteral.get.getDatatype
+            val literal = value.asLiteral.get
+            val datatype = literal.getDatatype
 
-            if (datatype.isString) value.asInstanceOf[OWLLiteralImplString].getLiteral
-            else if(datatype.isRDFPlainLiteral) value.asInstanceOf[OWLLiteralImplPlain].getLiteral
+            if (datatype.isString || datatype.isRDFPlainLiteral) literal.getLiteral
             else {
               println("Warning: datatype not detected: ", datatype)
               stripValue(axiom.getValue.toString)
@@ -230,10 +266,7 @@ class OWL2VecStarProjector(
         }
         Some(new Triple(subject, m, valueStr))
       }
-      case _ => {
-        //println("C ",property)
-        None
-      }
+      case None => None
     }
   }
 
@@ -408,15 +441,19 @@ class OWL2VecStarProjector(
     "http://www.geneontology.org/formats/oboInOwl#hasOBONamespace"
   )
 
+  val lexicalAnnotationURISet = lexicalAnnotationURIs.toSet
+
   val excludedAnnotationProperties = List("http://www.geneontology.org/formats/oboInOwl#inSubset", "'http://www.geneontology.org/formats/oboInOwl#id", "http://www.geneontology.org/formats/oboInOwl#hasAlternativeId") //List("rdfs:comment", "http://www.w3.org/2000/01/rdf-schema#comment")
 
-  def annotationAxiom2Edge(annotationAxiom: OWLAnnotationAssertionAxiom): Option[Triple] = {
+  def annotationAxiom2Edge(annotationAxiom: OWLAnnotationAssertionAxiom): Option[Triple] =
+    annotationAxiom2Edge(annotationAxiom, annotationSubject2Str(annotationAxiom.getSubject))
+
+  def annotationAxiom2Edge(annotationAxiom: OWLAnnotationAssertionAxiom, subject: String): Option[Triple] = {
 
     val property = annotationAxiom.getProperty.toStringID.toString
 
     property match {
       case m if true || (lexicalAnnotationURIs contains m) =>  {
-        val subject = annotationAxiom.getSubject.toString
         val value = annotationAxiom.getValue
           Some(new Triple(subject, m, stripValue(value.toString)))
       }
@@ -429,24 +466,21 @@ class OWL2VecStarProjector(
 
   def stripValue(valueStr: String) = {
 
-    val value = valueStr.replaceAll("\\\\", "")
+    val value = if (valueStr.indexOf('\\') < 0) valueStr else valueStr.replace("\\", "")
     value.head match {
-      case '"' => value.tail.init
-      case '<' => value.tail.init
+      case '"' => value.substring(1, value.length - 1)
+      case '<' => value.substring(1, value.length - 1)
       case _ => value
     }
   }
 
   def processAnnotationProperty(annotProperty: OWLAnnotationProperty, ontology: OWLOntology): List[Triple] = {
 
-    val annotations = EntitySearcher.getAnnotations(annotProperty, ontology).asScala.toList
     val property = annotProperty.toStringID.toString
 
     property match {
       case m if true || (lexicalAnnotationURIs contains m) => {
-        val axioms = ontology.getAnnotationAssertionAxioms(annotProperty.getIRI).asScala.toList
-        val axx = axioms.map(annotationAxiom2Edge).flatten
-        axx
+        annotationEdgesOf(annotProperty.getIRI, ontology)
       }
 
       case _ => {
@@ -13,7 +13,9 @@ import java.io.File
 import collection.JavaConverters._
 import org.mowl.Types._
 
-class TaxonomyProjector(var bidirectional_taxonomy: Boolean = false) extends AbstractProjector{
+class TaxonomyProjector(var bidirectional_taxonomy: Boolean = false, override val workers: Int = 1) extends AbstractProjector{
+
+  def this(bidirectional_taxonomy: Boolean) = this(bidirectional_taxonomy, 1)
 
   def projectAxiom(go_class: OWLClass, axiom: OWLClassAxiom): List[Triple] = {
     val axiomType = axiom.getAxiomType().getName()
@@ -49,7 +51,7 @@ class TaxonomyProjector(var bidirectional_taxonomy: Boolean = false) extends Abs
    val ontClasses = ontology.getClassesInSignature(imports).asScala.toList
    printf("INFO: Number of ontology classes: %d\n", ontClasses.length)
    getTransitiveClosure(ontClasses, ontology)
-   val edges = ontClasses.foldLeft(List[Triple]()){(acc, x) => acc ::: processOntClass(x, ontology)}
+   val edges = projectInParallel(ontClasses)(processOntClass(_, ontology))
    edges.asJava
   }
 
@@ -12,15 +12,34 @@ import java.util.{HashMap, ArrayList}
 
 import collection.JavaConverters._
 import org.mowl.Types._
+import org.mowl.Provenance
 
 class TaxonomyWithRelsProjector(
   var taxonomy: Boolean = false,
   var bidirectional_taxonomy: Boolean=false,
-  var relations: ArrayList[String]) extends AbstractProjector{
+  var relations: ArrayList[String],
+  override val workers: Int) extends AxiomProjector{
 
-  val relationsSc = relations.asScala
+  def this(taxonomy: Boolean, bidirectional_taxonomy: Boolean, relations: ArrayList[String]) =
+    this(taxonomy, bidirectional_taxonomy, relations, 1)
+
+  val relationsSc = relations.asScala.toSet
   if (!taxonomy) bidirectional_taxonomy = false
 
+  def projectSingleAxiom(axiom: OWLAxiom): List[Triple] = axiom match {
+    case ax: OWLSubClassOfAxiom if !ax.getSubClass.isAnonymous => projectAxiom(ax.getSubClass.asOWLClass, ax)
+    case _ => Nil
+  }
+
+  def projectWithProvenance(ontology: OWLOntology) = {
+    val builder = newBuilder()
+    for (
+      ontClass <- ontology.getClassesInSignature(imports).asScala;
+      axiom <- ontology.getAxioms(ontClass, imports).asScala
+    ) builder.add(projectAxiom(ontClass, axiom), Provenance.axiomId(axiom))
+    builder.result()
+  }
+
   def projectAxiom(ontClass: OWLClass, axiom: OWLClassAxiom): List[Triple] = {
     val axiomType = axiom.getAxiomType().getName()
     axiomType match {
@@ -0,0 +1,29 @@
+package org.mowl
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+
+// Java imports
+import collection.JavaConverters._
+
+
+/** Stable 64-bit identifiers of axioms, used to record which axiom produced
+  * each projected edge. The identifier is the FNV-1a hash of the string form
+  * of the axiom, so it is the same across processes and OWL API managers.
+  */
+object Provenance {
+
+  def axiomId(axiom: OWLAxiom): Long = {
+    val text = axiom.toString
+    var hash = 0xcbf29ce484222325L
+    var i = 0
+    while (i < text.length) {
+      hash = (hash ^ text.charAt(i)) * 0x100000001b3L
+      i += 1
+    }
+    hash
+  }
+
+  def axiomIds(axioms: java.util.Collection[_ <: OWLAxiom]): Array[Long] =
+    axioms.asScala.map(axiomId).toArray
+}
@@ -0,0 +1,84 @@
+package org.mowl
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.model.parameters.Imports
+
+// Java imports
+import java.nio.charset.StandardCharsets
+import collection.JavaConverters._
+
+
+/** Strings packed in a single UTF-8 buffer. The bytes of string i are
+  * data(offsets(i)) until data(offsets(i + 1)), so offsets has size + 1 elements.
+  */
+class PackedStrings(val data: Array[Byte], val offsets: Array[Int]) {
+  def size: Int = offsets.length - 1
+
+  /** Decodes the strings. */
+  def toArray: Array[String] = Array.tabulate(size) { i =>
+    new String(data, offsets(i), offsets(i + 1) - offsets(i), StandardCharsets.UTF_8)
+  }
+}
+
+object PackedStrings {
+
+  /** Reads strings packed by Python: data holds the UTF-8 bytes and offsets
+    * the int32 offsets in native byte order, as NumPy writes them.
+    */
+  def fromBuffers(data: java.nio.ByteBuffer, offsets: java.nio.ByteBuffer): PackedStrings = {
+    val bytes = new Array[Byte](data.remaining)
+    data.duplicate().get(bytes)
+    new PackedStrings(bytes, EncodedEdges.intArray(offsets))
+  }
+
+  /** Packs the strings in the given order. */
+  def apply(names: Array[String]): PackedStrings = {
+    val encoded = names.map(_.getBytes(StandardCharsets.UTF_8))
+    val offsets = new Array[Int](encoded.length + 1)
+    var i = 0
+    while (i < encoded.length) {
+      offsets(i + 1) = offsets(i) + encoded(i).length
+      i += 1
+    }
+
+    val data = new Array[Byte](offsets(encoded.length))
+    i = 0
+    while (i < encoded.length) {
+      System.arraycopy(encoded(i), 0, data, offsets(i), encoded(i).length)
+      i += 1
+    }
+    new PackedStrings(data, offsets)
+  }
+}
+
+
+/** Bulk export of ontology signatures. Each method returns the IRIs of all
+  * the ontologies in a single PackedStrings object, sorted and without
+  * duplicates, so that the Python side crosses the bridge once instead of
+  * once per entity.
+  */
+object Signature {
+
+  def classIRIs(ontologies: Array[OWLOntology]): PackedStrings = {
+    val names = new java.util.HashSet[String]()
+    for (ontology <- ontologies; owlClass <- ontology.getClassesInSignature(Imports.EXCLUDED).asScala) {
+      names.add(owlClass.toStringID)
+    }
+    pack(names)
+  }
+
+  def objectPropertyIRIs(ontologies: Array[OWLOntology]): PackedStrings = {
+    val names = new java.util.HashSet[String]()
+    for (ontology <- ontologies; property <- ontology.getObjectPropertiesInSignature(Imports.EXCLUDED).asScala) {
+      names.add(property.toStringID)
+    }
+    pack(names)
+  }
+
+  def pack(names: java.util.Collection[String]): PackedStrings = {
+    val sorted = names.toArray(new Array[String](names.size))
+    java.util.Arrays.sort(sorted.asInstanceOf[Array[Object]])
+    PackedStrings(sorted)
+  }
+}
@@ -0,0 +1,184 @@
+package org.mowl.Walking
+
+import collection.JavaConverters._
+import org.mowl.{Edge, EncodedEdges}
+
+
+/** Directed multigraph in compressed sparse row layout. The edges leaving
+  * node i are at positions offsets(i) until offsets(i + 1) of neighbors,
+  * relations and weights. Nodes and relations share the ids of names, so a
+  * walk is an array of ids that can be written with names(id).
+  */
+class Graph(
+  val names: Array[String],
+  val offsets: Array[Int],
+  val neighbors: Array[Int],
+  val relations: Array[Int],
+  val weights: Array[Float],
+  val sortedNeighbors: Boolean
+) {
+
+  def numNodes: Int = offsets.length - 1
+
+  def numEdges: Int = neighbors.length
+
+  def degree(node: Int): Int = offsets(node + 1) - offsets(node)
+
+  lazy val maxDegree: Int = (0 until numNodes).foldLeft(0)((max, node) => math.max(max, degree(node)))
+
+  /** Ids that are the source or the destination of an edge, in increasing
+    * order.
+    */
+  lazy val nodes: Array[Int] = {
+    val isNode = new Array[Boolean](numNodes)
+    var node = 0
+    while (node < numNodes) {
+      if (degree(node) > 0) isNode(node) = true
+      node += 1
+    }
+    var e = 0
+    while (e < numEdges) {
+      isNode(neighbors(e)) = true
+      e += 1
+    }
+    (0 until numNodes).filter(isNode).toArray
+  }
+
+  /** Whether there is an edge from src to dst. Rows are searched with binary
+    * search when neighbors are sorted.
+    */
+  def hasEdge(src: Int, dst: Int): Boolean = {
+    if (sortedNeighbors) {
+      java.util.Arrays.binarySearch(neighbors, offsets(src), offsets(src + 1), dst) >= 0
+    } else {
+      var e = offsets(src)
+      while (e < offsets(src + 1) && neighbors(e) != dst) e += 1
+      e < offsets(src + 1)
+    }
+  }
+
+  /** Bytes used by the arrays of the graph, not counting the names. */
+  def arrayBytes: Long = 4L * (offsets.length + 3L * numEdges)
+}
+
+object Graph {
+
+  /** Builds the graph of a list of edges. Names get ids in the order they
+    * first appear in the edges, followed by extraNames. With sortNeighbors,
+    * the edges of each row are sorted by destination, keeping the order of
+    * the list for equal destinations.
+    */
+  def fromEdges(edges: java.util.List[Edge], extraNames: Seq[String], sortNeighbors: Boolean): Graph = {
+    val ids = new java.util.HashMap[String, Integer]()
+    val names = new java.util.ArrayList[String]()
+    def id(name: String): Int = {
+      val existing = ids.get(name)
+      if (existing != null) existing.intValue
+      else {
+        ids.put(name, names.size)
+        names.add(name)
+        names.size - 1
+      }
+    }
+
+    val numEdges = edges.size
+    val src = new Array[Int](numEdges)
+    val rel = new Array[Int](numEdges)
+    val dst = new Array[Int](numEdges)
+    val weight = new Array[Float](numEdges)
+    var i = 0
+    for (edge <- edges.asScala) {
+      src(i) = id(edge.src)
+      rel(i) = id(edge.rel)
+      dst(i) = id(edge.dst)
+      weight(i) = edge.weight
+      i += 1
+    }
+    extraNames.foreach(id)
+
+    fromArrays(names.asScala.toArray, src, rel, dst, weight, sortNeighbors)
+  }
+
+  /** Builds the graph of encoded edges without hashing a name per edge.
+    * Entities keep their ids and are followed by the relations and
+    * extraNames that are not entities, so that names are shared as in
+    * fromEdges. Edges without weights have weight 1.
+    */
+  def fromEncoded(edges: EncodedEdges, extraNames: Seq[String], sortNeighbors: Boolean): Graph = {
+    val entities = edges.entities.toArray
+    val others = new java.util.LinkedHashMap[String, Integer]()
+    for (name <- edges.relations.toArray ++ extraNames) others.put(if (name == null) "" else name, -1)
+
+    var id = 0
+    while (id < entities.length) {
+      if (others.containsKey(entities(id))) others.put(entities(id), id)
+      id += 1
+    }
+    val names = new scala.collection.mutable.ArrayBuffer[String](entities.length + others.size)
+    names ++= entities
+    for (entry <- others.entrySet.asScala if entry.getValue < 0) {
+      entry.setValue(names.length)
+      names += entry.getKey
+    }
+
+    val relationIds = edges.relations.toArray.map(name => others.get(if (name == null) "" else name).intValue)
+    val rel = edges.rel.map(relationIds)
+    val weight = if (edges.weight != null) edges.weight else Array.fill(edges.size)(1f)
+    fromArrays(names.toArray, edges.src, rel, edges.dst, weight, sortNeighbors)
+  }
+
+  /** Builds the graph from edge columns with counting sort, in time linear in
+    * the number of edges and names.
+    */
+  def fromArrays(names: Array[String], src: Array[Int], rel: Array[Int], dst: Array[Int],
+    weight: Array[Float], sortNeighbors: Boolean): Graph = {
+
+    val numNodes = names.length
+    // Sorting by destination first makes the stable sort by source leave
+    // each row sorted by destination.
+    val order = if (sortNeighbors) countingSort(dst, identity(src.length), numNodes) else identity(src.length)
+    val sorted = countingSort(src, order, numNodes)
+
+    val offsets = new Array[Int](numNodes + 1)
+    for (s <- src) offsets(s + 1) += 1
+    var node = 0
+    while (node < numNodes) {
+      offsets(node + 1) += offsets(node)
+      node += 1
+    }
+
+    val numEdges = src.length
+    val neighbors = new Array[Int](numEdges)
+    val relations = new Array[Int](numEdges)
+    val weights = new Array[Float](numEdges)
+    var e = 0
+    while (e < numEdges) {
+      val edge = sorted(e)
+      neighbors(e) = dst(edge)
+      relations(e) = rel(edge)
+      weights(e) = weight(edge)
+      e += 1
+    }
+    new Graph(names, offsets, neighbors, relations, weights, sortNeighbors)
+  }
+
+  private def identity(size: Int): Array[Int] = Array.tabulate(size)(i => i)
+
+  /** Stable sort of the positions in order by their key. */
+  private def countingSort(keys: Array[Int], order: Array[Int], numKeys: Int): Array[Int] = {
+    val start = new Array[Int](numKeys + 1)
+    for (key <- keys) start(key + 1) += 1
+    var k = 0
+    while (k < numKeys) {
+      start(k + 1) += start(k)
+      k += 1
+    }
+    val sorted = new Array[Int](order.length)
+    for (position <- order) {
+      val key = keys(position)
+      sorted(start(key)) = position
+      start(key) += 1
+    }
+    sorted
+  }
+}
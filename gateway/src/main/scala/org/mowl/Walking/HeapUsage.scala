@@ -0,0 +1,18 @@
+package org.mowl.Walking
+
+import java.lang.management.{ManagementFactory, MemoryType}
+import collection.JavaConverters._
+
+
+/** Peak usage of the heap memory pools of the JVM, which the walkers report
+  * as instrumentation. The peak is shared by the whole JVM.
+  */
+object HeapUsage {
+
+  def heapPools = ManagementFactory.getMemoryPoolMXBeans.asScala.filter(_.getType == MemoryType.HEAP)
+
+  def resetPeak(): Unit = heapPools.foreach(_.resetPeakUsage())
+
+  /** Bytes of the peak usage since the last reset. */
+  def peak: Long = heapPools.map(_.getPeakUsage.getUsed).sum
+}
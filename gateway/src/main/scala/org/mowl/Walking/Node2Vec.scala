@@ -1,384 +1,444 @@
 package org.mowl.Walking
 
-import collection.JavaConverters._
-import java.io._
 import java.util.{ArrayList}
-import scala.collection.mutable.{MutableList, ListBuffer, Stack, Map, HashMap, ArrayBuffer}
-import scala.collection.immutable.HashSet
-import util.control.Breaks._
 import java.util.concurrent.{ExecutorService, Executors}
-import scala.concurrent.ExecutionContext.Implicits.global
 import scala.concurrent.duration.Duration
 import scala.concurrent.{ Await, Future }
 import scala.concurrent.{ExecutionContext, ExecutionContextExecutorService}
-import scala.util.{Failure, Success, Try}
-import org.mowl.Edge
+import scala.util.{Failure, Success}
+import org.mowl.{Edge, EncodedEdges}
 
+/** Walker of the edges, which are only read to build the graph. Edges can be
+  * encoded by Python as integer columns, so that names are not hashed once
+  * per edge, or passed as a list of Edge objects.
+  */
 class Node2Vec (
-  var edges: ArrayList[Edge],
+  edges: EncodedEdges,
   var numWalks: Int,
   var walkLength: Int,
   var p: Float,
   var q: Float,
   var workers: Int,
   var outfile: String,
-  var nodesOfInterest: ArrayList[String]
-) {
-
-
-  val edgesSc = edges.asScala.map(x => (x.src, x.rel, x.dst, x.weight))
-  val entities = edgesSc.map(x => List(x._1, x._2, x._3)).flatten.toSet
-  val entsSrc = edgesSc.map(_._1).toSet
-  val mapEntsIdx = entities.zip(Range(0, entities.size, 1)).toMap
-  val mapIdxEnts = Range(0, entities.size, 1).zip(entities).toMap
-  val entsIdx = entities.map(mapEntsIdx(_))
-  val entsSrcIdx = entsSrc.map(mapEntsIdx(_))
-  val nodes = edgesSc.map(x => List(x._1, x._3)).flatten.toSet
-  val nodesIdx = nodes.map(mapEntsIdx(_))
-  val (graph, weights) = processEdges()
-
-
-  val rand = scala.util.Random
+  var nodesOfInterest: ArrayList[String],
+  var sampler: String,
+  var concatenate: Boolean,
+  var walksFormat: String,
+  var seed: java.lang.Long,
+  var startNodes: ArrayList[String]
+) extends Walker {
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], sampler: String, concatenate: Boolean, walksFormat: String,
+    seed: java.lang.Long, startNodes: ArrayList[String]) =
+    this(EncodedEdges.fromEdges(edges), numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, sampler, concatenate, walksFormat, seed, startNodes)
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], sampler: String, concatenate: Boolean, walksFormat: String,
+    seed: java.lang.Long) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, sampler, concatenate, walksFormat, seed, new ArrayList[String]())
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], sampler: String, concatenate: Boolean, walksFormat: String) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, sampler, concatenate, walksFormat, null)
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], sampler: String, concatenate: Boolean) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, sampler, concatenate, "text")
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String], sampler: String) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, sampler, true)
+
+  def this(edges: ArrayList[Edge], numWalks: Int, walkLength: Int, p: Float, q: Float, workers: Int,
+    outfile: String, nodesOfInterest: ArrayList[String]) =
+    this(edges, numWalks, walkLength, p, q, workers, outfile, nodesOfInterest, "alias")
+
+  require(sampler == "alias" || sampler == "rejection", s"Unknown sampler $sampler")
+  require(ShardedWalkOutput.formats.contains(walksFormat), s"Unknown walks format $walksFormat")
+
+  // With p = q = 1 the second-order transition probabilities are the
+  // first-order ones, so no edge needs its own table.
+  val firstOrder = p == 1 && q == 1
+  val rejection = sampler == "rejection"
+  val useEdgeTables = !firstOrder && !rejection
+
+  // Rows sorted by destination give the order of the alias tables and allow
+  // binary search of reverse edges.
+  val graph = Graph.fromEncoded(edges, Nil, sortNeighbors = true)
 
   val (pathsPerWorker, newWorkers) = numPathsPerWorker()
 
-  var aliasNodes = Map[Int, (Array[Int], Array[Float])]()
-  var aliasEdges = Map[(Int, Int), (Array[Int], Array[Float])]()
-
-  val nodesOfInterestIdx =  HashSet() ++ nodesOfInterest.asScala.map(mapEntsIdx(_)).toSet
-
-  private[this] val lock = new Object()
-
-  val walksFile = new File(outfile)
-  val bw = new BufferedWriter(new FileWriter(walksFile))
+  // Alias tables of the first step from each node are stored in the
+  // positions of its row in the graph. Alias tables of the step after each
+  // edge are stored one after another in edgeJ and edgeQ: the table of edge e
+  // starts at edgeStart(e) and has one entry per neighbor of its destination.
+  // Edges whose destination has no neighbors, or that walks do not follow
+  // before their last step, have edgeStart -1, and parallel edges share their
+  // table. Edge tables are only built by the alias sampler. Workers fill
+  // disjoint ranges of these arrays, so the arrays need no lock.
+  private var nodeJ: Array[Int] = null
+  private var nodeQ: Array[Float] = null
+  private var edgeStart: Array[Int] = null
+  private var edgeJ: Array[Int] = null
+  private var edgeQ: Array[Float] = null
+
+  // Largest factor of the rejection sampler: 1 / p for returning to the
+  // previous node, 1 for its neighbors and 1 / q for other nodes.
+  val maxFactor = List(1 / p, 1f, 1 / q).max
+
+
+  /** Hops from the closest start node to each node, up to walkLength - 2,
+    * or null when walks start from every node. Other nodes are -1. Walks only
+    * take steps from nodes at most walkLength - 2 hops away, so the edges
+    * leaving the other nodes need no alias tables.
+    */
+  lazy val hops: Array[Int] = {
+    if (startNodes == null || startNodes.isEmpty) null
+    else {
+      val hops = Array.fill(graph.numNodes)(-1)
+      var frontier = nodesIdx
+      frontier.foreach(hops(_) = 0)
+      var depth = 0
+      while (frontier.nonEmpty && depth < walkLength - 2) {
+        depth += 1
+        val next = new scala.collection.mutable.ArrayBuilder.ofInt
+        for (node <- frontier) {
+          var edge = graph.offsets(node)
+          while (edge < graph.offsets(node + 1)) {
+            val dst = graph.neighbors(edge)
+            if (hops(dst) == -1) {
+              hops(dst) = depth
+              next += dst
+            }
+            edge += 1
+          }
+        }
+        frontier = next.result()
+      }
+      hops
+    }
+  }
 
+  /** Whether walks may draw the step from node with its node table: the
+    * first step of a walk, or any step without edge tables.
+    */
+  def needsNodeTable(node: Int): Boolean =
+    hops == null || hops(node) == 0 || (!useEdgeTables && hops(node) >= 0 && hops(node) <= walkLength - 2)
 
-  def processEdges() = {
-    val graph: Map[Int, ArrayBuffer[(Int, Int)]] = Map()
-    val weights: HashMap[(Int, Int), Float] = HashMap()
-    for ((src, rel, dst, weight) <- edgesSc){
-      val srcIdx = mapEntsIdx(src)
-      val relIdx = mapEntsIdx(rel)
-      val dstIdx = mapEntsIdx(dst)
+  /** Whether walks may take a step after an edge leaving src that is not
+    * the last step.
+    */
+  def needsEdgeTables(src: Int): Boolean =
+    hops == null || (hops(src) >= 0 && hops(src) <= walkLength - 3)
 
-      if (!graph.contains(srcIdx)){
-        graph(srcIdx) = ArrayBuffer((relIdx, dstIdx))
-      }else{
-        graph(srcIdx) += ((relIdx, dstIdx))
-      }
+  /** Nodes and edges with alias tables after preprocessing. */
+  @volatile var preprocessedNodes = 0L
+  @volatile var preprocessedEdges = 0L
 
-      weights((srcIdx, dstIdx)) = weight
-    }
-    (graph.mapValues(_.sortBy(_._2).toArray), weights)
-  }
+  /** Statistics of preprocessing, or null before the first run: the number
+    * of nodes and edges with alias tables, the milliseconds it took, the
+    * bytes of the alias tables and the peak heap while they were built. The
+    * peak heap is measured by resetting the peak usage of the heap memory
+    * pools.
+    */
+  @volatile var preprocessingStats: java.util.Map[String, java.lang.Long] = null
 
-  def walk() = {
+  // Alias tables are built by the first run and reused by later ones.
+  @volatile private var preprocessed = false
+  private[this] val preprocessLock = new Object()
 
-    //preprocessTransitionProbs
-    val argsList = for (
-      i <- Range(0, newWorkers, 1)
-    ) yield (i, pathsPerWorker(i), walkLength, p, q)
+  def run(output: WalkOutput) = {
 
     print("Starting pool...")
 
     val executor: ExecutorService = Executors.newFixedThreadPool(workers)
     implicit val executionContext: ExecutionContextExecutorService = ExecutionContext.fromExecutorService(executor)
 
-    println(s"+ started preprocessing probabilities...")
-    val start = System.nanoTime() / 1000000
-
-    var listsN: ListBuffer[ListBuffer[Int]] = ListBuffer.fill(newWorkers)(ListBuffer())
-    for (i <- entsSrcIdx){
-      listsN(i%newWorkers) += i
+    try {
+      preprocess()
+      writeWalks(output)
+    } finally {
+      executionContext.shutdown()
     }
-    val argsListN = Range(0, newWorkers, 1).zip(listsN.toList.map(_.toList))
-    val futNodes = Future.traverse(argsListN)(threadNodes)
-
-    Await.ready(futNodes, Duration.Inf)
+  }
 
-    futNodes.onComplete {
-      case Success(msg) => println("* processing probabilities for nodes is over")
-      case Failure(t) => println("An error has ocurred in preprocessing probabilities for nodes: " + t.getMessage + " - " + t.printStackTrace)
-    }
+  def preprocess()(implicit ec: ExecutionContext): Unit = preprocessLock.synchronized {
+    if (!preprocessed) {
+      println(s"+ started preprocessing probabilities...")
+      HeapUsage.resetPeak()
+      val start = System.nanoTime()
+      // Lazy values are initialized under the lock of the walker, so they
+      // are computed before the workers read them.
+      hops
+
+      nodeJ = new Array[Int](graph.numEdges)
+      nodeQ = new Array[Float](graph.numEdges)
+      var bytes = 8L * graph.numEdges
+      if (useEdgeTables) {
+        val (starts, size) = edgeTableStarts()
+        edgeStart = starts
+        edgeJ = new Array[Int](size)
+        edgeQ = new Array[Float](size)
+        bytes += 4L * graph.numEdges + 8L * size
+      }
 
-    var listsE: ListBuffer[ListBuffer[(Int, Int)]] = ListBuffer.fill(newWorkers)(ListBuffer())
-    val numEdges = weights.keySet.size
-    for ((i, edge) <- Range(0, numEdges, 1).zip(weights.keySet.toList)){
-      listsE(i%newWorkers) += edge
-    }
-    val argsListE = Range(0, newWorkers, 1).zip(listsE.toList.map(_.toList))
-    val futEdges = Future.traverse(argsListE)(threadEdges)
+      val chunkSize = (graph.numNodes + newWorkers - 1) / newWorkers
+      val ranges = Range(0, graph.numNodes, math.max(chunkSize, 1)).map(from => (from, math.min(from + chunkSize, graph.numNodes)))
+
+      val futNodes = Future.traverse(ranges)(threadNodes)
+      Await.ready(futNodes, Duration.Inf)
+      futNodes.value.get match {
+        case Success(counts) =>
+          preprocessedNodes = counts.sum
+          println("* processing probabilities for nodes is over")
+        case Failure(t) =>
+          println("An error has ocurred in preprocessing probabilities for nodes: " + t.getMessage + " - " + t.printStackTrace)
+          throw t
+      }
 
-    Await.ready(futEdges, Duration.Inf)
+      if (useEdgeTables) {
+        val futEdges = Future.traverse(ranges)(threadEdges)
+        Await.ready(futEdges, Duration.Inf)
+        futEdges.value.get match {
+          case Success(counts) =>
+            preprocessedEdges = counts.sum
+            println("* processing probabilities for edges is over")
+          case Failure(t) =>
+            println("An error has ocurred in preprocessing probabilities for edges: " + t.getMessage + " - " + t.printStackTrace)
+            throw t
+        }
+      }
 
-    futEdges.onComplete {
-      case Success(msg) => println("* processing probabilities for edges is over")
-      case Failure(t) => println("An error has ocurred in preprocessing probabilities for edges: " + t.getMessage + " - " + t.printStackTrace)
+      val milliseconds = (System.nanoTime() - start) / 1000000
+      val stats = new java.util.LinkedHashMap[String, java.lang.Long]()
+      stats.put("nodes", preprocessedNodes)
+      stats.put("edges", preprocessedEdges)
+      stats.put("milliseconds", milliseconds)
+      stats.put("bytes", bytes)
+      stats.put("peak_heap_bytes", HeapUsage.peak)
+      preprocessingStats = stats
+      println(s"- finished preprocessing probabilities of $preprocessedNodes nodes and $preprocessedEdges edges after ${milliseconds / 1000} seconds")
+      preprocessed = true
     }
+  }
 
-
-    val end = System.nanoTime() / 1000000
-    val duration = (end - start) / 1000
-    println(s"- finished preprocessing probabilities after $duration seconds")
-
-
-    val futWalks = Future.traverse(argsList)(writeWalksToDisk)
-
-    Await.ready(futWalks, Duration.Inf)
-
-    futWalks.onComplete {
-      case Success(msg) => {
-        println("* Walking is done, shutting down the executor")
-        executionContext.shutdown()
-        bw.close
-      }
-      case Failure(t) =>
-        {
-          println("An error has ocurred in preprocessing generating random walks: " + t.getMessage + " - " + t.printStackTrace)
-          executionContext.shutdown()
-          bw.close
+  /** Start of the alias table of each edge in edgeJ and edgeQ and their
+    * total size, as a prefix sum of the degrees of the destinations.
+    */
+  def edgeTableStarts(): (Array[Int], Int) = {
+    val starts = Array.fill(graph.numEdges)(-1)
+    var size = 0L
+    for (src <- 0 until graph.numNodes if needsEdgeTables(src)) {
+      var edge = graph.offsets(src)
+      while (edge < graph.offsets(src + 1)) {
+        val dst = graph.neighbors(edge)
+        if (edge > graph.offsets(src) && graph.neighbors(edge - 1) == dst) {
+          starts(edge) = starts(edge - 1)
+        } else if (graph.degree(dst) > 0) {
+          require(size + graph.degree(dst) <= Int.MaxValue - 8,
+            "The alias tables of the edges do not fit in an array. Use the rejection sampler or start nodes instead")
+          starts(edge) = size.toInt
+          size += graph.degree(dst)
         }
+        edge += 1
+      }
     }
+    (starts, size.toInt)
   }
 
 
-  def writeWalksToDisk(params: (Int, Int, Int, Float, Float))(implicit ec: ExecutionContext): Future[Unit] = Future {
+  def randomWalk(start: Int, walk: Array[Int], rand: java.util.Random): Int = {
 
-    val (index, numWalks, walkLength, p, q) = params
+    walk(0) = start
 
-    println(s"+ started processing thread $index")
-    val start = System.nanoTime() / 1000000
+    var i = 1
+    var lastEdge = -1
+    var done = false
+    while (i < 2*walkLength-1 && !done){
 
-    for (i <- 0 until numWalks){
-      val nodesR = rand.shuffle(nodesIdx)
-      for (n <- nodesR){
-        randomWalk(walkLength, p, q, n)
-      }
-    }
-     
-    val end = System.nanoTime() / 1000000
-    val duration = (end - start)
-    println(s"- finished processing thread $index after $duration")
-  }
+      val curNode = walk(i-1)
 
-  def randomWalk(walkLength: Int, p: Float, q: Float, start: Int ) = {
+      if (graph.degree(curNode) > 0) {
 
-    val walk = Array.fill(2*walkLength-1){-1}
+        val k = if (lastEdge == -1 || firstOrder) aliasDraw(nodeJ, nodeQ, graph.offsets(curNode), graph.degree(curNode), rand)
+                else if (rejection) rejectionDraw(walk(i-3), curNode, rand)
+                else aliasDraw(edgeJ, edgeQ, edgeStart(lastEdge), graph.degree(curNode), rand)
+        val edge = graph.offsets(curNode) + k
 
-    walk(0) = start
-    breakable {
-
-      var i = 1
-      while (i < 2*walkLength-1){
-        
-        val curNode = walk(i-1)
-        val curNbrs = graph.contains(curNode) match {
-          case true => graph(curNode)
-          case false => Array[Tuple2[Int, Int]]()
-        }
+        walk(i) = graph.relations(edge)
+        walk(i+1) = graph.neighbors(edge)
+        lastEdge = edge
+        i = i+2
 
-        if (curNbrs.size > 0) {
-
-          if (walk(1) == -1){
-            val (idx1, idx2) = aliasNodes(curNode)
-            val (rel, next) = curNbrs(aliasDraw(idx1, idx2))
-            walk(i) = rel
-            walk(i+1) = next
-          }else {
-            val prevNode = walk(i-3)
-            val (idx1, idx2) = aliasEdges((prevNode, curNode))
-            val (rel, next) = curNbrs(aliasDraw(idx1, idx2))
-         
-            walk(i) = rel
-            walk(i+1) = next
-          }
-          i = i+2
-          
-        }else{
-          break
-        }
+      }else{
+        done = true
       }
     }
 
-    val toWrite = walk.filter(_ != -1).map(x => mapIdxEnts(x)).mkString(" ") + "\n"
+    i
+  }
 
-    if (nodesOfInterest.size > 0){
-      val walkSet = HashSet() ++ walk.toSet
-      val intersection = walkSet & nodesOfInterestIdx
 
-      if (intersection.size > 0){
-        
-        lock.synchronized {
-          bw.write(toWrite)
-        }
-      }
-    }else{
-      lock.synchronized {
-        bw.write(toWrite)
+  /** Writes the alias table of the step after the edge from src to dst at
+    * position base of edgeJ and edgeQ.
+    */
+  def setAliasEdge(src: Int, dst: Int, base: Int, builder: AliasBuilder): Unit = {
+    val from = graph.offsets(dst)
+    val lenDstNbrs = graph.degree(dst)
+    val unnormalizedProbs = builder.probs
+
+    for (i <- 0 until lenDstNbrs)  {
+      val dstNbr = graph.neighbors(from + i)
+      val prob = graph.weights(from + i)
+
+      if (dstNbr == src){
+        unnormalizedProbs(i) = prob/p
+      }else if (graph.hasEdge(dstNbr, src)){
+        unnormalizedProbs(i) = prob
+      }else{
+        unnormalizedProbs(i) = prob/q
       }
     }
 
+    builder.build(lenDstNbrs, edgeJ, edgeQ, base)
   }
 
 
-  def getAliasEdge(src: Int, dst: Int) = {
-    if (graph.contains(dst)){
-      val dstNbrs = graph(dst).map(_._2)
-      val lenDstNbrs = dstNbrs.length
-      val unnormalizedProbs: Array[Float] = Array.fill(lenDstNbrs){-1}
+  /** Builds the node tables of the range and returns their number. */
+  def threadNodes(range: (Int, Int))(implicit ec: ExecutionContext): Future[Long] = Future {
+    val (from, until) = range
+    val builder = new AliasBuilder(graph.maxDegree)
+    var count = 0L
 
-      for (i <- 0 until lenDstNbrs)  {
-        val dstNbr = dstNbrs(i)
-        val prob = weights((dst, dstNbr))
+    for (node <- from until until if graph.degree(node) > 0 && needsNodeTable(node)){
+      val base = graph.offsets(node)
+      System.arraycopy(graph.weights, base, builder.probs, 0, graph.degree(node))
+      builder.build(graph.degree(node), nodeJ, nodeQ, base)
+      count += 1
+    }
+    count
+  }
 
-        if (dstNbr == src){
-          unnormalizedProbs(i) = prob/p
-        }else if( weights.contains((dstNbr, src))){
-          unnormalizedProbs(i) = prob
-        }else{
-          unnormalizedProbs(i) = prob/q
+  /** Builds the edge tables of the edges leaving the range and returns the
+    * number of edges with a table.
+    */
+  def threadEdges(range: (Int, Int))(implicit ec: ExecutionContext): Future[Long] = Future {
+    val (from, until) = range
+    val builder = new AliasBuilder(graph.maxDegree)
+    var count = 0L
+
+    for (src <- from until until if needsEdgeTables(src)){
+      var edge = graph.offsets(src)
+      while (edge < graph.offsets(src + 1)){
+        if (edgeStart(edge) >= 0) {
+          val dst = graph.neighbors(edge)
+          if (edge == graph.offsets(src) || graph.neighbors(edge - 1) != dst) {
+            setAliasEdge(src, dst, edgeStart(edge), builder)
+          }
+          count += 1
         }
+        edge += 1
       }
-
-      val normConst = unnormalizedProbs.sum
-      val normalizedProbs = unnormalizedProbs.map(x => x/normConst)
-
-      aliasSetup(normalizedProbs.toArray)
-
-    }else{
-      (Array[Int](), Array[Float]())
     }
-
+    count
   }
 
+  /** Draws the position in the row of curNode of the step after prevNode
+    * without edge tables. Candidates are drawn from the first-order
+    * distribution of curNode and accepted with probability proportional to
+    * their second-order factor, as in KnightKing.
+    */
+  def rejectionDraw(prevNode: Int, curNode: Int, rand: java.util.Random): Int = {
+    val from = graph.offsets(curNode)
+    var k = -1
+    var accepted = false
+    while (!accepted) {
+      k = aliasDraw(nodeJ, nodeQ, from, graph.degree(curNode), rand)
+      val next = graph.neighbors(from + k)
+      val factor =
+        if (next == prevNode) 1 / p
+        else if (graph.hasEdge(next, prevNode)) 1f
+        else 1 / q
+      accepted = rand.nextFloat * maxFactor < factor
+    }
+    k
+  }
 
+  /** Draws an outcome of the alias table of K outcomes at position base of
+    * J and q.
+    */
+  def aliasDraw(J: Array[Int], q: Array[Float], base: Int, K: Int, rand: java.util.Random): Int  = {
 
-  def threadNodes(params: (Int, List[Int]))(implicit ec: ExecutionContext): Future[Unit] = Future {
-    val (idx, indices) = params
-    val l = indices.length
-    //println(s"Thread $idx, nodes to process $l")
-
-    for (i <- indices){
-      val node = i
-      val unnormalizedProbs = graph(node).map(nbr => weights((node, nbr._2)))
-      val normConst = unnormalizedProbs.sum
-      val normalizedProbs = unnormalizedProbs.map(x => x/normConst)
+    val kk = rand.nextInt(K)
 
-      val alias = aliasSetup(normalizedProbs)
-      lock.synchronized {
-        aliasNodes += (node -> alias)
-      }
+    if (rand.nextFloat< q(base + kk)){
+      kk
+    }else{
+      J(base + kk)
     }
   }
+  /////////////////////////////////////////
+}
 
-  def threadEdges(params:  (Int, List[(Int, Int)]))(implicit ec: ExecutionContext): Future[Unit] = Future {
 
-    val (idx, edges) = params
-    val l = edges.length
-    //println(s"Thread $idx, edges to process $l")
+/** Builds alias tables of up to size outcomes into preallocated arrays, with
+  * work arrays that are reused between tables. Each worker has its own
+  * builder.
+  * https://lips.cs.princeton.edu/the-alias-method-efficient-sampling-with-many-discrete-outcomes/
+  */
+class AliasBuilder(size: Int) {
 
-    for ((src, dst) <- edges){
-      val alias = getAliasEdge(src, dst)
-      lock.synchronized {
-        aliasEdges += ((src, dst) -> alias)
-      }
-    }
-  }
+  /** Unnormalized probabilities of the next table. */
+  val probs = new Array[Float](size)
 
-  //////////////////////////////////////////
-  //https://lips.cs.princeton.edu/the-alias-method-efficient-sampling-with-many-discrete-outcomes/
+  // Stacks of outcomes with probability smaller and larger than 1 / K
+  private val smaller = new Array[Int](size)
+  private val larger = new Array[Int](size)
 
-  def aliasSetup(probs: Array[Float]) = {
+  /** Writes the alias table of the first K values of probs at position base
+    * of J and q.
+    */
+  def build(K: Int, J: Array[Int], q: Array[Float], base: Int): Unit = {
 
-    val K = probs.length
-    val q: Array[Float] = new Array[Float](K)
-    val J: Array[Int] = new Array[Int](K)
+    var normConst = 0f
+    for (kk <- 0 until K) normConst += probs(kk)
 
-    val smaller = Stack[Int]()
-    val larger = Stack[Int]()
+    var smallLen = 0
+    var largeLen = 0
 
-    for ((kk, prob) <- Range(0, K, 1).zip(probs)){
-      val qkk = K*prob
-      q(kk) = qkk
+    for (kk <- 0 until K){
+      val qkk = K*(probs(kk)/normConst)
+      q(base + kk) = qkk
+      J(base + kk) = 0
 
       if (qkk < 1){
-        smaller.push(kk)
+        smaller(smallLen) = kk
+        smallLen += 1
       }else {
-        larger.push(kk)
+        larger(largeLen) = kk
+        largeLen += 1
       }
     }
 
-    var smallLen = smaller.length
-    var largeLen = larger.length
-    var qlarge: Float  = 0
     while (smallLen > 0 && largeLen > 0){
-      val small = smaller.pop
-      val large = larger.pop
+      smallLen -= 1
+      largeLen -= 1
+      val small = smaller(smallLen)
+      val large = larger(largeLen)
 
-      J(small) = large
+      J(base + small) = large
 
-      qlarge = q(large) + q(small) - 1
-      q(large) = qlarge
+      val qlarge = q(base + large) + q(base + small) - 1
+      q(base + large) = qlarge
 
       if (qlarge < 1){
-        smaller.push(large)
-        largeLen -=1
+        smaller(smallLen) = large
+        smallLen += 1
       }else{
-        larger.push(large)
-        smallLen -= 1
+        larger(largeLen) = large
+        largeLen += 1
       }
     }
-
-    (J, q)
-
   }
-
-  def aliasDraw(J: Array[Int], q: Array[Float]): Int  = {
-
-    val K = J.length
-    val kk = rand.nextInt(K)
-    
-    if (rand.nextFloat< q(kk)){
-      kk
-    }else{
-      J(kk)
-    }
-  }
-  /////////////////////////////////////////
-
-  def numPathsPerWorker(): (List[Int], Int) = {
-
-    if (numWalks <= workers) {
-      val newWorkers = numWalks
-
-      var pathsPerWorker = for (
-        i <- Range(0, numWalks, 1)
-      ) yield 1
-
-      (pathsPerWorker.toList, newWorkers)
-    }else{
-      val newWorkers = workers
-      val remainder = numWalks % workers
-      var aux = workers - remainder
-
-      val ppw = ((numWalks+aux)/workers).floor.toInt
-      var pathsPerWorker = ListBuffer(ppw)
-
-      for (i <- 0 until (workers -1)){
-
-        pathsPerWorker += ppw
-      }
-
-      var i = 0
-      while (aux > 0){
-        pathsPerWorker(i%workers) =  pathsPerWorker(i%workers) - 1
-        i = i+1
-        aux = aux -1
-      }
-      (pathsPerWorker.toList, newWorkers)
-    }
-  }
-
 }
-
-
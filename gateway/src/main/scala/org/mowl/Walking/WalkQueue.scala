@@ -0,0 +1,103 @@
+package org.mowl.Walking
+
+import java.util.concurrent.{ArrayBlockingQueue, CancellationException, TimeUnit}
+
+
+/** Walks of a batch: walk i is made of the ids at positions offsets(i) until
+  * offsets(i + 1) of ids, for i < size.
+  */
+class WalkBatch(val ids: Array[Int], val offsets: Array[Int], val size: Int)
+
+
+/** Bounded queue of batches of walks, filled by the workers of a walker and
+  * consumed with take. Workers block while the queue is full, so at most
+  * capacity batches plus one batch per worker are held in memory.
+  */
+class WalkQueue(val names: Array[String], capacity: Int, val batchSize: Int, walkLength: Int) extends WalkOutput {
+
+  require(capacity > 0, "Queue capacity must be positive")
+  require(batchSize > 0, "Batch size must be positive")
+
+  private val queue = new ArrayBlockingQueue[WalkBatch](capacity)
+  @volatile private var cancelled = false
+  @volatile private var closed = false
+  @volatile private var error: Throwable = null
+
+  def shard(index: Int): WalkShardWriter = new QueueShardWriter()
+
+  /** Next batch of walks, waiting for the workers if needed, or null once all
+    * walks have been taken.
+    */
+  def take(): WalkBatch = {
+    val batch = queue.take()
+    if (batch eq WalkQueue.End) {
+      queue.put(WalkQueue.End)
+      null
+    } else {
+      batch
+    }
+  }
+
+  /** Message of the error that stopped the workers, or null. */
+  def errorMessage: String = if (error == null) null else s"${error.getClass.getName}: ${error.getMessage}"
+
+  /** Stops the workers and drops the walks that have not been taken. */
+  def cancel(): Unit = {
+    cancelled = true
+    queue.clear()
+  }
+
+  def isCancelled: Boolean = cancelled
+
+  override def fail(t: Throwable): Unit = if (error == null) error = t
+
+  def close(): Unit = synchronized {
+    if (!closed) {
+      closed = true
+      if (!cancelled) put(WalkQueue.End) else { queue.clear(); queue.offer(WalkQueue.End) }
+    }
+  }
+
+  private def put(batch: WalkBatch): Unit = {
+    while (!queue.offer(batch, 100, TimeUnit.MILLISECONDS)) {
+      if (cancelled) throw new CancellationException("Walk stream cancelled")
+    }
+  }
+
+  /** Collects the walks of a worker into batches of batchSize walks. */
+  class QueueShardWriter extends WalkShardWriter {
+
+    val path = ""
+
+    private val maxWalk = 2 * walkLength - 1
+    private var batchIds = new Array[Int](batchSize * maxWalk)
+    private var batchOffsets = new Array[Int](batchSize + 1)
+    private var size = 0
+
+    def write(walk: Array[Int], length: Int): Unit = {
+      if (cancelled) throw new CancellationException("Walk stream cancelled")
+      val start = batchOffsets(size)
+      System.arraycopy(walk, 0, batchIds, start, length)
+      size += 1
+      batchOffsets(size) = start + length
+      walks += 1
+      tokens += length
+      if (size == batchSize) flush()
+    }
+
+    private def flush(): Unit = {
+      if (size > 0) {
+        put(new WalkBatch(batchIds, batchOffsets, size))
+        batchIds = new Array[Int](batchSize * maxWalk)
+        batchOffsets = new Array[Int](batchSize + 1)
+        size = 0
+      }
+    }
+
+    def close(): Unit = if (!cancelled) flush()
+  }
+}
+
+object WalkQueue {
+  private val End = new WalkBatch(Array(), Array(0), 0)
+}
@@ -0,0 +1,43 @@
+package org.mowl.Walking
+
+
+/** Random number generator of one worker, with the SplitMix64 generator.
+  * The worker reseeds it with the key of each walk. Unlike java.util.Random,
+  * its state is not atomic, so it must not be shared between threads.
+  */
+class WalkRandom(seed: Long) extends java.util.Random(0L) {
+
+  private var state = seed
+
+  override protected def next(bits: Int): Int = (nextLong() >>> (64 - bits)).toInt
+
+  override def nextLong(): Long = {
+    state += WalkRandom.Gamma
+    WalkRandom.mix(state)
+  }
+
+  // Called by the constructor of java.util.Random, before state is set.
+  override def setSeed(seed: Long): Unit = state = seed
+}
+
+object WalkRandom {
+
+  private val Gamma = 0x9e3779b97f4a7c15L
+
+  def mix(value: Long): Long = {
+    var z = value
+    z = (z ^ (z >>> 30)) * 0xbf58476d1ce4e5b9L
+    z = (z ^ (z >>> 27)) * 0x94d049bb133111ebL
+    z ^ (z >>> 31)
+  }
+
+  /** Key of round walkRound of a run with seed. */
+  def roundKey(seed: Long, walkRound: Int): Long = mix(mix(seed) + walkRound * Gamma)
+
+  /** Seed of the generator of the walk of a round that starts from node. A
+    * walk depends only on the seed, its round and its start node, as the
+    * walk_keys of mowl.walking.vectorized, and not on the worker that
+    * generates it.
+    */
+  def walkKey(roundKey: Long, node: Int): Long = mix(roundKey + node * Gamma)
+}
@@ -0,0 +1,273 @@
+package org.mowl.Walking
+
+import java.io._
+import java.nio.{ByteBuffer, ByteOrder}
+import java.nio.channels.FileChannel
+import java.nio.charset.StandardCharsets
+import java.nio.file.{Files, Paths, StandardCopyOption, StandardOpenOption}
+
+
+/** Destination of the walks of a run of a walker, with one shard per worker. */
+trait WalkOutput {
+
+  def shard(index: Int): WalkShardWriter
+
+  /** Records that the run failed with error. */
+  def fail(error: Throwable): Unit = ()
+
+  /** Called once all workers have finished. */
+  def close(): Unit
+}
+
+
+/** Walks of one worker. Shards are written without synchronization. */
+trait WalkShardWriter {
+
+  def path: String
+
+  /** Walks written to the shard. */
+  var walks = 0L
+
+  /** Ids written to the shard. */
+  var tokens = 0L
+
+  def write(walk: Array[Int], length: Int): Unit
+
+  def close(): Unit
+}
+
+
+/** Text walks, one walk per line with the names of its ids separated by
+  * spaces. Walks are formatted into a private buffer.
+  */
+class TextWalkShardWriter(val path: String, names: Array[String]) extends WalkShardWriter {
+
+  private val out = new BufferedWriter(new OutputStreamWriter(new FileOutputStream(path), StandardCharsets.UTF_8), 1 << 16)
+  private val line = new java.lang.StringBuilder()
+
+  def write(walk: Array[Int], length: Int): Unit = {
+    line.setLength(0)
+    var i = 0
+    while (i < length) {
+      if (i > 0) line.append(' ')
+      line.append(names(walk(i)))
+      i += 1
+    }
+    line.append('\n')
+    out.append(line)
+    walks += 1
+    tokens += length
+  }
+
+  def close(): Unit = out.close()
+}
+
+
+/** Binary walks: the ids of all walks as little-endian int32 in path, and
+  * the int64 offsets of the walks in path.offsets. Walk i is made of the ids
+  * at positions offsets(i) until offsets(i + 1).
+  */
+class BinaryWalkShardWriter(val path: String) extends WalkShardWriter {
+
+  private val ids = new LittleEndianWriter(path)
+  private val offsets = new LittleEndianWriter(BinaryWalkShardWriter.offsetsPath(path))
+  offsets.writeLong(0)
+
+  def write(walk: Array[Int], length: Int): Unit = {
+    var i = 0
+    while (i < length) {
+      ids.writeInt(walk(i))
+      i += 1
+    }
+    walks += 1
+    tokens += length
+    offsets.writeLong(tokens)
+  }
+
+  def close(): Unit = {
+    ids.close()
+    offsets.close()
+  }
+}
+
+object BinaryWalkShardWriter {
+
+  def offsetsPath(path: String): String = s"$path.offsets"
+
+  def vocabularyPath(path: String): String = s"$path.vocab"
+}
+
+
+/** Buffered little-endian output of primitive values to a file. */
+class LittleEndianWriter(path: String) {
+
+  private val channel = FileChannel.open(Paths.get(path), StandardOpenOption.CREATE, StandardOpenOption.WRITE, StandardOpenOption.TRUNCATE_EXISTING)
+  private val buffer = ByteBuffer.allocateDirect(1 << 16).order(ByteOrder.LITTLE_ENDIAN)
+
+  def writeInt(value: Int): Unit = {
+    if (buffer.remaining < 4) flush()
+    buffer.putInt(value)
+  }
+
+  def writeLong(value: Long): Unit = {
+    if (buffer.remaining < 8) flush()
+    buffer.putLong(value)
+  }
+
+  def flush(): Unit = {
+    buffer.flip()
+    while (buffer.hasRemaining) channel.write(buffer)
+    buffer.clear()
+  }
+
+  def close(): Unit = {
+    flush()
+    channel.close()
+  }
+}
+
+
+/** Walks written by several workers, each to its own shard
+  * outfile.part-0000, outfile.part-0001, ... When the output is closed, the
+  * shards are either concatenated into outfile or listed in the manifest
+  * outfile.manifest.json together with the number of walks of each one.
+  *
+  * The format is "text" or "binary". Binary walks are written as
+  * [[BinaryWalkShardWriter]] shards, and the names of the ids, one per line,
+  * to outfile.vocab.
+  */
+class ShardedWalkOutput(val outfile: String, names: Array[String], numShards: Int, val concatenate: Boolean, val format: String) extends WalkOutput {
+
+  def this(outfile: String, names: Array[String], numShards: Int, concatenate: Boolean) =
+    this(outfile, names, numShards, concatenate, "text")
+
+  require(ShardedWalkOutput.formats.contains(format), s"Unknown walks format $format")
+
+  val binary = format == "binary"
+
+  val shards: Array[WalkShardWriter] = Array.tabulate(numShards) { i =>
+    val path = ShardedWalkOutput.shardPath(outfile, i)
+    if (binary) new BinaryWalkShardWriter(path) else new TextWalkShardWriter(path, names)
+  }
+
+  def shard(index: Int): WalkShardWriter = shards(index)
+
+  def close(): Unit = {
+    shards.foreach(_.close())
+    val manifest = new File(ShardedWalkOutput.manifestPath(outfile))
+
+    if (binary) writeVocabulary()
+
+    if (concatenate) {
+      concatenateFiles(shards.map(_.path), outfile)
+      if (binary) concatenateOffsets()
+      manifest.delete()
+    } else {
+      writeManifest(manifest)
+    }
+  }
+
+  def writeVocabulary(): Unit = {
+    val out = new BufferedWriter(new OutputStreamWriter(new FileOutputStream(BinaryWalkShardWriter.vocabularyPath(outfile)), StandardCharsets.UTF_8), 1 << 16)
+    try {
+      for (name <- names) {
+        out.write(name)
+        out.write('\n')
+      }
+    } finally {
+      out.close()
+    }
+  }
+
+  /** Copies the files into target and deletes them. */
+  def concatenateFiles(files: Seq[String], target: String): Unit = {
+    val out = FileChannel.open(Paths.get(target), StandardOpenOption.CREATE, StandardOpenOption.WRITE, StandardOpenOption.TRUNCATE_EXISTING)
+    try {
+      for (file <- files) {
+        val in = FileChannel.open(Paths.get(file), StandardOpenOption.READ)
+        try {
+          var position = 0L
+          while (position < in.size) position += in.transferTo(position, in.size - position, out)
+        } finally {
+          in.close()
+        }
+        Files.delete(Paths.get(file))
+      }
+    } finally {
+      out.close()
+    }
+  }
+
+  /** Writes the offsets of the shards shifted by the ids of the previous
+    * shards to outfile.offsets, and deletes the offsets of the shards.
+    */
+  def concatenateOffsets(): Unit = {
+    val out = new LittleEndianWriter(BinaryWalkShardWriter.offsetsPath(outfile))
+    val buffer = ByteBuffer.allocateDirect(1 << 16).order(ByteOrder.LITTLE_ENDIAN)
+    try {
+      out.writeLong(0)
+      var base = 0L
+      for (shard <- shards) {
+        val path = Paths.get(BinaryWalkShardWriter.offsetsPath(shard.path))
+        val in = FileChannel.open(path, StandardOpenOption.READ)
+        try {
+          // The first offset of every shard is 0.
+          in.position(8)
+          buffer.clear()
+          while (in.read(buffer) > 0 || buffer.position() > 0) {
+            buffer.flip()
+            while (buffer.remaining >= 8) out.writeLong(base + buffer.getLong)
+            buffer.compact()
+          }
+        } finally {
+          in.close()
+        }
+        Files.delete(path)
+        base += shard.tokens
+      }
+    } finally {
+      out.close()
+    }
+  }
+
+  def writeManifest(manifest: File): Unit = {
+    import ShardedWalkOutput.jsonString
+    val entries = shards.map { shard =>
+      val name = new File(shard.path).getName
+      val offsets = if (binary) s""", "offsets": ${jsonString(BinaryWalkShardWriter.offsetsPath(name))}""" else ""
+      s"""    {"path": ${jsonString(name)}$offsets, "walks": ${shard.walks}, "tokens": ${shard.tokens}}"""
+    }
+    val vocabulary = if (binary) s"""  "vocabulary": ${jsonString(BinaryWalkShardWriter.vocabularyPath(new File(outfile).getName))},\n""" else ""
+    val text = s"""{
+  "format": "$format",
+$vocabulary  "walks": ${shards.map(_.walks).sum},
+  "shards": [
+${entries.mkString(",\n")}
+  ]
+}
+"""
+    val tmp = new File(manifest.getPath + ".tmp")
+    Files.write(tmp.toPath, text.getBytes(StandardCharsets.UTF_8))
+    Files.move(tmp.toPath, manifest.toPath, StandardCopyOption.REPLACE_EXISTING)
+  }
+}
+
+object ShardedWalkOutput {
+
+  val formats = Set("text", "binary")
+
+  def shardPath(outfile: String, index: Int): String = f"$outfile.part-$index%04d"
+
+  def manifestPath(outfile: String): String = s"$outfile.manifest.json"
+
+  def jsonString(value: String): String = {
+    val escaped = new StringBuilder("\"")
+    for (c <- value) c match {
+      case '"' => escaped ++= "\\\""
+      case '\\' => escaped ++= "\\\\"
+      case c if c < ' ' => escaped ++= f"\\u${c.toInt}%04x"
+      case c => escaped += c
+    }
+    (escaped += '"').toString
+  }
+}
@@ -0,0 +1,198 @@
+package org.mowl.Walking
+
+import collection.JavaConverters._
+import java.util.ArrayList
+import java.util.concurrent.{CancellationException, ThreadLocalRandom}
+import scala.collection.mutable.ListBuffer
+import scala.concurrent.duration.Duration
+import scala.concurrent.{Await, ExecutionContext, Future}
+import scala.util.{Failure, Success}
+
+
+/** Parts shared by the random walkers: the split of the walks between
+  * workers, the order of the start nodes and the output of the walks. Each
+  * worker writes its walks to its own shard of a [[WalkOutput]]: files with
+  * walk, or a [[WalkQueue]] with stream.
+  */
+trait Walker {
+
+  def numWalks: Int
+  def walkLength: Int
+  def workers: Int
+  def outfile: String
+  def nodesOfInterest: ArrayList[String]
+  def concatenate: Boolean
+  def walksFormat: String
+
+  /** Seed of the random number generators of the workers, or null to draw
+    * walks from ThreadLocalRandom. With a seed, each walk draws from a
+    * [[WalkRandom]] seeded with the key of its round and start node, so the
+    * same seed gives the same walks for any number of workers or start nodes
+    * and the walks of a subset of the start nodes are the walks of a run
+    * from all of them.
+    */
+  def seed: java.lang.Long
+
+  /** Names of the nodes walks start from, or an empty list to start from
+    * every node.
+    */
+  def startNodes: ArrayList[String]
+
+  def graph: Graph
+
+  /** Ids of the nodes walks start from, in increasing order. */
+  lazy val nodesIdx: Array[Int] = {
+    if (startNodes == null || startNodes.isEmpty) {
+      graph.nodes
+    } else {
+      val names = startNodes.asScala.toSet
+      graph.nodes.filter(node => names.contains(graph.names(node)))
+    }
+  }
+
+  /** Number of passes over nodesIdx of each worker. */
+  def pathsPerWorker: List[Int]
+
+  lazy val nodesOfInterestIdx: Array[Boolean] = {
+    val names = nodesOfInterest.asScala.toSet
+    graph.names.map(names.contains)
+  }
+
+  /** Walks per second of each worker in the last call to walk. */
+  var walksPerSecond: Array[Double] = Array()
+
+  /** Fills walk with a random walk from start and returns its length. walk
+    * is a buffer of 2 * walkLength - 1 ids alternating nodes and relations.
+    */
+  def randomWalk(start: Int, walk: Array[Int], rand: java.util.Random): Int
+
+  /** Generates the walks into output and closes it. */
+  def run(output: WalkOutput): Unit
+
+  /** Writes the walks to outfile. */
+  def walk(): Unit = run(new ShardedWalkOutput(outfile, graph.names, pathsPerWorker.length, concatenate, walksFormat))
+
+  /** Starts generating the walks in a background thread and returns the
+    * queue the workers push them to, in batches of batchSize walks. At most
+    * capacity batches wait in the queue.
+    */
+  def stream(capacity: Int, batchSize: Int): WalkQueue = {
+    val queue = new WalkQueue(graph.names, capacity, batchSize, walkLength)
+    val thread = new Thread(new Runnable {
+      def run(): Unit = {
+        try {
+          Walker.this.run(queue)
+        } catch {
+          case t: Throwable => queue.fail(t)
+        } finally {
+          queue.close()
+        }
+      }
+    }, "mowl-walk-stream")
+    thread.setDaemon(true)
+    thread.start()
+    queue
+  }
+
+  /** Generates the walks of every worker and closes the output. */
+  def writeWalks(output: WalkOutput)(implicit ec: ExecutionContext): Unit = {
+    val rates = new Array[Double](pathsPerWorker.length)
+    val fut = Future.traverse(pathsPerWorker.indices.toList) { index =>
+      writeWalksToDisk(index, pathsPerWorker(index), output.shard(index), rates)
+    }
+
+    Await.ready(fut, Duration.Inf)
+    walksPerSecond = rates
+
+    fut.value.get match {
+      case Success(msg) => println("* Walking is done, shutting down the executor")
+      case Failure(t: CancellationException) =>
+        output.fail(t)
+        println("* Walking was cancelled, shutting down the executor")
+      case Failure(t) =>
+        output.fail(t)
+        println("An error has ocurred in preprocessing generating random walks: " + t.getMessage + " - " + t.printStackTrace)
+    }
+    output.close()
+  }
+
+  def writeWalksToDisk(index: Int, numWalks: Int, shard: WalkShardWriter, rates: Array[Double])(implicit ec: ExecutionContext): Future[Unit] = Future {
+    println(s"+ started processing thread $index")
+    val start = System.nanoTime
+
+    val firstRound = pathsPerWorker.take(index).sum
+    val walk = new Array[Int](2*walkLength-1)
+    for (i <- 0 until numWalks){
+      if (seed == null) {
+        val rand = ThreadLocalRandom.current()
+        for (n <- shuffle(nodesIdx, rand)){
+          writeWalk(walk, randomWalk(n, walk, rand), shard)
+        }
+      } else {
+        val roundKey = WalkRandom.roundKey(seed, firstRound + i)
+        val rand = new WalkRandom(roundKey)
+        for (n <- shuffle(nodesIdx, rand)){
+          rand.setSeed(WalkRandom.walkKey(roundKey, n))
+          writeWalk(walk, randomWalk(n, walk, rand), shard)
+        }
+      }
+    }
+    shard.close()
+
+    val seconds = (System.nanoTime - start) / 1e9
+    rates(index) = numWalks.toLong * nodesIdx.length / math.max(seconds, 1e-9)
+    println(f"- finished processing thread $index after ${seconds * 1000}%.0f (${rates(index)}%.0f walks per second)")
+  }
+
+  def writeWalk(walk: Array[Int], length: Int, shard: WalkShardWriter): Unit = {
+    if (nodesOfInterest.size == 0 || walk.iterator.take(length).exists(nodesOfInterestIdx)){
+      shard.write(walk, length)
+    }
+  }
+
+  def shuffle(nodes: Array[Int], rand: java.util.Random): Array[Int] = {
+    val shuffled = nodes.clone
+    var i = shuffled.length - 1
+    while (i > 0) {
+      val j = rand.nextInt(i + 1)
+      val node = shuffled(i)
+      shuffled(i) = shuffled(j)
+      shuffled(j) = node
+      i -= 1
+    }
+    shuffled
+  }
+
+
+  def numPathsPerWorker(): (List[Int], Int) = {
+
+    if (numWalks <= workers) {
+      val newWorkers = numWalks
+
+      var pathsPerWorker = for (
+        i <- Range(0, numWalks, 1)
+      ) yield 1
+
+      (pathsPerWorker.toList, newWorkers)
+    }else{
+      val newWorkers = workers
+      val remainder = numWalks % workers
+      var aux = workers - remainder
+
+      val ppw = ((numWalks+aux)/workers).floor.toInt
+      var pathsPerWorker = ListBuffer(ppw)
+
+      for (i <- 0 until (workers -1)){
+        pathsPerWorker += ppw
+      }
+
+      var i = 0
+      while (aux > 0){
+        pathsPerWorker(i%workers) =  pathsPerWorker(i%workers) - 1
+        i = i+1
+        aux = aux -1
+      }
+      (pathsPerWorker.toList, newWorkers)
+    }
+  }
+}
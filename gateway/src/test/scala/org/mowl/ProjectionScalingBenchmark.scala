@@ -0,0 +1,97 @@
+package org.mowl
+
+// OWL API imports
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.apibinding.OWLManager
+
+// Java imports
+import java.lang.management.ManagementFactory
+import collection.JavaConverters._
+
+import org.mowl.Projectors._
+import org.mowl.CatParser.CatParser
+
+
+/** Projects synthetic ontologies of increasing size and reports wall time and
+  * peak heap of each projector, to check that projection time grows linearly
+  * with the number of classes.
+  *
+  * Usage: gradle projectionBenchmark -PbenchmarkArgs="10000 100000 1000000"
+  */
+object ProjectionScalingBenchmark {
+
+  val hasPart = "http://benchmark/has_part"
+
+  def main(args: Array[String]): Unit = {
+    val sizes = if (args.isEmpty) List(10000, 100000, 1000000) else args.map(_.toInt).toList
+    val workers = sys.props.getOrElse("mowl.workers", "1").toInt
+
+    println("projector\tclasses\tworkers\tedges\tseconds\tpeak_heap_mb")
+    for (size <- sizes) {
+      val ontology = syntheticOntology(size)
+      val annotated = syntheticOntology(size, labels = true)
+
+      val projectors = List(
+        ("taxonomy", () => new TaxonomyProjector(true, workers).project(ontology).size),
+        ("taxonomy_rels", () => new TaxonomyWithRelsProjector(true, false, new java.util.ArrayList(List(hasPart).asJava), workers).project(ontology).size),
+        ("dl2vec", () => new DL2VecProjector(true, workers).project(ontology).size),
+        ("owl2vec_star", () => new OWL2VecStarProjector(true, false, false, workers).project(ontology).size),
+        ("owl2vec_star_literals", () => new OWL2VecStarProjector(true, false, true, workers).project(annotated).size),
+        ("cat_parser", () => new CatParser(ontology).parse.size),
+        ("multi", () => new MultiProjector(List[AbstractProjector](
+          new TaxonomyProjector(true, workers),
+          new TaxonomyWithRelsProjector(true, false, new java.util.ArrayList(List(hasPart).asJava), workers),
+          new DL2VecProjector(true, workers),
+          new OWL2VecStarProjector(true, false, false, workers)).asJava).project(ontology).map(_.size).sum)
+      )
+
+      for ((name, run) <- projectors) {
+        System.gc()
+        resetPeakHeap()
+        val start = System.nanoTime
+        val edges = run()
+        val seconds = (System.nanoTime - start) / 1e9
+        println(f"$name\t$size\t$workers\t$edges\t$seconds%.3f\t${peakHeap / (1024 * 1024)}")
+      }
+    }
+  }
+
+  /** Ontology with `size` classes where class i is a subclass of class i / 2
+    * and of has_part some class (i * 7) % size. With labels, each class also
+    * has a label, two synonyms and a non-lexical annotation.
+    */
+  def syntheticOntology(size: Int, labels: Boolean = false): OWLOntology = {
+    val manager = OWLManager.createOWLOntologyManager()
+    val factory = manager.getOWLDataFactory()
+    val ontology = manager.createOntology()
+    val property = factory.getOWLObjectProperty(IRI.create(hasPart))
+    val classes = (0 until size).map(i => factory.getOWLClass(IRI.create(s"http://benchmark/C$i")))
+
+    val axioms = new java.util.HashSet[OWLAxiom]()
+    for (i <- 1 until size) {
+      axioms.add(factory.getOWLSubClassOfAxiom(classes(i), classes(i / 2)))
+      axioms.add(factory.getOWLSubClassOfAxiom(classes(i),
+        factory.getOWLObjectSomeValuesFrom(property, classes((i * 7) % size))))
+    }
+    if (labels) {
+      val label = factory.getRDFSLabel
+      val synonym = factory.getOWLAnnotationProperty(IRI.create("http://www.geneontology.org/formats/oboInOwl#hasExactSynonym"))
+      val subset = factory.getOWLAnnotationProperty(IRI.create("http://www.geneontology.org/formats/oboInOwl#inSubset"))
+      for (i <- 0 until size) {
+        val iri = classes(i).getIRI
+        axioms.add(factory.getOWLAnnotationAssertionAxiom(label, iri, factory.getOWLLiteral(s"class $i")))
+        axioms.add(factory.getOWLAnnotationAssertionAxiom(synonym, iri, factory.getOWLLiteral(s"synonym $i")))
+        axioms.add(factory.getOWLAnnotationAssertionAxiom(synonym, iri, factory.getOWLLiteral(s"other synonym $i")))
+        axioms.add(factory.getOWLAnnotationAssertionAxiom(subset, iri, factory.getOWLLiteral("slim")))
+      }
+    }
+    manager.addAxioms(ontology, axioms)
+    ontology
+  }
+
+  def heapPools = ManagementFactory.getMemoryPoolMXBeans.asScala.filter(_.getType == java.lang.management.MemoryType.HEAP)
+
+  def resetPeakHeap(): Unit = heapPools.foreach(_.resetPeakUsage())
+
+  def peakHeap: Long = heapPools.map(_.getPeakUsage.getUsed).sum
+}
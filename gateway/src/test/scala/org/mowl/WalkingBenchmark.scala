@@ -0,0 +1,100 @@
+package org.mowl
+
+// Java imports
+import java.io.File
+import collection.JavaConverters._
+
+import org.mowl.Walking._
+
+
+/** Generates random walks on synthetic graphs and reports the time to build
+  * the walker, walks per second, peak heap and size of the output of each
+  * walker. For Node2Vec it also reports the time, the size of the alias
+  * tables and the peak heap of preprocessing. The system properties mowl.workers, mowl.walksFormat and
+  * mowl.seed set the number of workers, the format of the walks and the seed
+  * of the workers. With mowl.startFraction, walks start from that fraction
+  * of the nodes. mowl.walkLength sets the length of the walks, 20 by default.
+  *
+  * Usage: gradle walkingBenchmark -PbenchmarkArgs="10000000 deepwalk node2vec node2vec_rejection"
+  */
+object WalkingBenchmark {
+
+  val numRelations = 20
+  val walkLength = sys.props.getOrElse("mowl.walkLength", "20").toInt
+
+  def main(args: Array[String]): Unit = {
+    val numEdges = if (args.isEmpty) 10000000 else args(0).toInt
+    val walkers = if (args.length < 2) List("deepwalk", "node2vec", "node2vec_rejection") else args.drop(1).toList
+    val workers = sys.props.getOrElse("mowl.workers", "1").toInt
+    val walksFormat = sys.props.getOrElse("mowl.walksFormat", "text")
+    val seed = sys.props.get("mowl.seed").map(s => java.lang.Long.valueOf(s.toLong)).orNull
+    val startFraction = sys.props.getOrElse("mowl.startFraction", "1").toDouble
+    // One pass over the nodes per worker, so that every worker writes walks.
+    val numWalks = workers
+
+    val edges = syntheticEdges(numEdges)
+    val allNodes = math.max(numEdges / 10, 10)
+    val startNodes = new java.util.ArrayList[String]()
+    if (startFraction < 1) {
+      val step = math.round(1 / startFraction).toInt
+      for (i <- 0 until allNodes by step) startNodes.add(s"http://benchmark/N$i")
+    }
+    val numNodes = if (startNodes.isEmpty) allNodes else startNodes.size
+    val outfile = File.createTempFile("walks", ".txt")
+    outfile.deleteOnExit()
+
+    val outputFiles = List(outfile, new File(outfile.getPath + ".offsets"), new File(outfile.getPath + ".vocab"))
+    outputFiles.foreach(_.deleteOnExit())
+
+    println("walker\tedges\tworkers\tformat\tseed\tstart_nodes\tbuild_seconds\tpreprocess_seconds\talias_mb\tpreprocess_peak_heap_mb\twalks\twalk_seconds\twalks_per_second\tpeak_heap_mb\toutput_mb")
+    for (name <- walkers) {
+      System.gc()
+      HeapUsage.resetPeak()
+      val start = System.nanoTime
+      val walker: Walker = name match {
+        case "deepwalk" => new DeepWalk(edges, numWalks, walkLength, 0.1f, workers, outfile.getPath, new java.util.ArrayList[String](), true, walksFormat, seed, startNodes)
+        case "node2vec" => new Node2Vec(edges, numWalks, walkLength, 1.0f, 2.0f, workers, outfile.getPath, new java.util.ArrayList[String](), "alias", true, walksFormat, seed, startNodes)
+        case "node2vec_rejection" => new Node2Vec(edges, numWalks, walkLength, 1.0f, 2.0f, workers, outfile.getPath, new java.util.ArrayList[String](), "rejection", true, walksFormat, seed, startNodes)
+      }
+      val built = System.nanoTime
+      val buildPeakHeap = HeapUsage.peak
+      walker.walk()
+      val end = System.nanoTime
+      // Preprocessing resets the peak heap, so the peak of the whole run is
+      // the largest of the peaks before and after it.
+      val peakHeap = math.max(buildPeakHeap, HeapUsage.peak)
+
+      val stats = walker match {
+        case node2vec: Node2Vec => node2vec.preprocessingStats.asScala.mapValues(_.longValue)
+        case _ => Map("milliseconds" -> 0L, "bytes" -> 0L, "peak_heap_bytes" -> 0L)
+      }
+      val preprocessSeconds = stats("milliseconds") / 1e3
+      val aliasMb = stats("bytes") / (1024.0 * 1024)
+      val preprocessPeakHeapMb = stats("peak_heap_bytes") / (1024 * 1024)
+
+      val buildSeconds = (built - start) / 1e9
+      val walkSeconds = (end - built) / 1e9
+      val walks = numWalks.toLong * numNodes
+      val outputMb = outputFiles.filter(_.exists).map(_.length).sum / (1024.0 * 1024)
+      println(f"$name\t$numEdges\t$workers\t$walksFormat\t$seed\t$numNodes\t$buildSeconds%.3f\t$preprocessSeconds%.3f\t$aliasMb%.1f\t$preprocessPeakHeapMb\t$walks\t$walkSeconds%.3f\t${walks / walkSeconds}%.0f\t${peakHeap / (1024 * 1024)}\t$outputMb%.1f")
+    }
+  }
+
+  /** Graph with numEdges / 10 nodes and numEdges edges between random nodes
+    * with one of 20 relations. Node names are shared between edges.
+    */
+  def syntheticEdges(numEdges: Int): java.util.ArrayList[Edge] = {
+    val numNodes = math.max(numEdges / 10, 10)
+    val names = Array.tabulate(numNodes)(i => s"http://benchmark/N$i")
+    val relations = Array.tabulate(numRelations)(i => s"http://benchmark/r$i")
+    val rand = new scala.util.Random(0)
+
+    val edges = new java.util.ArrayList[Edge](numEdges)
+    // Every node has an outgoing edge, so each walk starts from every node.
+    for (i <- 0 until numEdges) {
+      val src = if (i < numNodes) i else rand.nextInt(numNodes)
+      edges.add(new Edge(names(src), relations(rand.nextInt(numRelations)), names(rand.nextInt(numNodes))))
+    }
+    edges
+  }
+}
@@ -37,15 +37,22 @@ class Model():
 
     @property
     def class_index_dict(self):
+        """Mapping `class IRI --> index`.
+
+        :rtype: :class:`EntityIndex <mowl.datasets.index.EntityIndex>`
+        """
         if self._class_index_dict is None:
-            self._class_index_dict = {v: k for k, v in enumerate(self.dataset.classes.as_str)}
+            self._class_index_dict = self.dataset.classes.index
         return self._class_index_dict
 
     @property
     def object_property_index_dict(self):
+        """Mapping `object property IRI --> index`.
+
+        :rtype: :class:`EntityIndex <mowl.datasets.index.EntityIndex>`
+        """
         if self._object_property_index_dict is None:
-            self._object_property_index_dict = {v: k for k, v in
-                                                enumerate(self.dataset.object_properties.as_str)}
+            self._object_property_index_dict = self.dataset.object_properties.index
         return self._object_property_index_dict
 
 
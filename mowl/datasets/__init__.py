@@ -1,4 +1,14 @@
 import mowl
 import jpype
 
-from mowl.datasets.base import Dataset, PathDataset, RemoteDataset, TarFileDataset
+from mowl.datasets.compiled import CompiledDataset
+from mowl.datasets.index import EntityIndex
+
+
+def __getattr__(name):
+    # Classes in mowl.datasets.base use the OWLAPI and need a running JVM. They are imported on
+    # first access so that compiled datasets can be opened without starting the JVM.
+    if name in ("Dataset", "PathDataset", "RemoteDataset", "TarFileDataset"):
+        from mowl.datasets import base
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
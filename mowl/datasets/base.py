@@ -4,17 +4,26 @@ This module contains classes intended to deal with mOWL datasets.
 
 import tarfile
 import pathlib
+import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from jpype import java
-import requests
+import jpype
+import jpype.nio
+from deprecated.sphinx import versionchanged
+from jpype import java, JImplements, JOverride
 
 # OWLAPI imports
 from org.semanticweb.owlapi.model import OWLOntology, OWLClass, OWLObjectProperty
 from org.semanticweb.owlapi.apibinding import OWLManager
+from org.mowl import Signature
 
 from mowl.projection import TaxonomyWithRelsProjector
+from mowl.reasoning.normalize import ELNormalizer
 from mowl.owlapi.adapter import OWLAPIAdapter
+from mowl.datasets.compiled import CompiledDataset
+from mowl.datasets.download import DownloadCache
+from mowl.datasets.index import EntityIndex, unpack_names
 from mowl.owlapi.defaults import TOP, BOT
 
 
@@ -45,6 +54,10 @@ class Dataset():
         self._validation = validation
         self._testing = testing
 
+        self._classes = None
+        self._object_properties = None
+        self._evaluation_classes = None
+
     @property
     def ontology(self):
         """Training dataset
@@ -72,48 +85,26 @@ class Dataset():
     @property
     def classes(self):
         """List of classes in the dataset. The classes are collected from training, validation and
-        testing ontologies using the OWLAPI method ``ontology.getClassesInSignature()``.
+        testing ontologies in a single call to the JVM.
 
         :rtype: OWLClasses
         """
-        self._load()
         if self._classes is None:
-            adapter = OWLAPIAdapter()
-            top = adapter.create_class(TOP)
-            bot = adapter.create_class(BOT)
-            classes = set([top, bot])
-            classes |= set(self._ontology.getClassesInSignature())
-
-            if self._validation:
-                classes |= set(self._validation.getClassesInSignature())
-            if self._testing:
-                classes |= set(self._testing.getClassesInSignature())
-
-            classes = list(classes)
-            self._classes = OWLClasses(classes)
+            names = self._signature(Signature.classIRIs) + [TOP, BOT]
+            self._classes = OWLClasses.from_names(names)
         return self._classes
 
     @property
     def object_properties(self):
         """List of object properties (relations) in the dataset. The object
         properties are collected from training, validation and testing
-        ontologies using the OWLAPI
-        method ``ontology.getObjectPropertiesInSignature()``.
+        ontologies in a single call to the JVM.
 
         :rtype: OWLObjectProperties
         """
-        self._load()
         if self._object_properties is None:
-            obj_properties = set()
-            obj_properties |= set(self._ontology.getObjectPropertiesInSignature())
-
-            if self._validation:
-                obj_properties |= set(self._validation.getObjectPropertiesInSignature())
-            if self._testing:
-                obj_properties |= set(self._testing.getObjectPropertiesInSignature())
-
-            obj_properties = list(obj_properties)
-            self._object_properties = OWLObjectProperties(obj_properties)
+            names = self._signature(Signature.objectPropertyIRIs)
+            self._object_properties = OWLObjectProperties.from_names(names)
         return self._object_properties
 
     @property
@@ -126,12 +117,23 @@ class Dataset():
         overriden, this method returns the classes in the testing ontology obtained from the \
         OWLAPI method ``getClassesInSignature()`` as a :class:`OWLClasses` object.
         """
-        self._load()
         if self._evaluation_classes is None:
-            classes = self._testing.getClassesInSignature()
-            self._evaluation_classes = OWLClasses(classes)
+            if self._testing is None:
+                raise AttributeError("Dataset has no testing ontology to take evaluation classes \
+from.")
+            packed = Signature.classIRIs([self._testing])
+            names = unpack_names(packed.data(), packed.offsets())
+            self._evaluation_classes = OWLClasses.from_names(names)
         return self._evaluation_classes
 
+    def _signature(self, export):
+        """Exports the IRIs of the training, validation and testing ontologies with a method of \
+        ``org.mowl.Signature``.
+        """
+        ontologies = [ont for ont in (self._ontology, self._validation, self._testing) if ont]
+        packed = export(ontologies)
+        return unpack_names(packed.data(), packed.offsets())
+
     @property
     def labels(self):
         """This method returns labels of entities as a dictionary. To be
@@ -145,6 +147,32 @@ class Dataset():
         labels = {str(e.src): str(e.dst) for e in edges}
         return labels
 
+    def compile(self, path):
+        """Stores the dataset in the compiled mOWL format. The compiled dataset contains the \
+        class and object property vocabularies, the :math:`\mathcal{EL}` normal forms of \
+        each ontology as integer arrays and the evaluation classes. It can be opened with \
+        :meth:`CompiledDataset.open <mowl.datasets.compiled.CompiledDataset.open>` without \
+        starting the JVM.
+
+        :param path: Output directory
+        :type path: str
+        :rtype: :class:`CompiledDataset <mowl.datasets.compiled.CompiledDataset>`
+        """
+        normalizer = ELNormalizer()
+        subsets = {"training": self._ontology, "validation": self._validation,
+                   "testing": self._testing}
+        gcis = {name: normalizer.normalize(ontology) for name, ontology in subsets.items()
+                if ontology is not None}
+
+        try:
+            evaluation_classes = self.evaluation_classes
+        except AttributeError:
+            # Default evaluation classes are taken from the testing ontology, which is optional.
+            evaluation_classes = None
+
+        return CompiledDataset.create(path, self.classes.as_str, self.object_properties.as_str,
+                                      gcis, evaluation_classes=evaluation_classes)
+
 
 class PathDataset(Dataset):
     """Loads the dataset from ontology documents.
@@ -196,38 +224,90 @@ class PathDataset(Dataset):
         self.validation_path = validation_path
         self.testing_path = testing_path
 
+        self._init_documents()
+
+    def _init_documents(self):
+        """Parses the ontology documents of the dataset for the first time. Subclasses that do \
+        not read the documents from :attr:`ontology_path`, :attr:`validation_path` and \
+        :attr:`testing_path` override :meth:`_parse_documents` and call this method instead of \
+        :meth:`PathDataset.__init__`.
+        """
+        self._ont_manager = None
+        self._parse_counts = {"ontology": 0, "validation": 0, "testing": 0}
+
         ontology, validation, testing = self._load()
-        super().__init__(ontology, validation=validation, testing=testing)
+        Dataset.__init__(self, ontology, validation=validation, testing=testing)
 
-        self._loaded = False
+    @property
+    def parse_counts(self):
+        """Number of times each ontology document has been parsed from disk. The keys are \
+        ``ontology``, ``validation`` and ``testing``. Documents are parsed once when the \
+        dataset is created and once more per call to :meth:`reload`.
+
+        :rtype: dict
+        """
+        return dict(self._parse_counts)
+
+    def reload(self):
+        """Parses the ontology documents again and discards the cached classes, object \
+        properties and evaluation classes. Use this method when the ontology files have changed \
+        on disk.
+        """
+        self._ontology, self._validation, self._testing = self._load()
         self._classes = None
         self._object_properties = None
         self._evaluation_classes = None
 
     def _load(self):
+        """Parses the ontology documents into a single concurrent ontology manager owned by the \
+        dataset. Ontologies loaded by a previous call are removed from the manager first.
+        """
+        if self._ont_manager is None:
+            self._ont_manager = OWLManager.createConcurrentOWLOntologyManager()
+        else:
+            for ontology in list(self._ont_manager.getOntologies()):
+                self._ont_manager.removeOntology(ontology)
 
-        ont_manager = OWLManager.createOWLOntologyManager()
-        ontology = ont_manager.loadOntologyFromOntologyDocument(
-            java.io.File(self.ontology_path))
+        loaded = self._parse_documents()
+        return loaded["ontology"], loaded.get("validation"), loaded.get("testing")
 
-        validation = None
-        if self.validation_path is not None:
-            validation = ont_manager.loadOntologyFromOntologyDocument(
-                java.io.File(self.validation_path))
+    def _parse_documents(self):
+        """Parses the training, validation and testing documents in parallel threads.
+
+        :rtype: dict
+        """
+        paths = {"ontology": self.ontology_path, "validation": self.validation_path,
+                 "testing": self.testing_path}
+        paths = {name: path for name, path in paths.items() if path is not None}
 
-        testing = None
-        if self.testing_path is not None:
-            testing = ont_manager.loadOntologyFromOntologyDocument(
-                java.io.File(self.testing_path))
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            futures = {name: executor.submit(self._parse, name, path)
+                       for name, path in paths.items()}
+            return {name: future.result() for name, future in futures.items()}
 
-        return ontology, validation, testing
+    def _parse(self, name, path):
+        ontology = self._ont_manager.loadOntologyFromOntologyDocument(java.io.File(path))
+        self._parse_counts[name] += 1
+        return ontology
 
 
+@versionchanged(version="0.1.1", reason="The `tar` file is no longer extracted by default. Use \
+    ``extract=True`` to read the extracted ontology documents.")
 class TarFileDataset(PathDataset):
-    """Loads the dataset from a `tar` file.
+    """Loads the dataset from a `tar` file. The `tar` file must contain a directory named as the \
+    dataset with the files ``ontology.owl`` and, optionally, ``valid.owl`` and ``test.owl``.
+
+    By default, the ontology documents are parsed directly from the `tar` members in a single \
+    pass over the archive and nothing is written to disk. Bytes read and parse time of each \
+    member are reported by :attr:`member_stats`. If ``extract`` is ``True``, the archive is \
+    extracted next to the `tar` file (unless it was already extracted) and the extracted \
+    documents are parsed as in :class:`PathDataset`.
 
     :param tarfile_path: Location of the `tar` file
     :type tarfile_path: str
+    :param extract: Whether to extract the `tar` file before parsing the ontologies. Defaults \
+    to ``False``.
+    :type extract: bool, optional
 
     :param \**kwargs:
         See below
@@ -238,19 +318,36 @@ class TarFileDataset(PathDataset):
     dataset_name: str
     data_root: str
 
-    def __init__(self, tarfile_path: str, *args, **kwargs):
+    MEMBERS = {"ontology": "ontology.owl", "validation": "valid.owl", "testing": "test.owl"}
+
+    def __init__(self, tarfile_path: str, *args, extract=False, **kwargs):
+        if not isinstance(extract, bool):
+            raise TypeError("Optional parameter extract must be of type bool")
+
         self.tarfile_path = tarfile_path
+        self.extract = extract
         self.dataset_name = kwargs.pop('dataset_name', None)
         if self.dataset_name is None:
             basename = os.path.basename(self.tarfile_path)
             self.dataset_name = basename.split(os.extsep, 1)[0]
         self.data_root = pathlib.Path(self.tarfile_path).parent
+        self._member_stats = {}
+
+        if not extract:
+            if not os.path.exists(tarfile_path):
+                raise FileNotFoundError(f"Tar file not found {tarfile_path}")
+
+            self.ontology_path = None
+            self.validation_path = None
+            self.testing_path = None
+            self._init_documents()
+            return
 
         dataset_root = os.path.join(self.data_root, self.dataset_name)
 
-        ontology_path = os.path.join(dataset_root, 'ontology.owl')
-        validation_path = os.path.join(dataset_root, 'valid.owl')
-        testing_path = os.path.join(dataset_root, 'test.owl')
+        ontology_path = os.path.join(dataset_root, self.MEMBERS["ontology"])
+        validation_path = os.path.join(dataset_root, self.MEMBERS["validation"])
+        testing_path = os.path.join(dataset_root, self.MEMBERS["testing"])
 
         ontology_exists = os.path.exists(ontology_path)
         validation_exists = os.path.exists(validation_path)
@@ -271,6 +368,48 @@ class TarFileDataset(PathDataset):
             validation_path,
             testing_path)
 
+    @property
+    def member_stats(self):
+        """Number of bytes read and parsing time in seconds of each `tar` member parsed in the \
+        last load of the dataset. Keys are ``ontology``, ``validation`` and ``testing`` and \
+        values are dictionaries with keys ``member``, ``bytes`` and ``seconds``. Empty if the \
+        dataset was created with ``extract=True``.
+
+        :rtype: dict
+        """
+        return {name: dict(stats) for name, stats in self._member_stats.items()}
+
+    def _parse_documents(self):
+        """Parses the ontology documents from the `tar` members in one sequential pass over the \
+        archive, which also works for compressed archives without seeking back."""
+        if self.extract:
+            return super()._parse_documents()
+
+        members = {os.path.join(self.dataset_name, filename): name
+                   for name, filename in self.MEMBERS.items()}
+        loaded = {}
+        self._member_stats = {}
+
+        with tarfile.open(self.tarfile_path, "r|*") as tarf:
+            for member in tarf:
+                name = members.get(os.path.normpath(member.name))
+                if name is None or not member.isfile():
+                    continue
+
+                channel = _TarMemberChannel(tarf.extractfile(member))
+                stream = java.io.BufferedInputStream(
+                    java.nio.channels.Channels.newInputStream(channel), channel.buffer_size)
+                start = time.perf_counter()
+                loaded[name] = self._ont_manager.loadOntologyFromOntologyDocument(stream)
+                self._member_stats[name] = {"member": member.name, "bytes": channel.bytes_read,
+                                            "seconds": time.perf_counter() - start}
+                self._parse_counts[name] += 1
+
+        if "ontology" not in loaded:
+            raise FileNotFoundError(f"Training ontology {self.dataset_name}/ontology.owl not \
+found in {self.tarfile_path}")
+        return loaded
+
     def _extract(self):
         with tarfile.open(self.tarfile_path) as tarf:
             def is_within_directory(directory, target):
@@ -295,43 +434,110 @@ class TarFileDataset(PathDataset):
             safe_extract(tarf, path=self.data_root)
 
 
+@JImplements("java.nio.channels.ReadableByteChannel")
+class _TarMemberChannel():
+    """Java channel over a file object returned by ``TarFile.extractfile``. Bytes are copied \
+    through a direct buffer that shares memory with a Python ``bytearray``."""
+
+    def __init__(self, fileobj, buffer_size=1 << 16):
+        self.fileobj = fileobj
+        self.buffer_size = buffer_size
+        self.bytes_read = 0
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._direct_buffer = jpype.nio.convertToDirectBuffer(self._buffer)
+        self._open = True
+
+    @JOverride
+    def read(self, dst):
+        size = self.fileobj.readinto(self._view[:min(dst.remaining(), self.buffer_size)])
+        if not size:
+            return -1
+        self._direct_buffer.clear()
+        self._direct_buffer.limit(size)
+        dst.put(self._direct_buffer)
+        self.bytes_read += size
+        return size
+
+    @JOverride
+    def isOpen(self):
+        return self._open
+
+    @JOverride
+    def close(self):
+        self._open = False
+
+
+@versionchanged(version="0.1.1", reason="The `tar` file is no longer extracted by default. Use \
+    ``extract=True`` to read the extracted ontology documents.")
 class RemoteDataset(TarFileDataset):
-    """Loads the dataset from a remote URL.
+    """Loads the dataset from a remote URL. The `tar` file is downloaded into ``data_root`` with \
+    :class:`DownloadCache <mowl.datasets.download.DownloadCache>`: interrupted downloads are \
+    resumed and a file is only reused if it matches the checksum recorded when its download \
+    completed.
 
     :param url: URL location of the dataset
     :type url: str
     :param data_root: Root directory
     :type data_root: str
+    :param sha256: Expected SHA-256 hexadecimal digest of the `tar` file. If ``None``, a new \
+    download is only checked to be a complete `tar` archive. Defaults to ``None``.
+    :type sha256: str, optional
+    :param extract: Whether to extract the `tar` file. See :class:`TarFileDataset`. Defaults \
+    to ``False``.
+    :type extract: bool, optional
     """
 
     url: str
     data_root: str
 
-    def __init__(self, url: str, data_root='./'):
+    def __init__(self, url: str, data_root='./', sha256=None, extract=False):
+        if sha256 is not None and not isinstance(sha256, str):
+            raise TypeError("Optional parameter sha256 must be of type str")
+
         self.url = url
         self.data_root = data_root
+        self.sha256 = sha256
         tarfile_path = self._download()
-        super().__init__(tarfile_path)
+        super().__init__(tarfile_path, extract=extract)
 
     def _download(self):
-        filename = self.url.split('/')[-1]
-        filepath = os.path.join(self.data_root, filename)
-        if os.path.exists(filepath):
-            return filepath
-        with requests.get(self.url, stream=True) as req:
-            req.raise_for_status()
-            with open(filepath, 'wb') as writer:
-                for chunk in req.iter_content(chunk_size=8192):
-                    writer.write(chunk)
-        return filepath
+        cache = DownloadCache(self.data_root)
+        return cache.fetch(self.url, sha256=self.sha256, verify=_verify_tar_file)
+
+
+def _verify_tar_file(filepath):
+    """Reads the whole `tar` file, which raises an error if it is truncated or, if it is \
+    compressed, fails its integrity check."""
+    with tarfile.open(filepath) as tarf:
+        for _ in tarf:
+            pass
+        while tarf.fileobj.read(1 << 20):
+            pass
 
 
 class Entities():
-    """Abstract class containing OWLEntities indexed by they IRIs"""
+    """Abstract class containing OWLEntities indexed by they IRIs. Entities are stored in an \
+    :class:`EntityIndex <mowl.datasets.index.EntityIndex>`."""
+
+    _adapter = None
 
     def __init__(self, collection):
-        self._collection = self.check_owl_type(collection)
-        self._name_owlobject = self.to_dict()
+        self._collection = self.check_owl_type(list(collection))
+        names = [self.to_str(ent) for ent in self._collection]
+        self._index = EntityIndex(names, objects=self._collection, factory=self.to_owl)
+
+    @classmethod
+    def from_names(cls, names):
+        """Creates the entities from their IRIs. OWL objects are created only when requested.
+
+        :param names: Entity IRIs
+        :type names: iterable of str
+        """
+        entities = cls.__new__(cls)
+        entities._collection = None
+        entities._index = EntityIndex(names, factory=entities.to_owl)
+        return entities
 
     def check_owl_type(self, collection):
         """This method checks whether the elements in the provided collection
@@ -342,50 +548,61 @@ class Entities():
     def to_str(self, owl_class):
         raise NotImplementedError
 
+    def to_owl(self, name):
+        raise NotImplementedError
+
     def to_dict(self):
         """Generates a dictionaty indexed by OWL entities IRIs and the values
         are the corresponding OWL entities.
         """
-        dict_ = {}
-        for ent in self._collection:
-            name = self.to_str(ent)
-            if name not in dict_:
-                dict_[name] = ent
-        dict_ = dict(sorted(dict_.items()))
-        return dict_
+        return dict(zip(self.as_str, self.as_owl))
+
+    @property
+    def index(self):
+        """Mapping `entity IRI --> index` in the order of :attr:`as_str`.
+
+        :rtype: :class:`EntityIndex <mowl.datasets.index.EntityIndex>`
+        """
+        return self._index
 
     @property
     def as_str(self):
         """Returns the list of entities as string names."""
-        return list(self._name_owlobject.keys())
+        return self._index.names.tolist()
 
     @property
     def as_owl(self):
         """Returns the list of entities as OWL objects."""
-        return list(self._name_owlobject.values())
+        return list(self._index.as_owl)
+
+    def __len__(self):
+        return len(self._index)
 
 
 class OWLClasses(Entities):
     """Class containing OWL classes indexed by they IRIs"""
 
     def check_owl_type(self, collection):
-        for item in collection:
-            if not isinstance(item, OWLClass):
-                raise TypeError("Type of elements in collection must be OWLClass.")
+        if not all(isinstance(item, OWLClass) for item in collection):
+            raise TypeError("Type of elements in collection must be OWLClass.")
         return collection
 
     def to_str(self, owl_class):
         name = str(owl_class.toStringID())
         return name
 
+    def to_owl(self, name):
+        if self._adapter is None:
+            self._adapter = OWLAPIAdapter()
+        return self._adapter.create_class(name)
+
 
 class OWLObjectProperties(Entities):
     """Class containing OWL object properties indexed by they IRIs"""
 
     def check_owl_type(self, collection):
-        for item in collection:
-            if not isinstance(item, OWLObjectProperty):
-                raise TypeError("Type of elements in collection must be OWLObjectProperty.")
+        if not all(isinstance(item, OWLObjectProperty) for item in collection):
+            raise TypeError("Type of elements in collection must be OWLObjectProperty.")
         return collection
 
     def to_str(self, owl_class):
@@ -393,3 +610,8 @@ class OWLObjectProperties(Entities):
         if name.startswith("<"):
             name = name[1:-1]
         return name
+
+    def to_owl(self, name):
+        if self._adapter is None:
+            self._adapter = OWLAPIAdapter()
+        return self._adapter.create_object_property(name)
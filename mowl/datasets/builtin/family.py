@@ -1,4 +1,5 @@
 from ..base import RemoteDataset, PathDataset
+from ..download import get_data_home
 
 DATA_URL = 'https://bio2vec.cbrc.kaust.edu.sa/data/mowl/family.tar.gz'
 
@@ -6,8 +7,9 @@ DATA_URL = 'https://bio2vec.cbrc.kaust.edu.sa/data/mowl/family.tar.gz'
 class FamilyDataset(RemoteDataset):
     """This dataset represents a family domain. It is a short ontology with 12 axioms."""
 
-    def __init__(self, url=None):
-        super().__init__(url=DATA_URL if not url else url)
+    def __init__(self, url=None, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_URL if not url else url, data_root=get_data_home(data_root),
+                         sha256=sha256, extract=extract)
         self._evaluation_classes = None
         self._loaded_eval_data = False
 
@@ -1,6 +1,7 @@
 import pathlib
 
 from ..base import RemoteDataset, PathDataset
+from ..download import get_data_home
 import math
 import random
 import numpy as np
@@ -31,8 +32,9 @@ class GDADataset(RemoteDataset):
     testing ontologies, respectively.
     """
 
-    def __init__(self, url=None):
-        super().__init__(url=url)
+    def __init__(self, url=None, data_root=None, sha256=None, extract=False):
+        super().__init__(url=url, data_root=get_data_home(data_root), sha256=sha256,
+                         extract=extract)
 
     def _get_evaluation_classes(self):
         """Classes that are used in evaluation
@@ -52,8 +54,9 @@ class GDADataset(RemoteDataset):
 
 
 class GDAHumanDataset(GDADataset):
-    def __init__(self):
-        super().__init__(url=DATA_HUMAN_URL)
+    def __init__(self, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_HUMAN_URL, data_root=data_root, sha256=sha256,
+                         extract=extract)
 
 
 class GDAHumanELDataset(GDADataset):
@@ -61,13 +64,15 @@ class GDAHumanELDataset(GDADataset):
     contains axioms in the :math:`\mathcal{EL}` language.
     """
 
-    def __init__(self):
-        super().__init__(url=DATA_HUMAN_EL_URL)
+    def __init__(self, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_HUMAN_EL_URL, data_root=data_root, sha256=sha256,
+                         extract=extract)
 
 
 class GDAMouseDataset(GDADataset):
-    def __init__(self):
-        super().__init__(url=DATA_MOUSE_URL)
+    def __init__(self, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_MOUSE_URL, data_root=data_root, sha256=sha256,
+                         extract=extract)
 
 
 class GDAMouseELDataset(GDADataset):
@@ -75,5 +80,6 @@ class GDAMouseELDataset(GDADataset):
     contains axioms in the :math:`\mathcal{EL}` language.
     """
 
-    def __init__(self):
-        super().__init__(url=DATA_MOUSE_EL_URL)
+    def __init__(self, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_MOUSE_EL_URL, data_root=data_root, sha256=sha256,
+                         extract=extract)
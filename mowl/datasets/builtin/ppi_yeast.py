@@ -1,6 +1,7 @@
 import pathlib
 
 from ..base import RemoteDataset, PathDataset
+from ..download import get_data_home
 import math
 import random
 import numpy as np
@@ -25,8 +26,9 @@ class PPIYeastDataset(RemoteDataset):
     :math:`protein_1 \sqsubseteq interacts\_with . protein_2.`
 """
 
-    def __init__(self, url=None):
-        super().__init__(url=DATA_URL if not url else url)
+    def __init__(self, url=None, data_root=None, sha256=None, extract=False):
+        super().__init__(url=DATA_URL if not url else url, data_root=get_data_home(data_root),
+                         sha256=sha256, extract=extract)
         self._evaluation_classes = None
         self._loaded_eval_data = False
 
@@ -57,5 +59,6 @@ class PPIYeastSlimDataset(PPIYeastDataset):
     subset of Gene Ontology.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(url=SLIM_DATA_URL)
+    def __init__(self, data_root=None, sha256=None, extract=False):
+        super().__init__(url=SLIM_DATA_URL, data_root=data_root, sha256=sha256,
+                         extract=extract)
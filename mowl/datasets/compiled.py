@@ -0,0 +1,260 @@
+"""
+This module contains the compiled on-disk format of mOWL datasets. A compiled dataset stores the
+class and object property vocabularies, the :math:`\\mathcal{EL}` normal forms of the training,
+validation and testing ontologies as integer arrays and the evaluation classes. Opening a
+compiled dataset does not start the JVM.
+"""
+
+import json
+import os
+
+import numpy as np
+import torch as th
+
+from mowl.datasets.gci import GCIDataset
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+SUBSETS = ("training", "validation", "testing")
+
+# Attributes of each normal form (see mowl.reasoning.normalize) stored as array columns, in the
+# same order used by GCI0Dataset, GCI1Dataset, GCI2Dataset and GCI3Dataset.
+GCI_COLUMNS = {
+    "gci0": ("subclass", "superclass"),
+    "gci0_bot": ("subclass", "superclass"),
+    "gci1": ("left_subclass", "right_subclass", "superclass"),
+    "gci1_bot": ("left_subclass", "right_subclass", "superclass"),
+    "gci2": ("subclass", "object_property", "filler"),
+    "gci3": ("object_property", "filler", "superclass"),
+    "gci3_bot": ("object_property", "filler", "superclass"),
+}
+
+
+class CompiledGCIDataset(GCIDataset):
+    """:class:`GCIDataset <mowl.datasets.gci.GCIDataset>` built from an array of indices \
+    instead of a list of GCI objects."""
+
+    def push_to_device(self, data):
+        return th.as_tensor(np.array(data, dtype=np.int64)).to(self.device)
+
+
+class CompiledDataset():
+    """Dataset stored in the compiled mOWL format. Use :meth:`open` to load an existing compiled \
+    dataset or :meth:`Dataset.compile <mowl.datasets.base.Dataset.compile>` to create one. \
+    Arrays are memory-mapped from disk.
+
+    :param path: Directory containing the compiled dataset.
+    :type path: str
+    """
+
+    def __init__(self, path):
+        manifest_path = os.path.join(path, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            raise FileNotFoundError(f"Compiled dataset manifest not found {manifest_path}")
+
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled dataset format version: \
+{manifest.get('format_version')}. Supported version is {FORMAT_VERSION}.")
+
+        self.path = path
+        self._manifest = manifest
+        self._classes = self._load_array(manifest["classes"])
+        self._object_properties = self._load_array(manifest["object_properties"])
+        self._class_index_dict = None
+        self._object_property_index_dict = None
+
+    @classmethod
+    def open(cls, path):
+        """Opens a compiled dataset.
+
+        :param path: Directory containing the compiled dataset.
+        :type path: str
+        :rtype: :class:`CompiledDataset`
+        """
+        return cls(path)
+
+    @classmethod
+    def create(cls, path, classes, object_properties, gcis, evaluation_classes=None):
+        """Writes a compiled dataset to disk. The manifest is written last, so a directory \
+        without manifest is an incomplete compilation.
+
+        :param path: Output directory. It is created if it does not exist.
+        :type path: str
+        :param classes: Class names. Indices follow the order of this list.
+        :type classes: list of str
+        :param object_properties: Object property names. Indices follow the order of this list.
+        :type object_properties: list of str
+        :param gcis: Dictionary with subset names (``training``, ``validation``, ``testing``) \
+        as keys and the output of :meth:`ELNormalizer.normalize \
+        <mowl.reasoning.normalize.ELNormalizer.normalize>` as values.
+        :type gcis: dict
+        :param evaluation_classes: Collection of class names or tuple of collections of class \
+        names. Defaults to ``None``.
+        :rtype: :class:`CompiledDataset`
+        """
+
+        unknown = set(gcis) - set(SUBSETS)
+        if unknown:
+            raise ValueError(f"Unrecognized subsets {unknown}. Valid subsets are: {SUBSETS}")
+
+        os.makedirs(path, exist_ok=True)
+
+        classes = list(classes)
+        object_properties = list(object_properties)
+        class_index = {v: k for k, v in enumerate(classes)}
+        object_property_index = {v: k for k, v in enumerate(object_properties)}
+        index_dicts = {"object_property": object_property_index}
+
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "classes": cls._save_array(path, "classes.npy", np.array(classes, dtype=str)),
+            "object_properties": cls._save_array(path, "object_properties.npy",
+                                                 np.array(object_properties, dtype=str)),
+            "subsets": {},
+            "evaluation_classes": None,
+        }
+
+        for subset, subset_gcis in gcis.items():
+            manifest["subsets"][subset] = {}
+            for name, columns in GCI_COLUMNS.items():
+                rows = [[index_dicts.get(col, class_index)[getattr(gci, col)] for col in columns]
+                        for gci in subset_gcis.get(name, [])]
+                array = np.array(rows, dtype=np.int64).reshape(-1, len(columns))
+                filename = cls._save_array(path, f"{subset}_{name}.npy", array)
+                manifest["subsets"][subset][name] = filename
+
+        if evaluation_classes is not None:
+            groups = evaluation_classes if isinstance(evaluation_classes, tuple) \
+                else (evaluation_classes,)
+            filenames = []
+            for i, group in enumerate(groups):
+                names = sorted(set(_as_names(group)))
+                filenames.append(cls._save_array(path, f"evaluation_classes_{i}.npy",
+                                                 np.array(names, dtype=str)))
+            manifest["evaluation_classes"] = {
+                "files": filenames,
+                "tuple": isinstance(evaluation_classes, tuple)
+            }
+
+        with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        return cls(path)
+
+    @staticmethod
+    def _save_array(path, filename, array):
+        np.save(os.path.join(path, filename), array)
+        return filename
+
+    def _load_array(self, filename):
+        return np.load(os.path.join(self.path, filename), mmap_mode="r")
+
+    @property
+    def subsets(self):
+        """Names of the subsets stored in the compiled dataset.
+
+        :rtype: list of str
+        """
+        return list(self._manifest["subsets"])
+
+    @property
+    def classes(self):
+        """Class names sorted alphabetically. The position of each name is its index.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._classes
+
+    @property
+    def object_properties(self):
+        """Object property names sorted alphabetically. The position of each name is its index.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._object_properties
+
+    @property
+    def class_index_dict(self):
+        """Dictionary `class name --> index`.
+
+        :rtype: dict
+        """
+        if self._class_index_dict is None:
+            self._class_index_dict = {str(v): k for k, v in enumerate(self._classes)}
+        return self._class_index_dict
+
+    @property
+    def object_property_index_dict(self):
+        """Dictionary `object property name --> index`.
+
+        :rtype: dict
+        """
+        if self._object_property_index_dict is None:
+            self._object_property_index_dict = {str(v): k for k, v in
+                                                enumerate(self._object_properties)}
+        return self._object_property_index_dict
+
+    @property
+    def evaluation_classes(self):
+        """Classes used for evaluation. Returns a list of class names or a tuple of lists of \
+        class names, following the type of :attr:`Dataset.evaluation_classes \
+        <mowl.datasets.base.Dataset.evaluation_classes>` of the compiled dataset. Returns \
+        ``None`` if the compiled dataset has no evaluation classes.
+        """
+        info = self._manifest["evaluation_classes"]
+        if info is None:
+            return None
+
+        groups = tuple(self._load_array(filename).tolist() for filename in info["files"])
+        return groups if info["tuple"] else groups[0]
+
+    def gcis(self, subset="training"):
+        """Returns the normal forms of a subset as memory-mapped arrays of indices. Columns \
+        follow :data:`GCI_COLUMNS`.
+
+        :param subset: One of ``training``, ``validation`` or ``testing``. Defaults to \
+        ``training``.
+        :type subset: str
+        :rtype: dict of :class:`numpy.ndarray`
+        """
+        if subset not in self._manifest["subsets"]:
+            raise ValueError(f"Subset {subset} not found in compiled dataset. Available \
+subsets are: {self.subsets}")
+
+        return {name: self._load_array(filename) for name, filename in
+                self._manifest["subsets"][subset].items()}
+
+    def get_gci_datasets(self, subset="training", extended=True, device="cpu"):
+        """Returns a dictionary containing the name of the normal forms as keys and the \
+        corresponding datasets as values, as in :meth:`ELDataset.get_gci_datasets \
+        <mowl.datasets.el.ELDataset.get_gci_datasets>`.
+
+        :param subset: One of ``training``, ``validation`` or ``testing``. Defaults to \
+        ``training``.
+        :type subset: str
+        :param extended: If true, return 7 datasets. Otherwise, the normal forms with bottom \
+        concept are merged into their origin normal forms and 4 datasets are returned. Defaults \
+        to ``True``.
+        :type extended: bool, optional
+        :rtype: dict
+        """
+        arrays = self.gcis(subset)
+
+        if not extended:
+            for name in ("gci0", "gci1", "gci3"):
+                arrays[name] = np.concatenate([arrays[name], arrays.pop(f"{name}_bot")])
+
+        object_property_index_dict = self.object_property_index_dict
+        return {name: CompiledGCIDataset(array, self.class_index_dict,
+                                         object_property_index_dict=object_property_index_dict,
+                                         device=device)
+                for name, array in arrays.items()}
+
+
+def _as_names(collection):
+    if hasattr(collection, "as_str"):
+        return collection.as_str
+    return [str(x) for x in collection]
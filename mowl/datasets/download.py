@@ -0,0 +1,337 @@
+"""
+This module implements the download of remote datasets into a cache directory shared by all mOWL
+datasets. Downloads are written to a partial file that is resumed with HTTP range requests after
+an interruption, verified with SHA-256 and atomically renamed when complete. Range requests carry
+an ``If-Range`` header with the ``ETag`` or ``Last-Modified`` value of the remote file, so a file
+that changed since the download started is downloaded again from the start.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover. Not available on Windows.
+    fcntl = None
+
+logger = logging.getLogger("download")
+
+DATA_HOME_ENV = "MOWL_DATA_HOME"
+DEFAULT_DATA_HOME = os.path.join("~", ".mowl", "datasets")
+MANIFEST_FILE = "mowl_downloads.json"
+READ_SIZE = 1 << 20
+
+
+def get_data_home(data_home=None):
+    """Returns the directory where mOWL datasets are cached. The directory is, in order of \
+    precedence, the ``data_home`` parameter, the ``MOWL_DATA_HOME`` environment variable or \
+    ``~/.mowl/datasets``.
+
+    :param data_home: Cache directory, defaults to ``None``.
+    :type data_home: str, optional
+    :rtype: str
+    """
+    if data_home is None:
+        data_home = os.environ.get(DATA_HOME_ENV, DEFAULT_DATA_HOME)
+    return os.path.expanduser(data_home)
+
+
+def sha256sum(filepath):
+    """Computes the SHA-256 hexadecimal digest of a file.
+
+    :param filepath: Path of the file
+    :type filepath: str
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(READ_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DownloadCache():
+    """Directory of downloaded files together with a manifest that records the URL, size and \
+    SHA-256 checksum of each completed download. A file in the cache is only reused if it matches \
+    its manifest entry.
+
+    :param root: Cache directory. Defaults to the value of :func:`get_data_home`.
+    :type root: str, optional
+    :param workers: Number of threads used to fetch chunks in parallel when the server supports \
+    range requests. Defaults to 4.
+    :type workers: int, optional
+    :param chunk_size: Size in bytes of each chunk fetched in parallel. Defaults to 8 MiB.
+    :type chunk_size: int, optional
+    :param timeout: Timeout in seconds for each HTTP request. Defaults to 60.
+    :type timeout: int, optional
+    """
+
+    def __init__(self, root=None, workers=4, chunk_size=8 << 20, timeout=60):
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Optional parameter workers must be a positive integer")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("Optional parameter chunk_size must be a positive integer")
+
+        self.root = get_data_home(root)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._manifest_lock = threading.Lock()
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.root, MANIFEST_FILE)
+
+    @property
+    def manifest(self):
+        """Dictionary indexed by file name with the URL, size and SHA-256 checksum of each \
+        completed download.
+
+        :rtype: dict
+        """
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, "r") as f:
+            return json.load(f)
+
+    def _record(self, filename, entry):
+        with self._manifest_lock:
+            manifest = self.manifest
+            manifest[filename] = entry
+            tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+
+    def is_cached(self, url, sha256=None):
+        """Checks whether the file at ``url`` is completely downloaded and matches its manifest \
+        entry and, if given, the expected checksum. The file is hashed again only if its size or \
+        modification time changed since it was recorded.
+
+        :rtype: bool
+        """
+        filename = url.split('/')[-1]
+        filepath = os.path.join(self.root, filename)
+        entry = self.manifest.get(filename)
+
+        if entry is None or entry["url"] != url or not os.path.exists(filepath):
+            return False
+        if sha256 is not None and entry["sha256"] != sha256:
+            return False
+
+        stat = os.stat(filepath)
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime != entry["mtime"] and sha256sum(filepath) != entry["sha256"]:
+            return False
+        return True
+
+    def fetch(self, url, sha256=None, verify=None):
+        """Returns the path of the cached file for ``url``, downloading it first if it is not \
+        in the cache. Interrupted downloads are resumed.
+
+        :param url: URL of the file
+        :type url: str
+        :param sha256: Expected SHA-256 hexadecimal digest. If ``None``, the checksum is only \
+        recorded in the manifest. Defaults to ``None``.
+        :type sha256: str, optional
+        :param verify: Function called with the path of a downloaded file before it is added to \
+        the cache. It must raise an exception if the file is not valid, in which case the file is \
+        removed. Defaults to ``None``.
+        :type verify: callable, optional
+        :rtype: str
+        """
+        os.makedirs(self.root, exist_ok=True)
+        filename = url.split('/')[-1]
+        filepath = os.path.join(self.root, filename)
+
+        with _FileLock(os.path.join(self.root, f".{filename}.lock")):
+            if self.is_cached(url, sha256=sha256):
+                return filepath
+
+            digest = self._download(url, filepath, sha256, verify)
+            stat = os.stat(filepath)
+            self._record(filename, {"url": url, "size": stat.st_size, "sha256": digest,
+                                    "mtime": stat.st_mtime})
+        return filepath
+
+    def _download(self, url, filepath, sha256, verify=None):
+        part_path = filepath + ".part"
+
+        with requests.head(url, allow_redirects=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            size = int(response.headers.get("Content-Length", -1))
+            accepts_ranges = response.headers.get("Accept-Ranges", "none") == "bytes"
+            validator = response.headers.get("ETag", response.headers.get("Last-Modified"))
+
+        if accepts_ranges and size > self.chunk_size and self.workers > 1:
+            self._download_chunks(url, part_path, size, validator)
+        else:
+            self._download_stream(url, part_path, accepts_ranges, size, validator)
+
+        if size >= 0 and os.path.getsize(part_path) != size:
+            received = os.path.getsize(part_path)
+            _discard(part_path)
+            raise IOError(f"Incomplete download of {url}: expected {size} bytes, got \
+{received}.")
+
+        digest = sha256sum(part_path)
+        if sha256 is not None and digest != sha256:
+            _discard(part_path)
+            raise IOError(f"Checksum mismatch for {url}: expected {sha256}, got {digest}.")
+
+        if verify is not None:
+            try:
+                verify(part_path)
+            except Exception as e:
+                _discard(part_path)
+                raise IOError(f"Invalid download of {url}: {e}") from e
+
+        os.replace(part_path, filepath)
+        chunks_path = part_path + ".chunks"
+        if os.path.exists(chunks_path):
+            os.remove(chunks_path)
+        return digest
+
+    def _download_stream(self, url, part_path, accepts_ranges, size=-1, validator=None):
+        """Downloads the file in one request, resuming a partial download with a range request. \
+        The ``ETag`` or ``Last-Modified`` value of the remote file when the partial download \
+        started is recorded next to it, and the partial download is only resumed if the remote \
+        file still has it."""
+
+        progress_path = part_path + ".chunks"
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if offset > 0 and validator is not None and \
+           _read_progress(progress_path).get("validator") != validator:
+            logger.info(f"Remote file {url} changed since the download started")
+            _discard(part_path)
+            offset = 0
+        if size >= 0 and offset > size:
+            # The remote file is now smaller than the partial download.
+            _discard(part_path)
+            offset = 0
+        if accepts_ranges and 0 < offset == size:
+            return
+
+        headers = {}
+        if accepts_ranges and offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+            if validator is not None:
+                headers["If-Range"] = validator
+
+        with requests.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416:
+                # The range starts at the end of the file: the partial download is complete if
+                # it has the size of the remote file, otherwise it is downloaded again.
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if total.isdigit() and int(total) == offset:
+                    return
+                _discard(part_path)
+                return self._download_stream(url, part_path, False, size, validator)
+            response.raise_for_status()
+            # A 200 response to a range request means that the remote file changed or that the
+            # server ignores ranges, so the whole file is written again.
+            mode = "ab" if response.status_code == 206 else "wb"
+            if mode == "ab":
+                logger.info(f"Resuming download of {url} at byte {offset}")
+            else:
+                with open(progress_path, "w") as f:
+                    json.dump({"validator": response.headers.get("ETag", response.headers.get(
+                        "Last-Modified", validator))}, f)
+            with open(part_path, mode) as writer:
+                for chunk in response.iter_content(chunk_size=READ_SIZE):
+                    writer.write(chunk)
+
+    def _download_chunks(self, url, part_path, size, validator=None):
+        """Fetches fixed-size ranges of the file in parallel and writes them in place. Completed \
+        chunks are recorded next to the partial file, together with the ``ETag`` or \
+        ``Last-Modified`` value of the remote file, so that a resumed download only fetches the \
+        missing ones if the remote file did not change."""
+
+        chunks_path = part_path + ".chunks"
+        num_chunks = (size + self.chunk_size - 1) // self.chunk_size
+
+        done = None
+        if os.path.exists(part_path) and os.path.exists(chunks_path) and \
+           os.path.getsize(part_path) == size:
+            progress = _read_progress(chunks_path)
+            if "done" in progress and progress.get("validator") == validator:
+                done = set(progress["done"])
+        if done is not None:
+            logger.info(f"Resuming download of {url}: {len(done)}/{num_chunks} chunks done")
+        else:
+            done = set()
+            with open(part_path, "wb") as writer:
+                writer.truncate(size)
+
+        lock = threading.Lock()
+
+        def fetch_chunk(index):
+            start = index * self.chunk_size
+            end = min(start + self.chunk_size, size) - 1
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator is not None:
+                headers["If-Range"] = validator
+            with requests.get(url, headers=headers, stream=True, timeout=self.timeout) as resp:
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise IOError(f"Server ignored range request for {url}, or the file changed "
+                                  f"during the download")
+                with open(part_path, "r+b") as writer:
+                    writer.seek(start)
+                    for block in resp.iter_content(chunk_size=READ_SIZE):
+                        writer.write(block)
+            with lock:
+                done.add(index)
+                with open(chunks_path, "w") as f:
+                    json.dump({"validator": validator, "done": sorted(done)}, f)
+
+        missing = [i for i in range(num_chunks) if i not in done]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in [executor.submit(fetch_chunk, i) for i in missing]:
+                future.result()
+
+
+def _read_progress(path):
+    """Reads the record of a partial download: the ``validator`` of the remote file and, for \
+    chunked downloads, the chunks that are ``done``."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        progress = json.load(f)
+    # Older caches record only the list of completed chunks.
+    return {"validator": None, "done": progress} if isinstance(progress, list) else progress
+
+
+def _discard(part_path):
+    """Removes a partial download and its record of completed chunks."""
+    for path in (part_path, part_path + ".chunks"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class _FileLock():
+    """Exclusive lock on a file, so that processes sharing a cache directory do not download the \
+    same file at the same time."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "a")
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
@@ -0,0 +1,178 @@
+"""
+This module contains :class:`EntityIndex`, an immutable mapping from entity names to integer
+indices backed by a sorted NumPy array of names. It does not require the JVM.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class EntityIndex(Mapping):
+    """Immutable mapping `entity name --> index`. Names are stored in a sorted NumPy string \
+    array and the index of each name is its position in the array, which is the order used by \
+    :attr:`OWLClasses.as_str <mowl.datasets.base.Entities.as_str>`.
+
+    Single lookups use a dictionary built on first access. Batch lookups with :meth:`ids_of` \
+    are vectorized. OWL objects are only created when requested, either from the objects given \
+    at construction time or with ``factory``.
+
+    :param names: Entity names. Duplicates are removed.
+    :type names: iterable of str
+    :param objects: OWL objects of each name, in the same order as ``names``. Defaults to \
+    ``None``.
+    :type objects: list, optional
+    :param factory: Function that creates the OWL object of a name. Used when ``objects`` is not \
+    given. Defaults to ``None``.
+    :type factory: callable, optional
+    """
+
+    def __init__(self, names, objects=None, factory=None):
+
+        names = np.asarray(names if isinstance(names, np.ndarray) else list(names), dtype=str)
+        if names.ndim != 1:
+            raise ValueError("Parameter names must be a one-dimensional collection")
+
+        if objects is not None:
+            objects = list(objects)
+            if len(objects) != len(names):
+                raise ValueError("Optional parameter objects must have the same length as names")
+
+        self._names, first = np.unique(names, return_index=True)
+        self._names.flags.writeable = False
+        self._objects = None if objects is None else [objects[i] for i in first]
+        self._factory = factory
+        self._lookup = None
+
+    @property
+    def names(self):
+        """Sorted entity names. The array is read-only.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._names
+
+    def __getitem__(self, name):
+        if self._lookup is None:
+            self._lookup = {name: i for i, name in enumerate(self._names.tolist())}
+        return self._lookup[name]
+
+    def __contains__(self, name):
+        try:
+            self[name]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._names.tolist())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __eq__(self, other):
+        if isinstance(other, EntityIndex):
+            return np.array_equal(self._names, other._names)
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"EntityIndex({len(self)} entities)"
+
+    def ids_of(self, names):
+        """Returns the indices of a collection of names.
+
+        :param names: Entity names
+        :type names: iterable of str
+        :rtype: :class:`numpy.ndarray` of int64
+        :raises KeyError: If some name is not in the index.
+        """
+        names = np.asarray(names if isinstance(names, np.ndarray) else list(names), dtype=str)
+        if len(self._names) == 0:
+            if names.size > 0:
+                raise KeyError(f"Names not found in index: {names[:5].tolist()}")
+            return np.zeros(names.shape, dtype=np.int64)
+
+        ids = np.searchsorted(self._names, names)
+        clipped = np.minimum(ids, len(self._names) - 1)
+        missing = self._names[clipped] != names
+        if missing.any():
+            raise KeyError(f"Names not found in index: {names[missing][:5].tolist()}")
+        return ids.astype(np.int64)
+
+    def name_of(self, index):
+        """Returns the name at an index.
+
+        :param index: Entity index
+        :type index: int
+        :rtype: str
+        """
+        return str(self._names[index])
+
+    def names_of(self, ids):
+        """Returns the names at a collection of indices.
+
+        :param ids: Entity indices
+        :type ids: array-like of int
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._names[np.asarray(ids, dtype=np.int64)]
+
+    def owl_object(self, name):
+        """Returns the OWL object of a name.
+
+        :param name: Entity name
+        :type name: str
+        """
+        return self.as_owl[self[name]]
+
+    @property
+    def as_owl(self):
+        """OWL objects in index order. They are created with ``factory`` on first access if \
+        they were not given at construction time.
+
+        :rtype: list
+        """
+        if self._objects is None:
+            if self._factory is None:
+                raise ValueError("OWL objects were not given and no factory is available")
+            self._objects = [self._factory(name) for name in self._names.tolist()]
+        return self._objects
+
+
+def pack_names(names, offsets_dtype=np.int32):
+    """Encodes names into a single UTF-8 buffer, the inverse of :func:`unpack_names`.
+
+    :param names: Names
+    :type names: iterable of str
+    :param offsets_dtype: Type of the offsets. ``org.mowl.PackedStrings`` takes int32 offsets. \
+    Defaults to int32.
+    :type offsets_dtype: :class:`numpy.dtype`, optional
+    :rtype: tuple(:class:`numpy.ndarray` of uint8, :class:`numpy.ndarray` of ``offsets_dtype``)
+    """
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=offsets_dtype)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_names(data, offsets):
+    """Decodes names packed in a single UTF-8 buffer, such as the ``PackedStrings`` objects \
+    returned by ``org.mowl.Signature``. The bytes of name ``i`` are \
+    ``data[offsets[i]:offsets[i + 1]]``.
+
+    :param data: UTF-8 encoded names
+    :type data: bytes or array-like of int8
+    :param offsets: Start of each name in ``data`` followed by the length of ``data``.
+    :type offsets: array-like of int
+    :rtype: list of str
+    """
+    data = data if isinstance(data, bytes) else np.asarray(data).tobytes()
+    offsets = np.asarray(offsets).tolist()
+    text = data.decode("utf-8")
+
+    if len(text) != len(data):
+        # Non-ASCII names: byte offsets do not match character offsets.
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+    return [text[start:end] for start, end in zip(offsets, offsets[1:])]
@@ -44,3 +44,10 @@ class OWLAPIAdapter():
         if not isinstance(iri, str):
             raise TypeError(f"IRI must be a string to use this method. {err.OWLAPI_DIRECT}")
         return self.data_factory.getOWLClass(IRI.create(iri))
+
+    def create_object_property(self, iri):
+        """Creates and OWL object property given a valid IRI string"""
+
+        if not isinstance(iri, str):
+            raise TypeError(f"IRI must be a string to use this method. {err.OWLAPI_DIRECT}")
+        return self.data_factory.getOWLObjectProperty(IRI.create(iri))
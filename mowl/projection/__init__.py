@@ -1,5 +1,19 @@
 from .edge import Edge
-from .dl2vec.model import DL2VecProjector
-from .owl2vec_star.model import OWL2VecStarProjector
-from .taxonomy.model import TaxonomyProjector
-from .taxonomy_rels.model import TaxonomyWithRelsProjector
+from .edge_table import EdgeTable
+
+_PROJECTORS = {
+    "DL2VecProjector": "mowl.projection.dl2vec.model",
+    "OWL2VecStarProjector": "mowl.projection.owl2vec_star.model",
+    "TaxonomyProjector": "mowl.projection.taxonomy.model",
+    "TaxonomyWithRelsProjector": "mowl.projection.taxonomy_rels.model",
+    "MultiProjector": "mowl.projection.multi",
+}
+
+
+def __getattr__(name):
+    # Projectors use the OWLAPI and need a running JVM. They are imported on first access so that
+    # edges can be used without starting the JVM.
+    if name in _PROJECTORS:
+        import importlib
+        return getattr(importlib.import_module(_PROJECTORS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
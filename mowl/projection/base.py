@@ -1,5 +1,7 @@
 from mowl.projection.edge import Edge
 
+import numpy as np
+
 
 class ProjectionModel():
     """
@@ -16,8 +18,78 @@ class ProjectionModel():
         '''
         Performs the ontology parsing.
 
-        :returns: A list of triples where each triple is of the form :math:`(head, relation, tail)`
-        :rtype: List of :class:`mowl.projection.edge.Edge`
+        :returns: A table of triples where each triple is of the form \
+        :math:`(head, relation, tail)`. Iterating over it yields \
+        :class:`mowl.projection.edge.Edge` objects.
+        :rtype: :class:`mowl.projection.edge_table.EdgeTable`
         '''
 
         raise NotImplementedError()
+
+    def _axiom_projector(self):
+        from org.mowl.Projectors import AxiomProjector
+
+        projector = getattr(self, "projector", None)
+        if not isinstance(projector, AxiomProjector):
+            raise NotImplementedError(
+                f"{type(self).__name__} does not record the axiom that produced each edge")
+        return projector
+
+    def project_with_provenance(self, ontology):
+        '''
+        Performs the ontology parsing and records the axiom that produced each edge in \
+        :attr:`EdgeTable.provenance <mowl.projection.edge_table.EdgeTable.provenance>`. The \
+        edges are the same as the ones of :meth:`project`. Only projectors whose edges derive \
+        from individual axioms implement this method.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge_table.EdgeTable`
+        '''
+        from mowl.projection.edge_table import EdgeTable
+
+        return EdgeTable.from_java(self._axiom_projector().projectWithProvenance(ontology))
+
+    def project_delta(self, ontology, added_axioms, removed_axioms, previous_edges):
+        '''
+        Updates a previous projection after a change of the ontology. The edges produced by \
+        the removed axioms are dropped and the edges of the added axioms are appended, so the \
+        result has the same edges as projecting the changed ontology, although not \
+        necessarily in the same order. Axioms that were already projected are not added again.
+
+        :param ontology: The changed ontology.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :param added_axioms: Axioms added to the ontology
+        :type added_axioms: iterable of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :param removed_axioms: Axioms removed from the ontology
+        :type removed_axioms: iterable of :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :param previous_edges: Projection of the ontology before the change, returned by \
+        :meth:`project_with_provenance` or :meth:`project_delta`.
+        :type previous_edges: :class:`mowl.projection.edge_table.EdgeTable`
+        :rtype: :class:`mowl.projection.edge_table.EdgeTable`
+        '''
+        from mowl.projection.edge_table import EdgeTable
+        from org.mowl import Provenance
+        from org.semanticweb.owlapi.model import OWLOntology
+        from java.util import ArrayList
+
+        projector = self._axiom_projector()
+        if not isinstance(ontology, OWLOntology):
+            raise TypeError(
+                "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+        if not isinstance(previous_edges, EdgeTable) or previous_edges.provenance is None:
+            raise TypeError("Parameter previous_edges must be an EdgeTable with provenance")
+
+        removedJ = ArrayList()
+        for axiom in removed_axioms:
+            removedJ.add(axiom)
+        addedJ = ArrayList()
+        for axiom in added_axioms:
+            addedJ.add(axiom)
+
+        removed_ids = np.asarray(Provenance.axiomIds(removedJ), dtype=np.int64)
+        kept = previous_edges[~np.isin(previous_edges.provenance, removed_ids)]
+
+        added = EdgeTable.from_java(projector.projectAxioms(addedJ))
+        added = added[~np.isin(added.provenance, kept.provenance)]
+        return EdgeTable.concat([kept, added])
@@ -0,0 +1,220 @@
+"""
+This module contains :class:`ProjectionCache`, a persistent cache of projected graphs. Entries
+are identified by the content fingerprint of the ontology and the parameters of the projector,
+and are evicted in least-recently-used order when the cache exceeds its size limit.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from mowl.datasets.index import pack_names, unpack_names
+from mowl.projection.edge_table import EdgeTable
+from org.mowl import Fingerprint
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".mowl", "projections")
+CACHE_FORMAT_VERSION = 1
+
+PROJECTOR_PARAMETERS = ("taxonomy", "bidirectional_taxonomy", "only_taxonomy",
+                        "include_literals", "relations")
+"""Projector attributes that are part of the cache key. The number of workers is not, since it \
+does not change the projected edges."""
+
+
+def ontology_fingerprint(ontology):
+    """Returns the SHA-256 hexadecimal digest of the sorted axioms in the imports closure of \
+    the ontology. Two ontologies with the same axioms have the same fingerprint regardless of \
+    the order in which they were loaded.
+
+    :param ontology: The ontology
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :rtype: str
+    """
+    return str(Fingerprint.ontology(ontology))
+
+
+class ProjectionCache():
+    """Directory of projected graphs stored as ``.npz`` files with the integer columns of an \
+    :class:`EdgeTable <mowl.projection.edge_table.EdgeTable>` and its vocabularies packed as \
+    UTF-8 bytes. Cache hits are read from disk without calling the projector.
+
+    :param root: Cache directory. Defaults to ``~/.mowl/projections``.
+    :type root: str, optional
+    :param max_size: Maximum size of the cache in bytes. When it is exceeded, the least \
+    recently used entries are removed. Defaults to 1 GiB.
+    :type max_size: int, optional
+    """
+
+    def __init__(self, root=None, max_size=1 << 30):
+
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Optional parameter max_size must be a positive integer")
+
+        self.root = os.path.expanduser(DEFAULT_CACHE_DIR if root is None else root)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, projector, ontology=None, fingerprint=None):
+        """Returns the cache key of a projector and an ontology.
+
+        :param projector: The projector
+        :type projector: :class:`mowl.projection.base.ProjectionModel`
+        :param ontology: The ontology. Not needed if ``fingerprint`` is given.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`, optional
+        :param fingerprint: Fingerprint of the ontology, as returned by \
+        :func:`ontology_fingerprint`. Defaults to ``None``.
+        :type fingerprint: str, optional
+        :rtype: str
+        """
+        if fingerprint is None:
+            if ontology is None:
+                raise ValueError("Either ontology or fingerprint must be given")
+            fingerprint = ontology_fingerprint(ontology)
+
+        params = {}
+        for name in PROJECTOR_PARAMETERS:
+            if hasattr(projector, name):
+                value = getattr(projector, name)
+                params[name] = sorted(value) if name == "relations" else value
+
+        description = {"version": CACHE_FORMAT_VERSION,
+                       "projector": f"{type(projector).__module__}.{type(projector).__name__}",
+                       "params": params, "ontology": fingerprint}
+        text = json.dumps(description, sort_keys=True)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.npz")
+
+    def project(self, projector, ontology, fingerprint=None):
+        """Returns the projection of the ontology, reading it from the cache if it was stored \
+        before. Otherwise, the ontology is projected with ``projector.project`` and the result \
+        is stored.
+
+        :param projector: The projector
+        :type projector: :class:`mowl.projection.base.ProjectionModel`
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :param fingerprint: Fingerprint of the ontology, to avoid computing it again. \
+        Defaults to ``None``.
+        :type fingerprint: str, optional
+        :rtype: :class:`mowl.projection.edge_table.EdgeTable`
+        """
+        key = self.key(projector, ontology, fingerprint=fingerprint)
+        table = self.get(key)
+        if table is not None:
+            return table
+
+        table = EdgeTable.from_edges(projector.project(ontology))
+        self.put(key, table)
+        return table
+
+    def get(self, key):
+        """Returns the table stored under a key, or ``None`` if there is no such entry.
+
+        :param key: Cache key
+        :type key: str
+        :rtype: :class:`mowl.projection.edge_table.EdgeTable`
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                table = EdgeTable(data["src"], data["rel"], data["dst"],
+                                  unpack_names(data["entity_data"].tobytes(),
+                                               data["entity_offsets"]),
+                                  unpack_names(data["relation_data"].tobytes(),
+                                               data["relation_offsets"]),
+                                  weight=data["weight"] if "weight" in data.files else None,
+                                  provenance=data["provenance"] if "provenance" in data.files
+                                  else None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touch(path)
+        return table
+
+    def put(self, key, table):
+        """Stores a table under a key and evicts the least recently used entries if the cache \
+        exceeds its size limit.
+
+        :param key: Cache key
+        :type key: str
+        :param table: Projected graph
+        :type table: :class:`mowl.projection.edge_table.EdgeTable`
+        """
+        os.makedirs(self.root, exist_ok=True)
+        entity_data, entity_offsets = pack_names(table.entities.tolist(), np.int64)
+        relation_data, relation_offsets = pack_names(table.relations.tolist(), np.int64)
+        arrays = {"src": table.src, "rel": table.rel, "dst": table.dst,
+                  "entity_data": entity_data, "entity_offsets": entity_offsets,
+                  "relation_data": relation_data, "relation_offsets": relation_offsets}
+        if table.weight is not None:
+            arrays["weight"] = table.weight
+        if table.provenance is not None:
+            arrays["provenance"] = table.provenance
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        self._touch(path)
+        self._evict(keep=path)
+
+    @staticmethod
+    def _touch(path):
+        # Modification times order the entries for eviction. They are set from time.time_ns
+        # because the file system clock may not distinguish accesses made close together.
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _entries(self):
+        if not os.path.isdir(self.root):
+            return []
+        entries = []
+        for name in os.listdir(self.root):
+            if name.endswith(".npz"):
+                try:
+                    stat = os.stat(os.path.join(self.root, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(self.root, name)))
+        return sorted(entries)
+
+    def _evict(self, keep):
+        entries = self._entries()
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            self.evictions += 1
+
+    @property
+    def stats(self):
+        """Hits, misses and evictions of this object together with the number of entries and \
+        size in bytes of the cache directory.
+
+        :rtype: dict
+        """
+        entries = self._entries()
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(entries), "size": sum(entry[1] for entry in entries)}
+
+    def clear(self):
+        """Removes all the entries of the cache."""
+        for _, _, path in self._entries():
+            os.remove(path)
@@ -2,7 +2,8 @@ from mowl.projection.base import ProjectionModel
 
 from org.mowl.Projectors import DL2VecProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge_table import EdgeTable
+from org.mowl import EncodedEdges
 import logging
 
 
@@ -14,19 +15,24 @@ class DL2VecProjector(ProjectionModel):
     :param bidirectional_taxonomy: If true then per each SubClass edge one SuperClass edge will \
         be generated.
     :type bidirectional_taxonomy: bool
+    :param workers: Number of threads used to project the ontology. The edges are the same \
+        for any number of threads. Defaults to 1.
+    :type workers: int
     '''
 
-    def __init__(self, bidirectional_taxonomy: bool = False):
+    def __init__(self, bidirectional_taxonomy: bool = False, workers: int = 1):
         super().__init__()
 
         if not isinstance(bidirectional_taxonomy, bool):
             raise TypeError("Optional parameter bidirectional_taxonomy must be of type boolean")
-        self.projector = Projector(bidirectional_taxonomy)
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Optional parameter workers must be a positive integer")
+        self.bidirectional_taxonomy = bidirectional_taxonomy
+        self.projector = Projector(bidirectional_taxonomy, workers)
 
     def project(self, ontology):
         if not isinstance(ontology, OWLOntology):
             raise TypeError(
                 "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
         edges = self.projector.project(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return EdgeTable.from_java(EncodedEdges.encode(edges))
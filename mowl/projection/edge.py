@@ -1,7 +1,6 @@
-from pykeen.triples import TriplesFactory
+from operator import attrgetter
+
 from deprecated.sphinx import versionadded, deprecated
-import numpy as np
-import torch as th
 
 
 class Edge:
@@ -68,19 +67,20 @@ class Edge:
     def get_entities_and_relations(edges):
         '''
         :param edges: list of edges
-        :type edges: :class:`Edge`
+        :type edges: :class:`Edge` or :class:`EdgeTable <mowl.projection.edge_table.EdgeTable>`
 
         :returns: Returns a 2-tuple containing the list of entities (heads and tails) and the \
             list of relations
         :rtype: (Set of str, Set of str)
         '''
+        from mowl.projection.edge_table import EdgeTable
+        if isinstance(edges, EdgeTable):
+            return edges.get_entities_and_relations()
 
-        entities = set()
-        relations = set()
-
-        for edge in edges:
-            entities |= {edge.src, edge.dst}
-            relations |= {edge.rel}
+        edges = list(edges)
+        entities = {edge.src for edge in edges}
+        entities.update(edge.dst for edge in edges)
+        relations = {edge.rel for edge in edges}
 
         return (entities, relations)
 
@@ -88,36 +88,43 @@ class Edge:
     def zip(edges):
         return tuple(zip(*[x.astuple() for x in edges]))
 
+    @staticmethod
+    def columns(edges):
+        """Returns the sources, relations, destinations and weights of the edges as four lists.
+
+        :param edges: Edges
+        :type edges: list of :class:`Edge`
+        :rtype: (list of str, list of str, list of str, list of float)
+        """
+        # Attributes are read directly because property calls dominate for large edge lists.
+        return tuple(list(map(attrgetter(name), edges))
+                     for name in ("_src", "_rel", "_dst", "_weight"))
+
     @staticmethod
     @versionadded(version="0.1.0", reason="This method is available to transform graph edges \
         obtained from ontologies into PyKEEN triples.")
     def as_pykeen(edges, create_inverse_triples=True, entity_to_id=None, relation_to_id=None):
         """This method transform a set of edges into an object of the type \
         :class:`pykeen.triples.triples_factory.TriplesFactory`. This method is intended to be \
-        used for PyKEEN methods.
+        used for PyKEEN methods. The edges are converted into an :class:`EdgeTable \
+        <mowl.projection.edge_table.EdgeTable>` and transformed with \
+        :meth:`EdgeTable.as_pykeen <mowl.projection.edge_table.EdgeTable.as_pykeen>`, so \
+        entities and relations without given ids are numbered in sorted order.
+
         :param edges: List of edges.
-        :type edges: list of :class:`Edge`
+        :type edges: list of :class:`Edge` or :class:`EdgeTable \
+        <mowl.projection.edge_table.EdgeTable>`
         :param create_inverse_triple: Whether to create inverse triples. Defaults to ``True``
         :type create_inverse_triple: bool, optional
+        :param entity_to_id: Mapping `entity name --> id`. Defaults to ``None``.
+        :type entity_to_id: dict, optional
+        :param relation_to_id: Mapping `relation name --> id`. Defaults to ``None``.
+        :type relation_to_id: dict, optional
         :rtype: :class:`pykeen.triples.triples_factory.TriplesFactory`
         """
-        if entity_to_id is None or relation_to_id is None:
-            classes, relations = Edge.getEntitiesAndRelations(edges)
-            classes, relations = set(classes), set(relations)
-
-        if entity_to_id is None:
-            entity_to_id = {v: k for k, v in enumerate(list(classes))}
-        if relation_to_id is None:
-            relation_to_id = {v: k for k, v in enumerate(list(relations))}
-
-        def map_edge(edge):
-            return [entity_to_id[edge.src], relation_to_id[edge.rel], entity_to_id[edge.dst]]
-
-        triples = [map_edge(edge) for edge in edges]
-        triples = np.array(triples, dtype=int)
-        tensor_triples = th.tensor(triples)
-
-        triples_factory = TriplesFactory(tensor_triples, entity_to_id=entity_to_id,
-                                         relation_to_id=relation_to_id,
-                                         create_inverse_triples=create_inverse_triples)
-        return triples_factory
+        from mowl.projection.edge_table import EdgeTable
+
+        if not isinstance(edges, EdgeTable):
+            edges = EdgeTable.from_edges(edges)
+        return edges.as_pykeen(create_inverse_triples=create_inverse_triples,
+                               entity_to_id=entity_to_id, relation_to_id=relation_to_id)
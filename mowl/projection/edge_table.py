@@ -0,0 +1,390 @@
+"""
+This module contains :class:`EdgeTable`, the columnar format of the graphs produced by the
+projectors. It does not require the JVM.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+import torch as th
+
+from mowl.projection.edge import Edge
+
+
+class EdgeTable(Sequence):
+    """Edge list stored as integer columns. ``src``, ``rel`` and ``dst`` are int32 arrays of \
+    positions in the ``entities`` and ``relations`` vocabularies, which are shared by all the \
+    edges. :class:`Edge <mowl.projection.edge.Edge>` objects are only created when the table is \
+    iterated or indexed, so an :class:`EdgeTable` can be used where a list of edges was \
+    expected.
+
+    :param src: Source entity of each edge
+    :type src: array-like of int
+    :param rel: Relation of each edge
+    :type rel: array-like of int
+    :param dst: Destination entity of each edge
+    :type dst: array-like of int
+    :param entities: Entity names
+    :type entities: array-like of str
+    :param relations: Relation names
+    :type relations: array-like of str
+    :param weight: Weight of each edge. Defaults to ``None``, in which case all edges have \
+    weight 1.
+    :type weight: array-like of float, optional
+    :param provenance: Identifier of the axiom that produced each edge, as computed by \
+    ``org.mowl.Provenance``. Defaults to ``None``.
+    :type provenance: array-like of int, optional
+    """
+
+    def __init__(self, src, rel, dst, entities, relations, weight=None, provenance=None):
+
+        self._src = np.ascontiguousarray(src, dtype=np.int32)
+        self._rel = np.ascontiguousarray(rel, dtype=np.int32)
+        self._dst = np.ascontiguousarray(dst, dtype=np.int32)
+        self._entities = np.asarray(entities, dtype=str).reshape(-1)
+        self._relations = np.asarray(relations, dtype=str).reshape(-1)
+        self._weight = None if weight is None else np.ascontiguousarray(weight, dtype=np.float32)
+        self._provenance = None if provenance is None else np.ascontiguousarray(provenance,
+                                                                                dtype=np.int64)
+
+        size = len(self._src)
+        if len(self._rel) != size or len(self._dst) != size:
+            raise ValueError("Parameters src, rel and dst must have the same length")
+        if self._weight is not None and len(self._weight) != size:
+            raise ValueError("Optional parameter weight must have the same length as src")
+        if self._provenance is not None and len(self._provenance) != size:
+            raise ValueError("Optional parameter provenance must have the same length as src")
+
+    @classmethod
+    def from_edges(cls, edges):
+        """Creates a table from :class:`Edge <mowl.projection.edge.Edge>` objects.
+
+        :param edges: Edges
+        :type edges: iterable of :class:`Edge <mowl.projection.edge.Edge>`
+        :rtype: :class:`EdgeTable`
+        """
+        if isinstance(edges, EdgeTable):
+            return edges
+
+        src, rel, dst, weight = Edge.columns(list(edges))
+        weight = np.asarray(weight, dtype=np.float32)
+        return cls.from_triples(src, rel, dst, weight=None if (weight == 1).all() else weight)
+
+    @classmethod
+    def from_triples(cls, src, rel, dst, weight=None):
+        """Creates a table from columns of names. Vocabularies are sorted. The columns are \
+        factorized with hash tables, so names are not copied into fixed-width arrays.
+
+        :param src: Source entity names
+        :type src: array-like of str
+        :param rel: Relation names
+        :type rel: array-like of str
+        :param dst: Destination entity names
+        :type dst: array-like of str
+        :param weight: Edge weights. Defaults to ``None``.
+        :type weight: array-like of float, optional
+        :rtype: :class:`EdgeTable`
+        """
+        src = np.asarray(src, dtype=object).reshape(-1)
+        rel = np.asarray(rel, dtype=object).reshape(-1)
+        dst = np.asarray(dst, dtype=object).reshape(-1)
+
+        ids, entities = pd.factorize(np.concatenate([src, dst]), sort=True)
+        rel_ids, relations = pd.factorize(rel, sort=True)
+        return cls(ids[:len(src)], rel_ids, ids[len(src):], entities.astype(str),
+                   relations.astype(str), weight=weight)
+
+    @classmethod
+    def from_java(cls, encoded):
+        """Creates a table from an ``org.mowl.EncodedEdges`` object returned by the gateway.
+
+        :rtype: :class:`EdgeTable`
+        """
+        from mowl.datasets.index import unpack_names
+
+        entities = encoded.entities()
+        relations = encoded.relations()
+        weight = encoded.weight()
+        provenance = encoded.provenance()
+        return cls(np.asarray(encoded.src()), np.asarray(encoded.rel()),
+                   np.asarray(encoded.dst()),
+                   unpack_names(entities.data(), entities.offsets()),
+                   unpack_names(relations.data(), relations.offsets()),
+                   weight=None if weight is None else np.asarray(weight),
+                   provenance=None if provenance is None else np.asarray(provenance))
+
+    def to_java(self):
+        """Creates an ``org.mowl.EncodedEdges`` object with the columns and vocabularies of the \
+        table, which is how the walkers take their edges. Columns are passed to the JVM as \
+        direct buffers and names are packed into a single UTF-8 buffer, so no name is hashed \
+        once per edge. Provenance is not passed.
+
+        :rtype: ``org.mowl.EncodedEdges``
+        """
+        from jpype.nio import convertToDirectBuffer
+        from org.mowl import EncodedEdges, PackedStrings
+        from mowl.datasets.index import pack_names
+
+        def packed(names):
+            data, offsets = pack_names(names.tolist())
+            return PackedStrings.fromBuffers(convertToDirectBuffer(data),
+                                             convertToDirectBuffer(offsets))
+
+        weight = None if self._weight is None else convertToDirectBuffer(self._weight)
+        return EncodedEdges.fromBuffers(convertToDirectBuffer(self._src),
+                                        convertToDirectBuffer(self._rel),
+                                        convertToDirectBuffer(self._dst), weight,
+                                        packed(self._entities), packed(self._relations))
+
+    @property
+    def src(self):
+        """Source entity index of each edge.
+
+        :rtype: :class:`numpy.ndarray` of int32
+        """
+        return self._src
+
+    @property
+    def rel(self):
+        """Relation index of each edge.
+
+        :rtype: :class:`numpy.ndarray` of int32
+        """
+        return self._rel
+
+    @property
+    def dst(self):
+        """Destination entity index of each edge.
+
+        :rtype: :class:`numpy.ndarray` of int32
+        """
+        return self._dst
+
+    @property
+    def weight(self):
+        """Weight of each edge or ``None`` if all edges have weight 1.
+
+        :rtype: :class:`numpy.ndarray` of float32
+        """
+        return self._weight
+
+    @property
+    def provenance(self):
+        """Identifier of the axiom that produced each edge or ``None`` if the projection did not \
+        record it.
+
+        :rtype: :class:`numpy.ndarray` of int64
+        """
+        return self._provenance
+
+    @property
+    def entities(self):
+        """Entity vocabulary.
+
+        :rtype: :class:`numpy.ndarray` of str
+        """
+        return self._entities
+
+    @property
+    def relations(self):
+        """Relation vocabulary.
+
+        :rtype: :class:`numpy.ndarray` of str
+        """
+        return self._relations
+
+    def __len__(self):
+        return len(self._src)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            weight = 1. if self._weight is None else float(self._weight[key])
+            return Edge(str(self._entities[self._src[key]]), str(self._relations[self._rel[key]]),
+                        str(self._entities[self._dst[key]]), weight=weight)
+        return self._take(key)
+
+    def __iter__(self):
+        entities = self._entities.tolist()
+        relations = self._relations.tolist()
+        weights = [1.] * len(self) if self._weight is None else self._weight.tolist()
+        for s, r, d, w in zip(self._src.tolist(), self._rel.tolist(), self._dst.tolist(),
+                              weights):
+            yield Edge(entities[s], relations[r], entities[d], weight=w)
+
+    def __add__(self, other):
+        if isinstance(other, EdgeTable):
+            return EdgeTable.concat([self, other])
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return f"EdgeTable({len(self)} edges, {len(self._entities)} entities, \
+{len(self._relations)} relations)"
+
+    def _take(self, key):
+        weight = None if self._weight is None else self._weight[key]
+        provenance = None if self._provenance is None else self._provenance[key]
+        return EdgeTable(self._src[key], self._rel[key], self._dst[key], self._entities,
+                         self._relations, weight=weight, provenance=provenance)
+
+    @staticmethod
+    def concat(tables):
+        """Concatenates tables, merging their vocabularies. The result keeps the provenance of \
+        the edges only if all the tables have it.
+
+        :param tables: Tables to concatenate
+        :type tables: list of :class:`EdgeTable`
+        :rtype: :class:`EdgeTable`
+        """
+        tables = list(tables)
+        entities, entity_ids = np.unique(np.concatenate([t.entities for t in tables]),
+                                         return_inverse=True)
+        relations, relation_ids = np.unique(np.concatenate([t.relations for t in tables]),
+                                            return_inverse=True)
+
+        src, rel, dst, weight = [], [], [], []
+        entity_start = relation_start = 0
+        for table in tables:
+            entity_map = entity_ids[entity_start:entity_start + len(table.entities)]
+            relation_map = relation_ids[relation_start:relation_start + len(table.relations)]
+            entity_start += len(table.entities)
+            relation_start += len(table.relations)
+
+            src.append(entity_map[table.src])
+            rel.append(relation_map[table.rel])
+            dst.append(entity_map[table.dst])
+            weight.append(np.ones(len(table), dtype=np.float32) if table.weight is None
+                          else table.weight)
+
+        has_weights = any(table.weight is not None for table in tables)
+        provenance = None
+        if all(table.provenance is not None for table in tables):
+            provenance = np.concatenate([table.provenance for table in tables])
+        return EdgeTable(np.concatenate(src), np.concatenate(rel), np.concatenate(dst), entities,
+                         relations, weight=np.concatenate(weight) if has_weights else None,
+                         provenance=provenance)
+
+    def astuples(self):
+        """Returns the edges as tuples of names.
+
+        :rtype: list of (str, str, str)
+        """
+        return list(zip(self._entities[self._src].tolist(),
+                        self._relations[self._rel].tolist(),
+                        self._entities[self._dst].tolist()))
+
+    def get_entities_and_relations(self):
+        """Returns the entities and relations used by the edges, as \
+        :meth:`Edge.get_entities_and_relations \
+        <mowl.projection.edge.Edge.get_entities_and_relations>` does.
+
+        :rtype: (set of str, set of str)
+        """
+        entity_ids = np.unique(np.concatenate([self._src, self._dst]))
+        relation_ids = np.unique(self._rel)
+        return (set(self._entities[entity_ids].tolist()),
+                set(self._relations[relation_ids].tolist()))
+
+    def deduplicate(self):
+        """Removes repeated edges, keeping the first occurrence of each one. Edges with the \
+        same entities and relation but different weight are considered repeated.
+
+        :rtype: :class:`EdgeTable`
+        """
+        if len(self) == 0:
+            return self
+        columns = np.stack([self._src, self._rel, self._dst], axis=1)
+        _, first = np.unique(columns, axis=0, return_index=True)
+        return self._take(np.sort(first))
+
+    def filter_relations(self, relations, keep=True):
+        """Selects the edges by relation.
+
+        :param relations: Relation names
+        :type relations: iterable of str
+        :param keep: If ``True``, keep the edges with the given relations. Otherwise, remove \
+        them. Defaults to ``True``.
+        :type keep: bool, optional
+        :rtype: :class:`EdgeTable`
+        """
+        selected = np.isin(self._relations, np.asarray(list(relations), dtype=str))
+        mask = selected[self._rel]
+        return self._take(mask if keep else ~mask)
+
+    def remove_empty(self):
+        """Removes the edges whose destination entity is the empty string, such as the ones \
+        produced for literals without value.
+
+        :rtype: :class:`EdgeTable`
+        """
+        empty = self._entities == ""
+        if not empty.any():
+            return self
+        return self._take(~empty[self._dst])
+
+    def as_pykeen(self, create_inverse_triples=True, entity_to_id=None, relation_to_id=None):
+        """Transforms the table into a :class:`pykeen.triples.triples_factory.TriplesFactory`, \
+        as :meth:`Edge.as_pykeen <mowl.projection.edge.Edge.as_pykeen>` does. Names are mapped \
+        once per vocabulary entry instead of once per edge and the triples are written into a \
+        single int64 array that is shared with the tensor given to PyKEEN.
+
+        :param create_inverse_triple: Whether to create inverse triples. Defaults to ``True``
+        :type create_inverse_triple: bool, optional
+        :param entity_to_id: Mapping `entity name --> id`. It is passed to PyKEEN without being \
+        copied. Defaults to ``None``, in which case the entities of the table are given ids in \
+        sorted order.
+        :type entity_to_id: dict, optional
+        :param relation_to_id: Mapping `relation name --> id`. It is passed to PyKEEN without \
+        being copied. Defaults to ``None``, in which case the relations of the table are given \
+        ids in sorted order.
+        :type relation_to_id: dict, optional
+        :rtype: :class:`pykeen.triples.triples_factory.TriplesFactory`
+        """
+        from pykeen.triples import TriplesFactory
+
+        if entity_to_id is None:
+            entity_map, entity_to_id = self._sorted_ids(self._entities, self._src, self._dst)
+        else:
+            entity_map = self._map_vocabulary(self._entities, entity_to_id)
+        if relation_to_id is None:
+            relation_map, relation_to_id = self._sorted_ids(self._relations, self._rel)
+        else:
+            relation_map = self._map_vocabulary(self._relations, relation_to_id)
+
+        missing = np.concatenate([self._src[entity_map[self._src] < 0],
+                                  self._dst[entity_map[self._dst] < 0]])
+        missing_relations = self._rel[relation_map[self._rel] < 0]
+        if len(missing) > 0 or len(missing_relations) > 0:
+            names = self._entities[missing].tolist() + self._relations[missing_relations].tolist()
+            raise KeyError(f"Names not found in the id mappings: {names[:5]}")
+
+        triples = np.empty((len(self), 3), dtype=np.int64)
+        np.take(entity_map, self._src, out=triples[:, 0], mode="clip")
+        np.take(relation_map, self._rel, out=triples[:, 1], mode="clip")
+        np.take(entity_map, self._dst, out=triples[:, 2], mode="clip")
+
+        return TriplesFactory(th.from_numpy(triples), entity_to_id=entity_to_id,
+                              relation_to_id=relation_to_id,
+                              create_inverse_triples=create_inverse_triples)
+
+    @staticmethod
+    def _sorted_ids(vocabulary, *columns):
+        """Gives ids to the vocabulary entries used in the columns in sorted order. Returns the \
+        id of each vocabulary position, -1 for unused ones, and the mapping `name --> id`."""
+        used = np.zeros(len(vocabulary), dtype=bool)
+        for column in columns:
+            used[column] = True
+        used = np.flatnonzero(used)
+        names = vocabulary[used]
+        order = np.argsort(names, kind="stable")
+        vocabulary_map = np.full(len(vocabulary), -1, dtype=np.int64)
+        vocabulary_map[used[order]] = np.arange(len(used), dtype=np.int64)
+        return vocabulary_map, dict(zip(names[order].tolist(), range(len(used))))
+
+    @staticmethod
+    def _map_vocabulary(vocabulary, name_to_id):
+        return np.fromiter((name_to_id.get(name, -1) for name in vocabulary.tolist()),
+                           dtype=np.int64, count=len(vocabulary))
@@ -0,0 +1,82 @@
+from mowl.projection.base import ProjectionModel
+from mowl.projection.edge_table import EdgeTable
+from mowl.projection.factory import projector_factory
+from mowl.projection.owl2vec_star.model import OWL2VecStarProjector
+from mowl.datasets.index import unpack_names
+
+from org.mowl.Projectors import MultiProjector as Projector
+from org.semanticweb.owlapi.model import OWLOntology
+from java.util import ArrayList
+
+import numpy as np
+
+
+class MultiProjector(ProjectionModel):
+    '''
+    Projects an ontology with several projectors in a single traversal of its axioms. \
+    Projectors are created with :func:`projector_factory \
+    <mowl.projection.factory.projector_factory>` from their configurations.
+
+    Each table contains the same edges as the ``project`` method of the corresponding \
+    projector. All the tables share the same ``entities`` and ``relations`` vocabularies, \
+    which may contain names that are not used by the edges of a table.
+
+    :param configs: Projector configurations. Each configuration is either a method name in \
+        :attr:`PARSING_METHODS <mowl.projection.factory.PARSING_METHODS>` or a dictionary with \
+        the method name in the ``"method"`` key and keyword arguments of \
+        :func:`projector_factory <mowl.projection.factory.projector_factory>` in the other keys.
+    :type configs: list of str or dict
+    '''
+
+    def __init__(self, configs):
+        super().__init__()
+
+        if isinstance(configs, (str, dict)) or not hasattr(configs, "__iter__"):
+            raise TypeError("Parameter configs must be a list of method names or dictionaries")
+
+        self.configs = []
+        for config in configs:
+            config = {"method": config} if isinstance(config, str) else dict(config)
+            if "method" not in config:
+                raise ValueError("Projector configurations must have the key 'method'")
+            self.configs.append(config)
+
+        self.projectors = []
+        for config in self.configs:
+            kwargs = {k: v for k, v in config.items() if k != "method"}
+            self.projectors.append(projector_factory(config["method"], **kwargs))
+
+        projectorsJ = ArrayList()
+        for projector in self.projectors:
+            projectorsJ.add(projector.projector)
+        self.projector = Projector(projectorsJ)
+
+    def project(self, ontology):
+        """Projects the ontology with all the configured projectors.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :returns: One table per configuration, in the order of the configurations.
+        :rtype: list of :class:`mowl.projection.edge_table.EdgeTable`
+        """
+        if not isinstance(ontology, OWLOntology):
+            raise TypeError(
+                "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+
+        encoded = self.projector.project(ontology)
+        if len(encoded) == 0:
+            return []
+
+        entities = encoded[0].entities()
+        relations = encoded[0].relations()
+        entities = np.asarray(unpack_names(entities.data(), entities.offsets()), dtype=str)
+        relations = np.asarray(unpack_names(relations.data(), relations.offsets()), dtype=str)
+
+        tables = []
+        for projector, edges in zip(self.projectors, encoded):
+            table = EdgeTable(np.asarray(edges.src()), np.asarray(edges.rel()),
+                              np.asarray(edges.dst()), entities, relations)
+            if isinstance(projector, OWL2VecStarProjector):
+                table = table.remove_empty()
+            tables.append(table)
+        return tables
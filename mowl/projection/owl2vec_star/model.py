@@ -1,5 +1,6 @@
 from mowl.projection.base import ProjectionModel
-from mowl.projection.edge import Edge
+from mowl.projection.edge_table import EdgeTable
+from org.mowl import EncodedEdges
 from org.mowl.Projectors import OWL2VecStarProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
 
@@ -17,9 +18,13 @@ class OWL2VecStarProjector(ProjectionModel):
     :type include_literals: bool
     :param only_taxonomy: If true, the projection will only include subClass edges
     :type only_taxonomy: bool
+    :param workers: Number of threads used to project the ontology. The edges are the same \
+        for any number of threads. Defaults to 1.
+    :type workers: int
     '''
 
-    def __init__(self, bidirectional_taxonomy=False, only_taxonomy=False, include_literals=False):
+    def __init__(self, bidirectional_taxonomy=False, only_taxonomy=False, include_literals=False,
+                 workers=1):
         super().__init__()
 
         if not isinstance(bidirectional_taxonomy, bool):
@@ -28,20 +33,32 @@ class OWL2VecStarProjector(ProjectionModel):
             raise TypeError("Optional parameter only_taxonomy must be of type boolean")
         if not isinstance(include_literals, bool):
             raise TypeError("Optional parameter include_literals must be of type boolean")
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Optional parameter workers must be a positive integer")
 
         self.bidirectional_taxonomy = bidirectional_taxonomy
         self.include_literals = include_literals
         self.only_taxonomy = only_taxonomy
         self.projector = Projector(self.bidirectional_taxonomy, self.only_taxonomy,
-                                   self.include_literals)
+                                   self.include_literals, workers)
 
     def project(self, ontology):
         if not isinstance(ontology, OWLOntology):
             raise TypeError(
                 "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
         edges = self.projector.project(ontology)
+        return EdgeTable.from_java(EncodedEdges.encode(edges)).remove_empty()
 
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in
-                 edges if str(e.dst()) != ""]
+    @property
+    def annotation_index_stats(self):
+        """Size of the annotation index built by the last call to ``project`` when \
+        ``include_literals`` is true. The index groups the annotation assertions of the ontology \
+        by subject IRI. The dictionary has the number of ``subjects``, annotation ``axioms`` and \
+        lexical ``edges`` in the index and its approximate size in ``bytes``.
 
-        return edges
+        :rtype: dict or None
+        """
+        stats = self.projector.annotationIndexStats()
+        if stats is None:
+            return None
+        return {str(key): int(value) for key, value in stats.items()}
@@ -2,7 +2,8 @@ from mowl.projection.base import ProjectionModel
 
 from org.mowl.Projectors import TaxonomyProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge_table import EdgeTable
+from org.mowl import EncodedEdges
 
 
 class TaxonomyProjector(ProjectionModel):
@@ -14,19 +15,23 @@ class TaxonomyProjector(ProjectionModel):
     :param ontology: The ontology to be processed.
     :param bidirectional_taxonomy: If true then per each SubClass edge one SuperClass edge will \
         be generated.
+    :param workers: Number of threads used to project the ontology. The edges are the same \
+        for any number of threads. Defaults to 1.
+    :type workers: int
     '''
 
-    def __init__(self, bidirectional_taxonomy: bool = False):
+    def __init__(self, bidirectional_taxonomy: bool = False, workers: int = 1):
         super().__init__()
 
-        self.projector = Projector(bidirectional_taxonomy)
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Optional parameter workers must be a positive integer")
+        self.bidirectional_taxonomy = bidirectional_taxonomy
+        self.projector = Projector(bidirectional_taxonomy, workers)
 
     def project(self, ontology):
         edges = self.projector.project(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return EdgeTable.from_java(EncodedEdges.encode(edges))
 
     def projectWithTransClosure(self, ontology):
         edges = self.projector.projectWithTransClosure(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return EdgeTable.from_java(EncodedEdges.encode(edges))
@@ -1,6 +1,7 @@
 from org.mowl.Projectors import TaxonomyWithRelsProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge_table import EdgeTable
+from org.mowl import EncodedEdges
 
 from mowl.projection.base import ProjectionModel
 
@@ -21,19 +22,28 @@ class TaxonomyWithRelsProjector(ProjectionModel):
     :param ontology: The ontology to be processed.
     :param bidirectional_taxonomy: If true then per each SubClass edge one SuperClass edge will \
         be generated.
+    :param workers: Number of threads used to project the ontology. The edges are the same \
+        for any number of threads. Defaults to 1.
+    :type workers: int
     '''
 
-    def __init__(self, taxonomy=False, bidirectional_taxonomy: bool = False, relations=None):
+    def __init__(self, taxonomy=False, bidirectional_taxonomy: bool = False, relations=None,
+                 workers: int = 1):
         super().__init__()
 
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Optional parameter workers must be a positive integer")
+
         relations = [] if relations is None else relations
+        self.taxonomy = taxonomy
+        self.bidirectional_taxonomy = bidirectional_taxonomy
+        self.relations = list(relations)
         relationsJ = ArrayList()
         for r in relations:
             relationsJ.add(r)
 
-        self.projector = Projector(taxonomy, bidirectional_taxonomy, relationsJ)
+        self.projector = Projector(taxonomy, bidirectional_taxonomy, relationsJ, workers)
 
     def project(self, ontology):
         edges = self.projector.project(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return EdgeTable.from_java(EncodedEdges.encode(edges))
@@ -1,3 +1,5 @@
 from .deepwalk.model import DeepWalk
 from .node2vec.model import Node2Vec
 from .factory import walker_factory
+from .corpus import Walks, WalkCorpus, walk_files
+from .output import merge_walk_shards
@@ -0,0 +1,196 @@
+import json
+import os
+
+import numpy as np
+
+MANIFEST_SUFFIX = ".manifest.json"
+OFFSETS_SUFFIX = ".offsets"
+VOCABULARY_SUFFIX = ".vocab"
+WALKS_FORMATS = ["text", "binary"]
+BLOCK_SIZE = 65536
+
+
+def manifest_path(outfile):
+    """Path of the manifest that lists the shards of the walks written to ``outfile``.
+
+    :param outfile: Output file of a walker.
+    :type outfile: str
+    :rtype: str
+    """
+    return outfile + MANIFEST_SUFFIX
+
+
+def _find_manifest(path):
+    if path.endswith(MANIFEST_SUFFIX):
+        return path
+    if os.path.exists(manifest_path(path)):
+        return manifest_path(path)
+    return None
+
+
+def _read_manifest(manifest):
+    with open(manifest, "r") as f:
+        return json.load(f)
+
+
+def walk_files(path):
+    """Files that contain the walks stored at ``path``.
+
+    ``path`` can be a single file of walks, the manifest of a set of shards or the output file \
+    of a walker that was run with ``concatenate=False``, in which case the shards are listed in \
+    ``path + ".manifest.json"``. When both exist, the manifest takes precedence.
+
+    :param path: Walks file, manifest or output file of a walker.
+    :type path: str
+    :rtype: list of str
+    """
+    if not isinstance(path, str):
+        raise TypeError("Parameter path must be a string")
+
+    manifest = _find_manifest(path)
+    if manifest is None:
+        if os.path.isfile(path):
+            return [path]
+        raise FileNotFoundError(f"No walks found at {path}")
+
+    shards = _read_manifest(manifest)["shards"]
+    directory = os.path.dirname(manifest)
+    files = [os.path.join(directory, shard["path"]) for shard in shards]
+    for file_ in files:
+        if not os.path.isfile(file_):
+            raise FileNotFoundError(f"Shard {file_} listed in {manifest} does not exist")
+    return files
+
+
+class Walks():
+    """Walks stored in a single file or in a set of shards, as lists of tokens.
+
+    The object can be iterated several times, so it can be given as the ``sentences`` of a \
+    :class:`gensim.models.Word2Vec` model.
+
+    :param path: Walks file, manifest or output file of a walker. See :func:`walk_files`.
+    :type path: str
+    """
+
+    def __init__(self, path):
+        self.files = walk_files(path)
+        manifest = _find_manifest(path)
+        if manifest is not None and _read_manifest(manifest)["format"] != "text":
+            raise ValueError(f"Walks at {path} are not in text format. Use WalkCorpus instead")
+
+    def __iter__(self):
+        for file_ in self.files:
+            with open(file_, "r", encoding="utf-8") as f:
+                for line in f:
+                    yield line.split()
+
+
+class WalkCorpus():
+    """Walks written with ``walks_format="binary"``, memory-mapped.
+
+    The ids of the walks are stored as little-endian int32 in ``path``, the int64 offsets of \
+    the walks in ``path + ".offsets"`` and the name of each id, one per line, in \
+    ``path + ".vocab"``. Walk ``i`` is made of the ids at positions ``offsets[i]`` until \
+    ``offsets[i + 1]``. Shards listed in a manifest are read as a single corpus.
+
+    Iterating over the corpus yields each walk as a list of names, so it can be given as the \
+    ``sentences`` of a :class:`gensim.models.Word2Vec` model. Indexing returns the ids of a walk \
+    as a NumPy array without copying it.
+
+    :param path: Output file of a walker or manifest of its shards.
+    :type path: str
+    """
+
+    def __init__(self, path):
+        if not isinstance(path, str):
+            raise TypeError("Parameter path must be a string")
+
+        manifest = _find_manifest(path)
+        if manifest is None:
+            vocabulary = path + VOCABULARY_SUFFIX
+            shards = [(path, path + OFFSETS_SUFFIX)]
+        else:
+            content = _read_manifest(manifest)
+            if content["format"] != "binary":
+                raise ValueError(f"Walks at {path} are not in binary format. Use Walks instead")
+            directory = os.path.dirname(manifest)
+            vocabulary = os.path.join(directory, content["vocabulary"])
+            shards = [(os.path.join(directory, shard["path"]),
+                       os.path.join(directory, shard["offsets"]))
+                      for shard in content["shards"]]
+
+        for file_ in [vocabulary] + [f for shard in shards for f in shard]:
+            if not os.path.isfile(file_):
+                raise FileNotFoundError(f"No binary walks found at {path}: {file_} is missing")
+
+        with open(vocabulary, "r", encoding="utf-8") as f:
+            self.vocabulary = f.read().splitlines()
+
+        self._ids = [_memmap(ids, "<i4") for ids, _ in shards]
+        self._offsets = [_memmap(offsets, "<i8") for _, offsets in shards]
+        self._first = np.cumsum([0] + [len(offsets) - 1 for offsets in self._offsets])
+
+    def __len__(self):
+        return int(self._first[-1])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Walk {index} out of range")
+        shard = int(np.searchsorted(self._first, index, side="right")) - 1
+        offsets = self._offsets[shard]
+        local = index - self._first[shard]
+        return self._ids[shard][offsets[local]:offsets[local + 1]]
+
+    @property
+    def num_tokens(self):
+        """Number of ids in all walks.
+
+        :rtype: int
+        """
+        return sum(len(ids) for ids in self._ids)
+
+    def counts(self):
+        """Number of occurrences of each id in the walks, indexed by id. The dictionary \
+        ``dict(zip(corpus.vocabulary, corpus.counts().tolist()))`` can be given to \
+        :meth:`gensim.models.Word2Vec.build_vocab_from_freq`.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        counts = np.zeros(len(self.vocabulary), dtype=np.int64)
+        for ids in self._ids:
+            for start in range(0, len(ids), BLOCK_SIZE * 64):
+                counts += np.bincount(ids[start:start + BLOCK_SIZE * 64], minlength=len(counts))
+        return counts
+
+    def _blocks(self):
+        # Walks are read in blocks so that the offsets of a block are converted to Python
+        # integers at once without holding those of the whole corpus.
+        for ids, offsets in zip(self._ids, self._offsets):
+            for first in range(0, len(offsets) - 1, BLOCK_SIZE):
+                bounds = offsets[first:first + BLOCK_SIZE + 1].tolist()
+                yield ids[bounds[0]:bounds[-1]], [bound - bounds[0] for bound in bounds]
+
+    def walk_ids(self):
+        """Iterates over the walks as NumPy arrays of ids.
+
+        :rtype: iterator of :class:`numpy.ndarray`
+        """
+        for ids, bounds in self._blocks():
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                yield ids[start:end]
+
+    def __iter__(self):
+        vocabulary = self.vocabulary
+        for ids, bounds in self._blocks():
+            tokens = [vocabulary[i] for i in ids.tolist()]
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                yield tokens[start:end]
+
+
+def _memmap(path, dtype):
+    # NumPy cannot map empty files.
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
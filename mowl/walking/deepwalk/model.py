@@ -1,12 +1,9 @@
 from mowl.walking.walking import WalkingModel
+from mowl.projection.edge_table import EdgeTable
+from mowl.walking.vectorized import VectorizedDeepWalk
 import random
 import os
 import logging
-from org.mowl.Walking import DeepWalk as DW
-from java.util import HashMap
-from java.util import ArrayList
-from org.mowl import Edge
-from mowl.projection.edge import Edge as PyEdge
 from deprecated.sphinx import versionchanged
 
 logging.basicConfig(level=logging.INFO)
@@ -29,8 +26,14 @@ class DeepWalk(WalkingModel):
                  alpha=0.,
                  outfile=None,
                  workers=1,
+                 concatenate=True,
+                 walks_format="text",
+                 seed=None,
+                 backend="jvm"
                  ):
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         concatenate=concatenate, walks_format=walks_format, seed=seed,
+                         backend=backend)
 
         # Type checking
         if not isinstance(alpha, float):
@@ -39,26 +42,26 @@ class DeepWalk(WalkingModel):
 
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
     focus on when generating the random walks.")
-    def walk(self, edges, nodes_of_interest=None):
-        if nodes_of_interest is None:
-            nodes_of_interest = ArrayList()
-        else:
-            all_nodes, _ = PyEdge.get_entities_and_relations(edges)
-            all_nodes = set(all_nodes)
-            python_nodes = nodes_of_interest[:]
-            nodes_of_interest = ArrayList()
-            for node in python_nodes:
-                if node in all_nodes:
-                    nodes_of_interest.add(node)
-                else:
-                    logger.info(f"Node {node} does not exist in the graph. Ignoring it.")
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None):
+        walker = self._walker(edges, nodes_of_interest, start_nodes)
+        walker.walk()
+        self._report(walker, logger)
 
-        edgesJ = ArrayList()
-        for edge in edges:
-            newEdge = Edge(edge.src, edge.rel, edge.dst)
-            edgesJ.add(newEdge)
+    def _parameters(self):
+        return {"alpha": self.alpha}
 
-        walker = DW(edgesJ, self.num_walks, self.walk_length, self.alpha, self.workers,
-                    self.outfile, nodes_of_interest)
+    def _walker(self, edges, nodes_of_interest, start_nodes=None):
+        edges = EdgeTable.from_edges(edges)
+        if self.backend == "numpy":
+            return VectorizedDeepWalk(edges, self.num_walks, self.walk_length, self.alpha,
+                                      self.outfile, **self._numpy_options(
+                                          edges, logger, nodes_of_interest, start_nodes))
 
-        walker.walk()
+        from org.mowl.Walking import DeepWalk as DW
+        nodes_of_interest, start_nodes = self._java_nodes(edges, logger, nodes_of_interest,
+                                                          start_nodes)
+
+        walker = DW(edges.to_java(), self.num_walks, self.walk_length, self.alpha, self.workers,
+                    self.outfile, nodes_of_interest, self.concatenate,
+                    self.walks_format, self._java_seed(), start_nodes)
+        return walker
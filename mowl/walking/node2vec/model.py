@@ -1,15 +1,15 @@
 from mowl.walking.walking import WalkingModel
+from mowl.projection.edge_table import EdgeTable
+from mowl.walking.vectorized import VectorizedNode2Vec
 import logging
 import tempfile
-from java.util import ArrayList
-from org.mowl import Edge
-from org.mowl.Walking import Node2Vec as N2V
-from mowl.projection.edge import Edge as PyEdge
 from deprecated.sphinx import versionchanged
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("node2vec")
 
+SAMPLERS = ["alias", "rejection"]
+
 
 class Node2Vec(WalkingModel):
 
@@ -18,6 +18,12 @@ class Node2Vec(WalkingModel):
     :type p: float
     :param q: In-out hyperparameter. Default is 1.
     :type q: float
+    :param sampler: Method to draw the steps after the first one. ``"alias"`` precomputes an \
+        alias table for every edge, which needs memory proportional to the sum of the squared \
+        degrees of the graph. ``"rejection"`` draws candidates from the neighbors of the current \
+        node and accepts them according to ``p`` and ``q``, without edge tables. When ``p`` and \
+        ``q`` are 1, both samplers draw neighbors directly. Default is ``"alias"``.
+    :type sampler: str, optional
     '''
 
     def __init__(self,
@@ -26,39 +32,68 @@ class Node2Vec(WalkingModel):
                  p=1.,
                  q=1.,
                  outfile=None,
-                 workers=1
+                 workers=1,
+                 sampler="alias",
+                 concatenate=True,
+                 walks_format="text",
+                 seed=None,
+                 backend="jvm"
                  ):
 
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         concatenate=concatenate, walks_format=walks_format, seed=seed,
+                         backend=backend)
 
         # Type checking
         if not isinstance(p, float):
             raise TypeError("Optional parameter p must be a float")
         if not isinstance(q, float):
             raise TypeError("Optional parameter q must be a float")
+        if sampler not in SAMPLERS:
+            raise ValueError(f"Optional parameter sampler must be one of {SAMPLERS}")
         self.p = p
         self.q = q
+        self.sampler = sampler
+        self._preprocessing_stats = None
+
+    @property
+    def preprocessing_stats(self):
+        """Statistics of the alias tables built by the last call to ``walk``. The dictionary \
+        has the number of ``nodes`` and ``edges`` with an alias table, the ``milliseconds`` \
+        it took to build them, their size in ``bytes`` and, with the JVM backend, the \
+        ``peak_heap_bytes`` of the JVM while they were built. The NumPy backend does not build \
+        node tables when all edges have the same weight.
+
+        :rtype: dict or None
+        """
+        return self._preprocessing_stats
 
-    def walk(self, edges, nodes_of_interest=None):
-        if nodes_of_interest is None:
-            nodes_of_interest = ArrayList()
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None):
+        walker = self._walker(edges, nodes_of_interest, start_nodes)
+        walker.walk()
+        self._report(walker, logger)
+        if self.backend == "numpy":
+            self._preprocessing_stats = dict(walker.preprocessing_stats)
         else:
-            all_nodes, _ = PyEdge.getEntitiesAndRelations(edges)
-            all_nodes = set(all_nodes)
-            python_nodes = nodes_of_interest[:]
-            nodes_of_interest = ArrayList()
-            for node in python_nodes:
-                if node in all_nodes:
-                    nodes_of_interest.add(node)
-                else:
-                    logger.info(f"Node {node} does not exist in the graph. Ignoring it.")
+            stats = walker.preprocessingStats()
+            self._preprocessing_stats = {str(key): int(value) for key, value in stats.items()}
+        logger.debug(f"Preprocessing: {self._preprocessing_stats}")
 
-        edgesJ = ArrayList()
-        for edge in edges:
-            newEdge = Edge(edge.src, edge.rel, edge.dst, edge.weight)
-            edgesJ.add(newEdge)
+    def _parameters(self):
+        return {"p": self.p, "q": self.q, "sampler": self.sampler}
 
-        walker = N2V(edgesJ, self.num_walks, self.walk_length, self.p, self.q, self.workers,
-                     self.outfile, nodes_of_interest)
+    def _walker(self, edges, nodes_of_interest, start_nodes=None):
+        edges = EdgeTable.from_edges(edges)
+        if self.backend == "numpy":
+            return VectorizedNode2Vec(edges, self.num_walks, self.walk_length, self.p, self.q,
+                                      self.sampler, self.outfile, **self._numpy_options(
+                                          edges, logger, nodes_of_interest, start_nodes))
 
-        walker.walk()
+        from org.mowl.Walking import Node2Vec as N2V
+        nodes_of_interest, start_nodes = self._java_nodes(edges, logger, nodes_of_interest,
+                                                          start_nodes)
+
+        walker = N2V(edges.to_java(), self.num_walks, self.walk_length, self.p, self.q,
+                     self.workers, self.outfile, nodes_of_interest, self.sampler, self.concatenate,
+                     self.walks_format, self._java_seed(), start_nodes)
+        return walker
@@ -0,0 +1,304 @@
+"""
+This module writes random walks in the formats of the walkers of the JVM, so that walks generated
+in Python are read with :class:`mowl.walking.corpus.Walks` and
+:class:`mowl.walking.corpus.WalkCorpus` like any other, and merges the shards of walks generated
+by several processes. It does not require the JVM.
+"""
+
+import filecmp
+import glob
+import json
+import os
+import shutil
+import zlib
+
+import numpy as np
+
+from mowl.walking.corpus import manifest_path, MANIFEST_SUFFIX, OFFSETS_SUFFIX, \
+    VOCABULARY_SUFFIX, WALKS_FORMATS
+
+# Parameters that all the shards of a set must share.
+SHARD_PARAMETERS = ["num_shards", "seed", "walker", "backend", "num_walks", "walk_length",
+                    "parameters"]
+
+
+def shard_path(outfile, index):
+    """Path of shard ``index`` of the walks written to ``outfile``.
+
+    :param outfile: Output file of a walker.
+    :type outfile: str
+    :param index: Shard index.
+    :type index: int
+    :rtype: str
+    """
+    return f"{outfile}.part-{index:04d}"
+
+
+def walk_shard_path(outfile, shard_id):
+    """Path of the walks of shard ``shard_id`` written by \
+    :meth:`mowl.walking.walking.WalkingModel.walk_shard`.
+
+    :param outfile: Output file of the merged walks.
+    :type outfile: str
+    :param shard_id: Shard index.
+    :type shard_id: int
+    :rtype: str
+    """
+    return f"{outfile}.shard-{shard_id:04d}"
+
+
+def shard_of(node, num_shards):
+    """Shard of the walks that start from ``node``. The shard depends only on the name of the \
+    node, so every process assigns nodes to the same shards.
+
+    :param node: Node name.
+    :type node: str
+    :param num_shards: Number of shards.
+    :type num_shards: int
+    :rtype: int
+    """
+    return zlib.crc32(node.encode("utf-8")) % num_shards
+
+
+def write_manifest(outfile, walks_format, shards):
+    """Writes the manifest that lists the shards of the walks written to ``outfile``. The \
+    manifest is written to a temporary file first, so readers never see a partial manifest.
+
+    :param outfile: Output file of a walker.
+    :type outfile: str
+    :param walks_format: Format of the shards, ``"text"`` or ``"binary"``.
+    :type walks_format: str
+    :param shards: Path of each shard relative to the directory of ``outfile``, with its \
+        number of ``walks`` and ``tokens``.
+    :type shards: list of dict
+    """
+    manifest = {"format": walks_format}
+    if walks_format == "binary":
+        manifest["vocabulary"] = os.path.basename(outfile) + VOCABULARY_SUFFIX
+    manifest["walks"] = sum(shard["walks"] for shard in shards)
+    manifest["shards"] = []
+    for shard in shards:
+        entry = {"path": shard["path"]}
+        if walks_format == "binary":
+            entry["offsets"] = shard["path"] + OFFSETS_SUFFIX
+        entry["walks"] = shard["walks"]
+        entry["tokens"] = shard["tokens"]
+        manifest["shards"].append(entry)
+
+    _write_json(manifest_path(outfile), manifest)
+
+
+def write_shard_metadata(outfile, metadata):
+    """Adds the parameters of a shard of \
+    :meth:`mowl.walking.walking.WalkingModel.walk_shard` to the manifest of its walks, under the \
+    key ``"shard"``.
+
+    :param outfile: Output file of the shard.
+    :type outfile: str
+    :param metadata: Parameters of the shard.
+    :type metadata: dict
+    """
+    path = manifest_path(outfile)
+    with open(path, "r") as f:
+        manifest = json.load(f)
+    manifest["shard"] = metadata
+    _write_json(path, manifest)
+
+
+def _write_json(path, data):
+    with open(path + ".tmp", "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+
+
+class WalkWriter():
+    """Walks written to the shards ``outfile.part-0000``, ``outfile.part-0001``, ... as the \
+    walkers of the JVM write them. Text shards have one walk per line with the names of its ids \
+    separated by spaces. Binary shards have the ids of the walks as little-endian int32 and \
+    their int64 offsets in ``shard + ".offsets"``, and the names of the ids are written to \
+    ``outfile + ".vocab"``. When the writer is closed, the shards are either concatenated into \
+    ``outfile`` or listed in ``outfile + ".manifest.json"``.
+
+    :param outfile: Output file.
+    :type outfile: str
+    :param names: Name of each id.
+    :type names: list of str
+    :param num_shards: Number of shards.
+    :type num_shards: int
+    :param concatenate: Whether to concatenate the shards into ``outfile``.
+    :type concatenate: bool
+    :param walks_format: ``"text"`` or ``"binary"``.
+    :type walks_format: str
+    """
+
+    def __init__(self, outfile, names, num_shards, concatenate=True, walks_format="text"):
+        if walks_format not in WALKS_FORMATS:
+            raise ValueError(f"Optional parameter walks_format must be one of {WALKS_FORMATS}")
+
+        self.outfile = outfile
+        self.names = np.asarray(names, dtype=object)
+        self.concatenate = concatenate
+        self.walks_format = walks_format
+        self.binary = walks_format == "binary"
+        self.paths = [shard_path(outfile, i) for i in range(num_shards)]
+        self.walks = [0] * num_shards
+        self.tokens = [0] * num_shards
+        self._files = [open(path, "wb") for path in self.paths]
+        self._offsets = None
+        if self.binary:
+            self._offsets = [open(path + OFFSETS_SUFFIX, "wb") for path in self.paths]
+            for f in self._offsets:
+                np.zeros(1, dtype="<i8").tofile(f)
+
+    def write(self, shard, ids, offsets):
+        """Appends a batch of walks to a shard. Walk ``i`` of the batch is \
+        ``ids[offsets[i]:offsets[i + 1]]``.
+
+        :param shard: Shard index.
+        :type shard: int
+        :param ids: Ids of the walks.
+        :type ids: :class:`numpy.ndarray`
+        :param offsets: Start of each walk in ``ids`` followed by the length of ``ids``.
+        :type offsets: :class:`numpy.ndarray`
+        """
+        num_walks = len(offsets) - 1
+        if num_walks == 0:
+            return
+        if self.binary:
+            np.asarray(ids, dtype="<i4").tofile(self._files[shard])
+            ends = np.asarray(offsets[1:], dtype="<i8") - offsets[0]
+            (ends + self.tokens[shard]).tofile(self._offsets[shard])
+        else:
+            tokens = self.names[ids].tolist()
+            bounds = (np.asarray(offsets) - offsets[0]).tolist()
+            lines = [" ".join(tokens[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+            self._files[shard].write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.walks[shard] += num_walks
+        self.tokens[shard] += int(offsets[-1] - offsets[0])
+
+    def close(self):
+        """Closes the shards and concatenates them or writes their manifest."""
+        for f in self._files + (self._offsets or []):
+            f.close()
+
+        if self.binary:
+            with open(self.outfile + VOCABULARY_SUFFIX, "w", encoding="utf-8") as f:
+                for name in self.names.tolist():
+                    f.write(name + "\n")
+
+        if self.concatenate:
+            self._concatenate()
+            if os.path.exists(manifest_path(self.outfile)):
+                os.remove(manifest_path(self.outfile))
+        else:
+            write_manifest(self.outfile, self.walks_format, [
+                {"path": os.path.basename(path), "walks": walks, "tokens": tokens}
+                for path, walks, tokens in zip(self.paths, self.walks, self.tokens)])
+
+    def _concatenate(self):
+        with open(self.outfile, "wb") as out:
+            for path in self.paths:
+                with open(path, "rb") as f:
+                    shutil.copyfileobj(f, out)
+                os.remove(path)
+
+        if self.binary:
+            with open(self.outfile + OFFSETS_SUFFIX, "wb") as out:
+                np.zeros(1, dtype="<i8").tofile(out)
+                base = 0
+                for path, tokens in zip(self.paths, self.tokens):
+                    # The first offset of every shard is 0.
+                    offsets = np.fromfile(path + OFFSETS_SUFFIX, dtype="<i8")[1:]
+                    (offsets + base).tofile(out)
+                    os.remove(path + OFFSETS_SUFFIX)
+                    base += tokens
+
+
+def merge_walk_shards(outfile, num_shards=None):
+    """Lists the walks of the shards written by \
+    :meth:`mowl.walking.walking.WalkingModel.walk_shard` in ``outfile + ".manifest.json"``, so \
+    that they are read with :class:`mowl.walking.corpus.Walks` and \
+    :class:`mowl.walking.corpus.WalkCorpus` as the walks of a single run. The shards are not \
+    copied. The shards must be complete, have been generated with the same parameters and \
+    their files must have the sizes recorded in their manifests.
+
+    :param outfile: Output file of the merged walks, as given to ``walk_shard``.
+    :type outfile: str
+    :param num_shards: Expected number of shards. If ``None``, it is read from the shards.
+    :type num_shards: int, optional
+    :rtype: str
+    :return: Path of the manifest.
+    """
+    if not isinstance(outfile, str):
+        raise TypeError("Parameter outfile must be a string")
+    if num_shards is not None and (not isinstance(num_shards, int) or num_shards <= 0):
+        raise TypeError("Optional parameter num_shards must be a positive integer")
+
+    shards = {}
+    for path in sorted(glob.glob(glob.escape(outfile) + ".shard-*" + MANIFEST_SUFFIX)):
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        if "shard" not in manifest:
+            raise ValueError(f"{path} is not the manifest of a walk shard")
+        manifest["path"] = path
+        shards[manifest["shard"]["shard_id"]] = manifest
+    if not shards:
+        raise FileNotFoundError(f"No walk shards found for {outfile}")
+
+    first = shards[min(shards)]
+    if num_shards is None:
+        num_shards = first["shard"]["num_shards"]
+    missing = sorted(set(range(num_shards)) - set(shards))
+    if missing:
+        raise ValueError(f"Missing walk shards {missing} of {num_shards}")
+    for shard_id, manifest in sorted(shards.items()):
+        for key in SHARD_PARAMETERS:
+            if manifest["shard"][key] != first["shard"][key]:
+                raise ValueError(f"Shard {shard_id} was generated with {key}="
+                                 f"{manifest['shard'][key]!r}, but shard "
+                                 f"{first['shard']['shard_id']} with {first['shard'][key]!r}")
+        if manifest["format"] != first["format"]:
+            raise ValueError(f"Shard {shard_id} has format {manifest['format']!r}, but shard "
+                             f"{first['shard']['shard_id']} has format {first['format']!r}")
+        if shard_id >= num_shards:
+            raise ValueError(f"Shard {shard_id} is not one of {num_shards} shards")
+
+    walks_format = first["format"]
+    directory = os.path.dirname(outfile)
+    vocabulary = None
+    entries = []
+    for shard_id in range(num_shards):
+        manifest = shards[shard_id]
+        shard_directory = os.path.dirname(manifest["path"])
+        # Shards without start nodes have no files.
+        if walks_format == "binary" and manifest["shards"]:
+            shard_vocabulary = os.path.join(shard_directory, manifest["vocabulary"])
+            if vocabulary is None:
+                vocabulary = shard_vocabulary
+            elif not filecmp.cmp(vocabulary, shard_vocabulary, shallow=False):
+                raise ValueError(f"Shard {shard_id} has a different vocabulary from the other "
+                                 f"shards")
+        for part in manifest["shards"]:
+            path = os.path.join(shard_directory, part["path"])
+            _check_size(path, 4 * part["tokens"] if walks_format == "binary" else None)
+            if walks_format == "binary":
+                _check_size(path + OFFSETS_SUFFIX, 8 * (part["walks"] + 1))
+            entries.append({"path": os.path.relpath(path, directory or "."),
+                            "walks": part["walks"], "tokens": part["tokens"]})
+
+    if walks_format == "binary":
+        if vocabulary is None:
+            open(outfile + VOCABULARY_SUFFIX, "w").close()
+        else:
+            shutil.copyfile(vocabulary, outfile + VOCABULARY_SUFFIX)
+    write_manifest(outfile, walks_format, entries)
+    return manifest_path(outfile)
+
+
+def _check_size(path, size):
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Shard file {path} does not exist")
+    if size is not None and os.path.getsize(path) != size:
+        raise ValueError(f"Shard file {path} has {os.path.getsize(path)} bytes instead of "
+                         f"{size}")
@@ -0,0 +1,93 @@
+import numpy as np
+
+from mowl.walking.vectorized import VectorizedWalker
+
+
+class WalkStream():
+    """Walks generated while they are consumed, without writing them to disk.
+
+    Each iteration runs the walker again: its workers push batches of walks into a bounded \
+    queue in the JVM while the walks are taken from it, so walk generation overlaps with the \
+    consumer. Workers wait while the queue is full, so at most ``queue_size`` batches plus one \
+    batch per worker are held in memory. If iteration stops early, the workers are stopped.
+
+    Since :class:`gensim.models.Word2Vec` iterates once to build the vocabulary and once per \
+    epoch, every pass sees a new set of walks.
+
+    With ``backend="numpy"``, batches are generated in the consuming thread when they are \
+    requested, so there is no queue.
+
+    Instances are created with :meth:`mowl.walking.walking.WalkingModel.stream`.
+
+    :param walker: Walker of the JVM or of :mod:`mowl.walking.vectorized`.
+    :param queue_size: Maximum number of batches waiting to be consumed.
+    :type queue_size: int
+    :param batch_size: Number of walks per batch.
+    :type batch_size: int
+    :param as_ids: If ``True``, walks are yielded as NumPy arrays of ids, whose names are in \
+        :attr:`vocabulary`. Otherwise, they are yielded as lists of names.
+    :type as_ids: bool
+    """
+
+    def __init__(self, walker, queue_size, batch_size, as_ids=False):
+        self._walker = walker
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.as_ids = as_ids
+        self._vocabulary = None
+
+    @property
+    def vocabulary(self):
+        """Names of the ids of the walks.
+
+        :rtype: list of str
+        """
+        if self._vocabulary is None:
+            if isinstance(self._walker, VectorizedWalker):
+                self._vocabulary = list(self._walker.vocabulary)
+            else:
+                self._vocabulary = [str(name) for name in self._walker.graph().names()]
+        return self._vocabulary
+
+    def batches(self):
+        """Iterates over the batches of walks of a new run of the walker. Each batch is a pair \
+        of NumPy arrays ``(ids, offsets)``, where walk ``i`` is \
+        ``ids[offsets[i]:offsets[i + 1]]``.
+
+        :rtype: iterator of tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+        if isinstance(self._walker, VectorizedWalker):
+            yield from self._walker.batches(self.batch_size)
+            return
+
+        queue = self._walker.stream(self.queue_size, self.batch_size)
+        finished = False
+        try:
+            while True:
+                batch = queue.take()
+                if batch is None:
+                    break
+                size = batch.size()
+                offsets = np.asarray(batch.offsets())[:size + 1]
+                ids = np.asarray(batch.ids())[:offsets[-1]]
+                yield ids, offsets
+
+            error = queue.errorMessage()
+            if error is not None:
+                raise RuntimeError(f"Walk generation failed: {error}")
+            finished = True
+        finally:
+            if not finished:
+                queue.cancel()
+
+    def __iter__(self):
+        vocabulary = self.vocabulary
+        for ids, offsets in self.batches():
+            bounds = offsets.tolist()
+            if self.as_ids:
+                for start, end in zip(bounds[:-1], bounds[1:]):
+                    yield ids[start:end]
+            else:
+                tokens = [vocabulary[i] for i in ids.tolist()]
+                for start, end in zip(bounds[:-1], bounds[1:]):
+                    yield tokens[start:end]
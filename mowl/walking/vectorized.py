@@ -0,0 +1,590 @@
+"""
+This module generates random walks with NumPy, without the JVM. The graph is kept in compressed
+sparse row arrays as in ``org.mowl.Walking.Graph``, and a batch of walks advances in lockstep: each
+step samples the next edge of every walk of the batch with a few vectorized operations. The walks
+are written with :class:`mowl.walking.output.WalkWriter` in the formats of the walkers of the JVM.
+
+It is used by :class:`mowl.walking.DeepWalk` and :class:`mowl.walking.Node2Vec` with
+``backend="numpy"``.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from mowl.walking.output import WalkWriter
+
+GAMMA = np.uint64(0x9E3779B97F4A7C15)
+BATCH_SIZE = 8192
+# Entries of the edge alias tables built at once, which bounds the memory of the temporary arrays.
+ALIAS_CHUNK_SIZE = 1 << 22
+
+
+def splitmix64(values):
+    """Mixing function of the SplitMix64 generator, applied to each element.
+
+    :param values: Values to mix.
+    :type values: :class:`numpy.ndarray` of uint64
+    :rtype: :class:`numpy.ndarray` of uint64
+    """
+    z = np.atleast_1d(np.asarray(values, dtype=np.uint64))
+    with np.errstate(over="ignore"):
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def walk_keys(seed, walk_round, nodes):
+    """Keys of the random number streams of the walks of a round that start from ``nodes``. A \
+    walk depends only on the seed, its round and its start node, and not on how walks are split \
+    into batches or workers.
+
+    :param seed: Seed of the walker.
+    :type seed: int
+    :param walk_round: Index of the round, from 0 to ``num_walks - 1``.
+    :type walk_round: int
+    :param nodes: Start nodes.
+    :type nodes: :class:`numpy.ndarray` of int
+    :rtype: :class:`numpy.ndarray` of uint64
+    """
+    nodes = np.asarray(nodes, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        round_key = splitmix64(splitmix64(np.uint64(seed % 2**64)) + np.uint64(walk_round) * GAMMA)
+        return splitmix64(round_key + nodes * GAMMA)
+
+
+class WalkRandom():
+    """Counter-based random numbers of a batch of walks. Number ``t`` of walk ``i`` is the \
+    SplitMix64 output ``splitmix64(keys[i] + (t + 1) * GAMMA)``, which is the ``t``-th output of \
+    a SplitMix64 generator seeded with ``keys[i]``. Each walk draws only as many numbers as it \
+    needs.
+
+    :param keys: Key of each walk.
+    :type keys: :class:`numpy.ndarray` of uint64
+    """
+
+    def __init__(self, keys):
+        self.keys = np.asarray(keys, dtype=np.uint64)
+        self.counters = np.zeros(len(self.keys), dtype=np.uint64)
+
+    def next(self, walks):
+        """Next number of each walk in ``walks``.
+
+        :rtype: :class:`numpy.ndarray` of uint64
+        """
+        self.counters[walks] += np.uint64(1)
+        with np.errstate(over="ignore"):
+            return splitmix64(self.keys[walks] + self.counters[walks] * GAMMA)
+
+    def uniform(self, walks):
+        """Uniform float in [0, 1) for each walk in ``walks``.
+
+        :rtype: :class:`numpy.ndarray` of float64
+        """
+        return (self.next(walks) >> np.uint64(11)) * (1.0 / 2**53)
+
+    def integers(self, walks, high):
+        """Uniform integer in [0, ``high``) for each walk in ``walks``.
+
+        :rtype: :class:`numpy.ndarray` of int64
+        """
+        return np.minimum((self.uniform(walks) * high).astype(np.int64), high - 1)
+
+
+def ranges(starts, sizes):
+    """Concatenation of the ranges ``starts[i]`` until ``starts[i] + sizes[i]``.
+
+    :rtype: :class:`numpy.ndarray` of int64
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    total = int(sizes.sum())
+    ends = np.cumsum(sizes)
+    shifts = np.asarray(starts, dtype=np.int64) - (ends - sizes)
+    return np.arange(total, dtype=np.int64) + np.repeat(shifts, sizes)
+
+
+def alias_tables(probs, sizes):
+    """Builds the alias tables of consecutive distributions with Vose's method, advancing all \
+    the tables in lockstep. Table ``i`` has ``sizes[i]`` outcomes, all sizes are positive and \
+    the unnormalized probabilities of the tables are concatenated in ``probs``.
+
+    An outcome ``k`` of table ``i`` is drawn by choosing ``k`` uniformly and keeping it with \
+    probability ``q[start + k]``, where ``start`` is the position of the table, or taking \
+    ``J[start + k]`` otherwise.
+
+    :param probs: Unnormalized probabilities.
+    :type probs: :class:`numpy.ndarray` of float
+    :param sizes: Number of outcomes of each table.
+    :type sizes: :class:`numpy.ndarray` of int
+    :rtype: tuple(:class:`numpy.ndarray` of int32, :class:`numpy.ndarray` of float32)
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.int64)
+    starts = np.cumsum(sizes) - sizes
+    table = np.repeat(np.arange(len(sizes)), sizes)
+    q = probs * np.repeat(sizes / np.add.reduceat(probs, starts), sizes)
+    # Outcomes that are never paired keep themselves.
+    J = np.arange(len(q), dtype=np.int64) - np.repeat(starts, sizes)
+
+    # Stacks of outcomes with probability smaller and larger than 1 / K. The stacks of table i
+    # start at starts[i].
+    small = q < 1
+    stacks = []
+    lengths = []
+    for mask in (small, ~small):
+        outcomes = np.flatnonzero(mask)
+        counts = np.bincount(table[outcomes], minlength=len(sizes))
+        stack = np.empty(len(q), dtype=np.int64)
+        stack[ranges(starts, counts)] = outcomes
+        stacks.append(stack)
+        lengths.append(counts)
+    smaller, larger = stacks
+    small_len, large_len = lengths
+
+    active = np.flatnonzero((small_len > 0) & (large_len > 0))
+    while len(active) > 0:
+        small_len[active] -= 1
+        large_len[active] -= 1
+        s = smaller[starts[active] + small_len[active]]
+        l = larger[starts[active] + large_len[active]]  # noqa: E741
+        J[s] = l - starts[active]
+        q[l] = q[l] + q[s] - 1
+
+        to_small = q[l] < 1
+        tables = active[to_small]
+        smaller[starts[tables] + small_len[tables]] = l[to_small]
+        small_len[tables] += 1
+        tables = active[~to_small]
+        larger[starts[tables] + large_len[tables]] = l[~to_small]
+        large_len[tables] += 1
+
+        active = active[(small_len[active] > 0) & (large_len[active] > 0)]
+
+    return J.astype(np.int32), q.astype(np.float32)
+
+
+class CSRGraph():
+    """Directed multigraph in compressed sparse row layout. The edges leaving node ``i`` are at \
+    positions ``offsets[i]`` until ``offsets[i + 1]`` of ``neighbors``, ``relations`` and \
+    ``weights``. Nodes and relations share the ids of ``names``, as in \
+    ``org.mowl.Walking.Graph``.
+    """
+
+    def __init__(self, names, offsets, neighbors, relations, weights, sorted_neighbors):
+        self.names = names
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.relations = relations
+        self.weights = weights
+        self.sorted_neighbors = sorted_neighbors
+        self.degree = np.diff(offsets)
+        self._keys = None
+
+    @classmethod
+    def from_table(cls, table, extra_names=(), sort_neighbors=False):
+        """Builds the graph of an edge table. Entities keep their ids and are followed by the \
+        relations and ``extra_names`` that are not entities. With ``sort_neighbors``, the edges \
+        of each row are sorted by destination, keeping the order of the table for equal \
+        destinations.
+
+        :param table: Edges.
+        :type table: :class:`mowl.projection.edge_table.EdgeTable`
+        :param extra_names: Names added to the graph without edges.
+        :type extra_names: list of str
+        :param sort_neighbors: Whether to sort the rows by destination.
+        :type sort_neighbors: bool
+        :rtype: :class:`CSRGraph`
+        """
+        entities = table.entities.tolist()
+        ids = {name: i for i, name in enumerate(entities)}
+        names = list(entities)
+        for name in table.relations.tolist() + list(extra_names):
+            if name not in ids:
+                ids[name] = len(names)
+                names.append(name)
+        relation_ids = np.array([ids[name] for name in table.relations.tolist()], dtype=np.int32)
+
+        src, dst = table.src, table.dst
+        if sort_neighbors:
+            order = np.lexsort((dst, src))
+        else:
+            order = np.argsort(src, kind="stable")
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(names)), out=offsets[1:])
+        weights = np.ones(len(src), dtype=np.float32) if table.weight is None else table.weight
+        return cls(names, offsets, dst[order], relation_ids[table.rel[order]], weights[order],
+                   sort_neighbors)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.neighbors)
+
+    @property
+    def nodes(self):
+        """Ids that are the source or the destination of an edge, in increasing order.
+
+        :rtype: :class:`numpy.ndarray` of int64
+        """
+        is_node = self.degree > 0
+        is_node[self.neighbors] = True
+        return np.flatnonzero(is_node)
+
+    def has_edge(self, src, dst):
+        """Whether there is an edge from each node of ``src`` to the node of ``dst`` at the same \
+        position. Requires sorted neighbors.
+
+        :rtype: :class:`numpy.ndarray` of bool
+        """
+        if self._keys is None:
+            # Rows sorted by destination make the keys sorted.
+            sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.degree)
+            self._keys = sources * self.num_nodes + self.neighbors
+        queries = np.asarray(src, dtype=np.int64) * self.num_nodes + dst
+        if self.num_edges == 0:
+            return np.zeros(len(queries), dtype=bool)
+        positions = np.minimum(np.searchsorted(self._keys, queries), self.num_edges - 1)
+        return self._keys[positions] == queries
+
+
+class VectorizedWalker():
+    """Random walker that advances batches of walks in lockstep. Subclasses implement \
+    :meth:`_step`. The parameters are the ones of :class:`mowl.walking.walking.WalkingModel`.
+
+    The walks are split between ``workers`` shards as in the walkers of the JVM, but the shards \
+    are generated one after another. Each walk draws from its own random number stream, keyed \
+    by the seed, its round and its start node as in the walkers of the JVM, so the same seed \
+    gives the same walks for any number of workers, batch size or subset of start nodes. Walks \
+    of a round are ordered by their key.
+    """
+
+    def __init__(self, graph, num_walks, walk_length, outfile, workers=1, nodes_of_interest=None,
+                 concatenate=True, walks_format="text", seed=None, start_nodes=None,
+                 batch_size=BATCH_SIZE):
+        self.graph = graph
+        self.num_walks = num_walks
+        self.walk_length = walk_length
+        self.outfile = outfile
+        self.concatenate = concatenate
+        self.walks_format = walks_format
+        self.seed = int.from_bytes(os.urandom(8), "little") if seed is None else seed
+        self.batch_size = batch_size
+        self.walks_per_second = []
+
+        ids = None
+        if start_nodes or nodes_of_interest:
+            ids = {name: i for i, name in enumerate(graph.names)}
+
+        self.start_nodes = graph.nodes
+        if start_nodes:
+            selected = np.zeros(graph.num_nodes, dtype=bool)
+            selected[[ids[name] for name in start_nodes]] = True
+            self.start_nodes = self.start_nodes[selected[self.start_nodes]]
+
+        self.interest = None
+        if nodes_of_interest:
+            self.interest = np.zeros(len(graph.names), dtype=bool)
+            self.interest[[ids[name] for name in nodes_of_interest]] = True
+
+        self.rounds = self._rounds_per_worker(num_walks, workers)
+
+    @property
+    def vocabulary(self):
+        """Names of the ids of the walks.
+
+        :rtype: list of str
+        """
+        return self.graph.names
+
+    @staticmethod
+    def _rounds_per_worker(num_walks, workers):
+        """Rounds of each worker, split as ``Walker.numPathsPerWorker`` does."""
+        num_workers = max(min(num_walks, workers), 1)
+        counts = [num_walks // num_workers + (i >= num_workers - num_walks % num_workers)
+                  for i in range(num_workers)]
+        starts = np.cumsum([0] + counts)
+        return [range(starts[i], starts[i + 1]) for i in range(num_workers)]
+
+    def preprocess(self):
+        """Precomputes what the steps need. Called before the first walk."""
+
+    def walk(self):
+        """Writes the walks to ``outfile``."""
+        self.preprocess()
+        writer = WalkWriter(self.outfile, self.graph.names, len(self.rounds),
+                            concatenate=self.concatenate, walks_format=self.walks_format)
+        self.walks_per_second = []
+        for shard, rounds in enumerate(self.rounds):
+            start = time.perf_counter()
+            for ids, offsets in self._batches(rounds):
+                writer.write(shard, ids, offsets)
+            seconds = time.perf_counter() - start
+            self.walks_per_second.append(len(rounds) * len(self.start_nodes) / max(seconds, 1e-9))
+        writer.close()
+
+    def batches(self, batch_size=None):
+        """Generates the walks of all the rounds in batches of ``batch_size`` walks. Each batch \
+        is a pair of arrays ``(ids, offsets)``, where walk ``i`` is \
+        ``ids[offsets[i]:offsets[i + 1]]``. Walks without nodes of interest are left out.
+
+        :rtype: iterator of tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+        self.preprocess()
+        return self._batches(range(self.num_walks), batch_size or self.batch_size)
+
+    def _batches(self, rounds, batch_size=None):
+        batch_size = batch_size or self.batch_size
+        for walk_round in rounds:
+            keys = walk_keys(self.seed, walk_round, self.start_nodes)
+            order = np.argsort(keys, kind="stable")
+            for begin in range(0, len(order), batch_size):
+                batch = order[begin:begin + batch_size]
+                yield self._walk_batch(self.start_nodes[batch], keys[batch])
+
+    def _walk_batch(self, starts, keys):
+        graph = self.graph
+        size = len(starts)
+        walks = np.zeros((size, 2 * self.walk_length - 1), dtype=np.int32)
+        walks[:, 0] = starts
+        lengths = np.ones(size, dtype=np.int64)
+        rand = WalkRandom(keys)
+        state = {
+            "start": starts.astype(np.int64),
+            "current": starts.astype(np.int64),
+            "previous": np.full(size, -1, dtype=np.int64),
+            "last_edge": np.full(size, -1, dtype=np.int64),
+        }
+
+        active = np.arange(size)
+        for step in range(1, self.walk_length):
+            active = active[graph.degree[state["current"][active]] > 0]
+            if len(active) == 0:
+                break
+            relations, nodes, edges = self._step(step, active, state, rand)
+            walks[active, 2 * step - 1] = relations
+            walks[active, 2 * step] = nodes
+            state["previous"][active] = state["current"][active]
+            state["current"][active] = nodes
+            state["last_edge"][active] = edges
+            lengths[active] = 2 * step + 1
+
+        valid = np.arange(walks.shape[1]) < lengths[:, None]
+        if self.interest is not None:
+            keep = (self.interest[walks] & valid).any(axis=1)
+            valid = valid[keep]
+            walks = walks[keep]
+            lengths = lengths[keep]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return walks[valid], offsets
+
+    def _step(self, step, active, state, rand):
+        """Samples the next step of the walks ``active``. ``state`` has the ``start``, \
+        ``current`` and ``previous`` node and the ``last_edge`` of every walk of the batch, with \
+        -1 before the first step. Returns the relation and node ids of the step and the edge it \
+        follows, or -1 if it is not an edge of the graph."""
+        raise NotImplementedError()
+
+
+class VectorizedDeepWalk(VectorizedWalker):
+    """DeepWalk with restarts to the start node with probability ``alpha``, as \
+    ``org.mowl.Walking.DeepWalk``.
+
+    :param table: Edges.
+    :type table: :class:`mowl.projection.edge_table.EdgeTable`
+    :param alpha: Probability of restart.
+    :type alpha: float
+    """
+
+    restart_token = "*****"
+
+    def __init__(self, table, num_walks, walk_length, alpha, outfile, **kwargs):
+        graph = CSRGraph.from_table(table, [self.restart_token], sort_neighbors=False)
+        super().__init__(graph, num_walks, walk_length, outfile, **kwargs)
+        self.alpha = alpha
+        self.restart_id = graph.names.index(self.restart_token)
+
+    def _step(self, step, active, state, rand):
+        graph = self.graph
+        current = state["current"][active]
+        restart = rand.uniform(active) < self.alpha
+        edges = graph.offsets[current] + rand.integers(active, graph.degree[current])
+        relations = np.where(restart, self.restart_id, graph.relations[edges])
+        nodes = np.where(restart, state["start"][active], graph.neighbors[edges])
+        return relations, nodes, np.where(restart, -1, edges)
+
+
+class VectorizedNode2Vec(VectorizedWalker):
+    """Node2Vec with return parameter ``p`` and in-out parameter ``q``, as \
+    ``org.mowl.Walking.Node2Vec``. The first step of each walk is drawn from the alias table of \
+    its node. With the ``"alias"`` sampler, later steps are drawn from the alias table of the \
+    last edge. With the ``"rejection"`` sampler, they are drawn from the table of the node and \
+    accepted with probability proportional to their second-order factor. Alias tables are stored \
+    in flat arrays: node tables at the positions of the rows of the graph and edge tables one \
+    after another, in the order of the edges. Parallel edges share their table.
+
+    :param table: Edges.
+    :type table: :class:`mowl.projection.edge_table.EdgeTable`
+    :param p: Return parameter.
+    :type p: float
+    :param q: In-out parameter.
+    :type q: float
+    :param sampler: ``"alias"`` or ``"rejection"``.
+    :type sampler: str
+    """
+
+    def __init__(self, table, num_walks, walk_length, p, q, sampler, outfile, **kwargs):
+        graph = CSRGraph.from_table(table, sort_neighbors=True)
+        super().__init__(graph, num_walks, walk_length, outfile, **kwargs)
+        self.p = p
+        self.q = q
+        self.first_order = p == 1 and q == 1
+        self.rejection = sampler == "rejection"
+        self.use_edge_tables = not self.first_order and not self.rejection
+        self.max_factor = max(1 / p, 1., 1 / q)
+        self.preprocessing_stats = None
+        self._node_J = self._node_q = None
+        self._edge_start = self._edge_J = self._edge_q = None
+
+    def _hops(self):
+        """Hops from the closest start node to each node, up to ``walk_length - 2``, or None \
+        when walks start from every node. Other nodes are -1."""
+        graph = self.graph
+        if len(self.start_nodes) == len(graph.nodes):
+            return None
+        hops = np.full(graph.num_nodes, -1, dtype=np.int64)
+        frontier = self.start_nodes
+        hops[frontier] = 0
+        depth = 0
+        while len(frontier) > 0 and depth < self.walk_length - 2:
+            depth += 1
+            neighbors = graph.neighbors[ranges(graph.offsets[frontier], graph.degree[frontier])]
+            frontier = np.unique(neighbors[hops[neighbors] == -1])
+            hops[frontier] = depth
+        return hops
+
+    def preprocess(self):
+        """Builds the alias tables once."""
+        if self.preprocessing_stats is not None:
+            return
+        start = time.perf_counter()
+        graph = self.graph
+        hops = self._hops()
+        length = self.walk_length
+
+        # Node tables: the first step of a walk, or any step without edge tables.
+        if hops is None:
+            needs_node = graph.degree > 0
+        elif self.use_edge_tables:
+            needs_node = (hops == 0) & (graph.degree > 0)
+        else:
+            needs_node = (hops >= 0) & (hops <= length - 2) & (graph.degree > 0)
+        nodes = np.flatnonzero(needs_node)
+        bytes_ = 0
+        if not (graph.weights == graph.weights[:1]).all():
+            self._node_J = np.zeros(graph.num_edges, dtype=np.int32)
+            self._node_q = np.ones(graph.num_edges, dtype=np.float32)
+            positions = ranges(graph.offsets[nodes], graph.degree[nodes])
+            J, q = alias_tables(graph.weights[positions], graph.degree[nodes])
+            self._node_J[positions] = J
+            self._node_q[positions] = q
+            bytes_ += 8 * graph.num_edges
+
+        num_edges = 0
+        if self.use_edge_tables:
+            num_edges, size = self._build_edge_tables(hops)
+            bytes_ += 8 * graph.num_edges + 8 * size
+
+        self.preprocessing_stats = {
+            "nodes": len(nodes), "edges": int(num_edges),
+            "milliseconds": int((time.perf_counter() - start) * 1000), "bytes": bytes_}
+
+    def _build_edge_tables(self, hops):
+        graph = self.graph
+        length = self.walk_length
+        sources = np.repeat(np.arange(graph.num_nodes, dtype=np.int64), graph.degree)
+        destinations = graph.neighbors.astype(np.int64)
+
+        # Steps after an edge leaving src that is not the last step.
+        if hops is None:
+            needs = graph.degree[destinations] > 0
+        else:
+            hop = hops[sources]
+            needs = (hop >= 0) & (hop <= length - 3) & (graph.degree[destinations] > 0)
+
+        positions = np.arange(graph.num_edges)
+        first_of_run = np.ones(graph.num_edges, dtype=bool)
+        first_of_run[1:] = (destinations[1:] != destinations[:-1]) | (sources[1:] != sources[:-1])
+        run_first = np.maximum.accumulate(np.where(first_of_run, positions, 0))
+
+        tables = np.flatnonzero(needs & first_of_run)
+        sizes = graph.degree[destinations[tables]]
+        ends = np.cumsum(sizes)
+        size = int(ends[-1]) if len(ends) > 0 else 0
+        starts = np.full(graph.num_edges, -1, dtype=np.int64)
+        starts[tables] = ends - sizes
+        starts = np.where(needs, starts[run_first], -1)
+
+        self._edge_start = starts
+        self._edge_J = np.empty(size, dtype=np.int32)
+        self._edge_q = np.empty(size, dtype=np.float32)
+        begin = 0
+        while begin < len(tables):
+            end = int(np.searchsorted(ends, (ends[begin] - sizes[begin]) + ALIAS_CHUNK_SIZE,
+                                      side="right"))
+            end = max(end, begin + 1)
+            chunk = tables[begin:end]
+            chunk_sizes = sizes[begin:end]
+            entries = ranges(graph.offsets[destinations[chunk]], chunk_sizes)
+            src = np.repeat(sources[chunk], chunk_sizes)
+            neighbors = graph.neighbors[entries]
+            factors = np.where(neighbors == src, 1 / self.p,
+                               np.where(graph.has_edge(neighbors, src), 1., 1 / self.q))
+            J, q = alias_tables(graph.weights[entries] * factors, chunk_sizes)
+            first = int(ends[begin] - sizes[begin])
+            self._edge_J[first:first + len(J)] = J
+            self._edge_q[first:first + len(q)] = q
+            begin = end
+        return int(needs.sum()), size
+
+    def _draw(self, J, q, bases, sizes, walks, rand):
+        """Draws outcomes of the alias tables at ``bases``, or uniformly without tables."""
+        outcomes = rand.integers(walks, sizes)
+        if J is None:
+            return outcomes
+        positions = bases + outcomes
+        return np.where(rand.uniform(walks) < q[positions], outcomes, J[positions])
+
+    def _step(self, step, active, state, rand):
+        graph = self.graph
+        current = state["current"][active]
+        bases = graph.offsets[current]
+        degrees = graph.degree[current]
+
+        if step == 1 or self.first_order:
+            outcomes = self._draw(self._node_J, self._node_q, bases, degrees, active, rand)
+        elif self.rejection:
+            outcomes = np.empty(len(active), dtype=np.int64)
+            previous = state["previous"][active]
+            pending = np.arange(len(active))
+            while len(pending) > 0:
+                walks = active[pending]
+                candidates = self._draw(self._node_J, self._node_q, bases[pending],
+                                        degrees[pending], walks, rand)
+                nodes = graph.neighbors[bases[pending] + candidates]
+                factors = np.where(nodes == previous[pending], 1 / self.p,
+                                   np.where(graph.has_edge(nodes, previous[pending]), 1.,
+                                            1 / self.q))
+                accepted = rand.uniform(walks) * self.max_factor < factors
+                outcomes[pending[accepted]] = candidates[accepted]
+                pending = pending[~accepted]
+        else:
+            tables = self._edge_start[state["last_edge"][active]]
+            outcomes = self._draw(self._edge_J, self._edge_q, tables, degrees, active, rand)
+
+        edges = bases + outcomes
+        return graph.relations[edges], graph.neighbors[edges], edges
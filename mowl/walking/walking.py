@@ -1,5 +1,10 @@
 from deprecated.sphinx import versionchanged
 import tempfile
+from mowl.walking.corpus import manifest_path, walk_files, WALKS_FORMATS
+from mowl.walking.output import shard_of, walk_shard_path, write_manifest, write_shard_metadata
+from mowl.walking.stream import WalkStream
+
+BACKENDS = ["jvm", "numpy"]
 
 
 class WalkingModel():
@@ -11,9 +16,32 @@ class WalkingModel():
     :type walk_length: int
     :param workers: Number of threads to be used for computing the walks, defaults to 1'
     :type workers: int, optional
+    :param concatenate: Each thread writes its walks to its own shard ``outfile.part-0000``, \
+        ``outfile.part-0001``, ... If ``True``, the shards are concatenated into ``outfile`` \
+        when walking finishes. Otherwise they are kept and listed in \
+        ``outfile.manifest.json``, which can be read with :class:`mowl.walking.corpus.Walks`. \
+        Defaults to ``True``.
+    :type concatenate: bool, optional
+    :param walks_format: ``"text"`` writes each walk as a line of names separated by spaces. \
+        ``"binary"`` writes the ids of the walks as int32 with their offsets and the names of the \
+        ids in ``outfile.vocab``, which can be read with :class:`mowl.walking.corpus.WalkCorpus`. \
+        Defaults to ``"text"``.
+    :type walks_format: str, optional
+    :param seed: Seed of the random number generators. Each walk draws from its own generator \
+        derived from the seed, its round and its start node, so the same seed gives the same \
+        walks for any number of workers, and the same walks files for the same number of \
+        workers. If ``None``, walks are not reproducible. Defaults to ``None``.
+    :type seed: int, optional
+    :param backend: ``"jvm"`` generates the walks with the walkers of ``org.mowl.Walking``. \
+        ``"numpy"`` generates them in Python with :mod:`mowl.walking.vectorized`, without \
+        starting the JVM, in the same output formats. The NumPy backend generates the shards of \
+        the workers one after another. The two backends give different walks for the same seed. \
+        Defaults to ``"jvm"``.
+    :type backend: str, optional
     '''
 
-    def __init__(self, num_walks, walk_length, outfile, workers=1):
+    def __init__(self, num_walks, walk_length, outfile, workers=1, concatenate=True,
+                 walks_format="text", seed=None, backend="jvm"):
 
         if not isinstance(num_walks, int):
             raise TypeError("Parameter num_walks must be an integer")
@@ -21,6 +49,14 @@ class WalkingModel():
             raise TypeError("Parameter walk_length must be an integer")
         if not isinstance(workers, int):
             raise TypeError("Optional parameter workers must be an integer")
+        if not isinstance(concatenate, bool):
+            raise TypeError("Optional parameter concatenate must be a boolean")
+        if walks_format not in WALKS_FORMATS:
+            raise ValueError(f"Optional parameter walks_format must be one of {WALKS_FORMATS}")
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise TypeError("Optional parameter seed must be an integer")
+        if backend not in BACKENDS:
+            raise ValueError(f"Optional parameter backend must be one of {BACKENDS}")
 
         if outfile is None:
             tmp_file = tempfile.NamedTemporaryFile()
@@ -33,20 +69,227 @@ class WalkingModel():
         self.num_walks = num_walks
         self.walk_length = walk_length
         self.workers = workers
+        self.concatenate = concatenate
+        self.walks_format = walks_format
+        self.seed = seed
+        self.backend = backend
+        self.walks_per_second = []
+
+    @property
+    def walk_files(self):
+        '''Files with the walks of the last call to :meth:`walk`, either ``outfile`` or its shards.
+
+        :rtype: list of str
+        '''
+        return walk_files(self.outfile)
+
+    def _known_nodes(self, edges, logger, *node_lists):
+        '''Removes the nodes that are not in the graph from each list of node names. ``None`` \
+        is converted into an empty list.'''
+        from mowl.projection.edge_table import EdgeTable
+
+        all_nodes = None
+        known_lists = []
+        for nodes in node_lists:
+            known = []
+            if nodes is not None:
+                if all_nodes is None:
+                    all_nodes = EdgeTable.from_edges(edges).get_entities_and_relations()[0]
+                for node in nodes:
+                    if node in all_nodes:
+                        known.append(node)
+                    else:
+                        logger.info(f"Node {node} does not exist in the graph. Ignoring it.")
+            known_lists.append(known)
+        return known_lists
+
+    def _java_nodes(self, edges, logger, *node_lists):
+        '''Converts each list of node names into an ArrayList without the nodes that are not in \
+        the graph. ``None`` is converted into an empty ArrayList.'''
+        from java.util import ArrayList
+
+        java_lists = []
+        for nodes in self._known_nodes(edges, logger, *node_lists):
+            java_nodes = ArrayList()
+            for node in nodes:
+                java_nodes.add(node)
+            java_lists.append(java_nodes)
+        return java_lists
+
+    def _java_seed(self):
+        if self.seed is None:
+            return None
+        from java.lang import Long
+        return Long(self.seed)
+
+    def _numpy_options(self, edges, logger, nodes_of_interest, start_nodes):
+        '''Parameters shared by the walkers of :mod:`mowl.walking.vectorized`.'''
+        nodes_of_interest, start_nodes = self._known_nodes(edges, logger, nodes_of_interest,
+                                                           start_nodes)
+        return {"workers": self.workers, "nodes_of_interest": nodes_of_interest,
+                "concatenate": self.concatenate, "walks_format": self.walks_format,
+                "seed": self.seed, "start_nodes": start_nodes}
+
+    def _report(self, walker, logger):
+        if self.backend == "numpy":
+            self.walks_per_second = list(walker.walks_per_second)
+        else:
+            self.walks_per_second = list(walker.walksPerSecond())
+        for worker, rate in enumerate(self.walks_per_second):
+            logger.debug(f"Worker {worker}: {rate:.0f} walks per second")
 
     # Abstract methods
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
         focus on when generating the random walks.")
-    def walk(self, edges, nodes_of_interest=None):
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None):
         '''
         This method will generate random walks from a graph in the form of edgelist.
 
-        :param edges: List of edges
-        :type edges: :class:`mowl.projection.edge.Edge`
+        :param edges: List of edges. An :class:`mowl.projection.edge_table.EdgeTable` is \
+            passed to the JVM as integer columns without creating an object per edge.
+        :type edges: list of :class:`mowl.projection.edge.Edge` or \
+            :class:`mowl.projection.edge_table.EdgeTable`
         :param nodes_of_interest: List of entity names to filter the generated walks. If a walk \
         contains at least one word of interest, it will be saved into disk, otherwise it will be \
         ignored.  If no list is input, all the nodes will be considered. Defaults to ``None``
         :type nodes_of_interest: list, optional
+        :param start_nodes: List of entity names to start the walks from. ``num_walks`` walks \
+        start from each of them, and no walk is generated from other nodes. Nodes that are not in \
+        the graph are ignored. If no list is input, walks start from all the nodes. Defaults to \
+        ``None``
+        :type start_nodes: list, optional
         '''
 
         raise NotImplementedError()
+
+    def walk_shard(self, edges, shard_id, num_shards, seed=None, nodes_of_interest=None,
+                   start_nodes=None):
+        '''
+        Generates the walks of one of ``num_shards`` shards, so that walking a graph can be \
+        split between processes, or between machines that share a filesystem. Each start node \
+        is assigned to a shard by a hash of its name, and each walk draws from random numbers \
+        keyed by the seed, its round and its start node. Therefore, the walks of all the shards \
+        are the walks of :meth:`walk` with the same seed and backend, in a different order.
+
+        The walks of the shard are written to ``outfile + ".shard-0000"``, \
+        ``outfile + ".shard-0001"``, ... with ``concatenate=False``, and the parameters of the \
+        shard are added to its manifest. Once all the shards are written, \
+        :func:`mowl.walking.output.merge_walk_shards` lists them in the manifest of ``outfile``:
+
+        .. code-block:: python
+
+           # In process i of n
+           walker = DeepWalk(10, 8, 0.1, outfile="walks", seed=42)
+           walker.walk_shard(edges, i, n)
+
+           # Once all the processes finish
+           merge_walk_shards("walks")
+           walks = Walks("walks")
+
+        :param edges: List of edges.
+        :type edges: list of :class:`mowl.projection.edge.Edge` or \
+            :class:`mowl.projection.edge_table.EdgeTable`
+        :param shard_id: Index of the shard, from 0 to ``num_shards - 1``.
+        :type shard_id: int
+        :param num_shards: Number of shards.
+        :type num_shards: int
+        :param seed: Seed shared by all the shards. If ``None``, the seed of the walker is used, \
+        which must not be ``None`` either.
+        :type seed: int, optional
+        :param nodes_of_interest: List of entity names to filter the generated walks. See \
+        :meth:`walk`.
+        :type nodes_of_interest: list, optional
+        :param start_nodes: List of entity names to start the walks from, which are split between \
+        the shards. If no list is input, walks start from all the nodes. Defaults to ``None``
+        :type start_nodes: list, optional
+        :rtype: str
+        :return: Path of the manifest of the shard.
+        '''
+        from mowl.projection.edge_table import EdgeTable
+
+        if not isinstance(num_shards, int) or isinstance(num_shards, bool) or num_shards <= 0:
+            raise TypeError("Parameter num_shards must be a positive integer")
+        if not isinstance(shard_id, int) or isinstance(shard_id, bool):
+            raise TypeError("Parameter shard_id must be an integer")
+        if not 0 <= shard_id < num_shards:
+            raise ValueError("Parameter shard_id must be between 0 and num_shards - 1")
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise TypeError("Optional parameter seed must be an integer")
+        if seed is None:
+            seed = self.seed
+        if seed is None:
+            raise ValueError("Walk shards require a seed, given in the parameter seed or in the "
+                             "walker")
+
+        edges = EdgeTable.from_edges(edges)
+        nodes = edges.get_entities_and_relations()[0]
+        if start_nodes is not None:
+            nodes = nodes & set(start_nodes)
+        start_nodes = sorted(node for node in nodes if shard_of(node, num_shards) == shard_id)
+
+        outfile = walk_shard_path(self.outfile, shard_id)
+        if start_nodes:
+            state = self.outfile, self.concatenate, self.seed
+            self.outfile, self.concatenate, self.seed = outfile, False, seed
+            try:
+                self.walk(edges, nodes_of_interest, start_nodes)
+            finally:
+                self.outfile, self.concatenate, self.seed = state
+        else:
+            # An empty list would start the walks from all the nodes.
+            write_manifest(outfile, self.walks_format, [])
+
+        write_shard_metadata(outfile, {
+            "shard_id": shard_id, "num_shards": num_shards, "seed": seed,
+            "walker": type(self).__name__, "backend": self.backend,
+            "num_walks": self.num_walks, "walk_length": self.walk_length,
+            "parameters": self._parameters(), "start_nodes": len(start_nodes)})
+        return manifest_path(outfile)
+
+    def stream(self, edges, nodes_of_interest=None, start_nodes=None, queue_size=64,
+               batch_size=1024, as_ids=False):
+        '''
+        Generates the random walks while they are consumed instead of writing them to \
+        ``outfile``. The walks can be given directly to Word2Vec:
+
+        .. code-block:: python
+
+           walks = walker.stream(edges)
+           w2v = Word2Vec(walks, vector_size=100)
+
+        :param edges: List of edges. An :class:`mowl.projection.edge_table.EdgeTable` is \
+            passed to the JVM as integer columns without creating an object per edge.
+        :type edges: list of :class:`mowl.projection.edge.Edge` or \
+            :class:`mowl.projection.edge_table.EdgeTable`
+        :param nodes_of_interest: List of entity names to filter the generated walks. See \
+        :meth:`walk`.
+        :type nodes_of_interest: list, optional
+        :param start_nodes: List of entity names to start the walks from. See :meth:`walk`.
+        :type start_nodes: list, optional
+        :param queue_size: Maximum number of batches of walks generated ahead of the consumer, \
+        defaults to 64
+        :type queue_size: int, optional
+        :param batch_size: Number of walks passed from the walker at once, defaults to 1024
+        :type batch_size: int, optional
+        :param as_ids: If ``True``, walks are NumPy arrays of ids instead of lists of names. \
+        Defaults to ``False``.
+        :type as_ids: bool, optional
+        :rtype: :class:`mowl.walking.stream.WalkStream`
+        '''
+        if not isinstance(queue_size, int) or queue_size <= 0:
+            raise TypeError("Optional parameter queue_size must be a positive integer")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise TypeError("Optional parameter batch_size must be a positive integer")
+        if not isinstance(as_ids, bool):
+            raise TypeError("Optional parameter as_ids must be a boolean")
+
+        return WalkStream(self._walker(edges, nodes_of_interest, start_nodes), queue_size,
+                          batch_size, as_ids=as_ids)
+
+    def _parameters(self):
+        '''Parameters of the walker that the shards of :meth:`walk_shard` must share.'''
+        return {}
+
+    def _walker(self, edges, nodes_of_interest, start_nodes=None):
+        '''Walker of the backend that generates the walks of :meth:`walk`.'''
+        raise NotImplementedError()
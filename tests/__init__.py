@@ -3,6 +3,7 @@ import shutil
 import logging
 import mowl
 mowl.init_jvm("4g")
+os.environ.setdefault("MOWL_DATA_HOME", "./")
 from mowl.datasets.builtin import FamilyDataset, GDAHumanELDataset, GDAMouseELDataset, \
      PPIYeastSlimDataset
 
@@ -12,13 +13,13 @@ logger = logging.getLogger("Downloader")
 
 def setUpPackage():
     logger.info("Downloading family dataset")
-    FamilyDataset()
+    FamilyDataset(extract=True)
     logger.info("Downloading gda_el_human dataset")
-    GDAHumanELDataset()
+    GDAHumanELDataset(extract=True)
     logger.info("Downloading gda_el_mouse dataset")
-    GDAMouseELDataset()
+    GDAMouseELDataset(extract=True)
     logger.info("Downloading ppi_yeast_slim dataset")
-    PPIYeastSlimDataset()
+    PPIYeastSlimDataset(extract=True)
 
 
 def tearDownPackage():
@@ -30,3 +31,4 @@ def tearDownPackage():
     shutil.rmtree('gda_human_el')
     shutil.rmtree('gda_mouse_el')
     shutil.rmtree('family')
+    os.remove('mowl_downloads.json')
@@ -1,6 +1,7 @@
 from tests.datasetFactory import FamilyDataset
 from unittest import TestCase
 import random
+from collections.abc import Mapping
 import mowl
 mowl.init_jvm("10g")
 from mowl.base_models import Model
@@ -38,7 +39,7 @@ class TestModel(TestCase):
 
         model = Model(self.dataset)
         cls_id_dict = model.class_index_dict
-        self.assertIsInstance(cls_id_dict, dict)
+        self.assertIsInstance(cls_id_dict, Mapping)
         rnd_idx = random.randrange(0, len(cls_id_dict))
         self.assertIsInstance(list(cls_id_dict.values())[rnd_idx], int)
         rnd_idx = random.randrange(0, len(cls_id_dict))
@@ -49,7 +50,7 @@ class TestModel(TestCase):
 
         model = Model(self.dataset)
         obj_prop_id_dict = model.object_property_index_dict
-        self.assertIsInstance(obj_prop_id_dict, dict)
+        self.assertIsInstance(obj_prop_id_dict, Mapping)
         rnd_idx = random.randrange(0, len(obj_prop_id_dict))
         self.assertIsInstance(list(obj_prop_id_dict.values())[rnd_idx], int)
         rnd_idx = random.randrange(0, len(obj_prop_id_dict))
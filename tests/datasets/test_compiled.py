@@ -0,0 +1,106 @@
+"""
+Test Cases for CompiledDataset class
+"""
+
+from mowl.datasets.compiled import CompiledDataset, CompiledGCIDataset, GCI_COLUMNS
+from mowl.reasoning.normalize import ELNormalizer
+from tests.datasetFactory import PPIYeastSlimDataset, FamilyDataset
+from unittest import TestCase
+import numpy as np
+import subprocess
+import tempfile
+import shutil
+import json
+import sys
+import os
+
+
+class TestCompiledDataset(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.dataset = PPIYeastSlimDataset()
+        self.path = tempfile.mkdtemp()
+        self.compiled = self.dataset.compile(self.path)
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self.path)
+
+    def test_vocabularies(self):
+        """It should store the class and object property vocabularies of the dataset"""
+        self.assertEqual(self.compiled.classes.tolist(), self.dataset.classes.as_str)
+        self.assertEqual(self.compiled.object_properties.tolist(),
+                         self.dataset.object_properties.as_str)
+        self.assertEqual(self.compiled.class_index_dict["http://4932.Y0000"],
+                         self.dataset.classes.as_str.index("http://4932.Y0000"))
+
+    def test_gci_arrays(self):
+        """It should store one array of indices per normal form and subset"""
+        self.assertEqual(self.compiled.subsets, ["training", "validation", "testing"])
+
+        gcis = ELNormalizer().normalize(self.dataset.testing)
+        arrays = self.compiled.gcis("testing")
+        self.assertEqual(set(arrays), set(GCI_COLUMNS))
+
+        for name, array in arrays.items():
+            self.assertIsInstance(array, np.memmap)
+            self.assertEqual(array.shape, (len(gcis[name]), len(GCI_COLUMNS[name])))
+
+        classes = self.compiled.classes
+        properties = self.compiled.object_properties
+        gci2 = gcis["gci2"][0]
+        subclass, object_property, filler = arrays["gci2"][0]
+        self.assertEqual(classes[subclass], gci2.subclass)
+        self.assertEqual(properties[object_property], gci2.object_property)
+        self.assertEqual(classes[filler], gci2.filler)
+
+    def test_get_gci_datasets(self):
+        """It should return datasets of indices as ELDataset does"""
+        datasets = self.compiled.get_gci_datasets("training")
+        self.assertEqual(len(datasets), 7)
+        self.assertIsInstance(datasets["gci2"], CompiledGCIDataset)
+        self.assertEqual(len(datasets["gci2"]), len(self.compiled.gcis("training")["gci2"]))
+
+        datasets = self.compiled.get_gci_datasets("training", extended=False)
+        self.assertEqual(set(datasets), {"gci0", "gci1", "gci2", "gci3"})
+
+    def test_evaluation_classes(self):
+        """It should store the evaluation classes of the dataset"""
+        self.assertEqual(self.compiled.evaluation_classes,
+                         self.dataset.evaluation_classes.as_str)
+
+    def test_dataset_without_testing_ontology(self):
+        """It should compile datasets that only have a training ontology"""
+        path = tempfile.mkdtemp()
+        try:
+            compiled = FamilyDataset().compile(path)
+            self.assertEqual(compiled.subsets, ["training"])
+            self.assertRaises(ValueError, compiled.gcis, "testing")
+        finally:
+            shutil.rmtree(path)
+
+    def test_open_does_not_start_jvm(self):
+        """It should open a compiled dataset without starting the JVM"""
+        code = f"""
+import jpype
+from mowl.datasets.compiled import CompiledDataset
+ds = CompiledDataset.open({self.path!r})
+assert len(ds.classes) > 0
+assert len(ds.get_gci_datasets("training")["gci0"]) > 0
+assert not jpype.isJVMStarted()
+"""
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_open_errors(self):
+        """It should raise errors for missing or incompatible compiled datasets"""
+        self.assertRaises(FileNotFoundError, CompiledDataset.open, "/tmp/not_a_compiled_dataset")
+
+        path = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(path, "manifest.json"), "w") as f:
+                json.dump({"format_version": -1}, f)
+            self.assertRaisesRegex(ValueError, "Unsupported compiled dataset format version",
+                                   CompiledDataset.open, path)
+        finally:
+            shutil.rmtree(path)
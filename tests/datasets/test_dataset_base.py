@@ -4,7 +4,7 @@ Test Cases for Dataset class and its subclasses
 
 from mowl.owlapi.defaults import BOT, TOP
 from mowl.owlapi import OWLAPIAdapter
-from mowl.datasets.base import Entities, OWLClasses, OWLObjectProperties
+from mowl.datasets.base import Entities, OWLClasses, OWLObjectProperties, _verify_tar_file
 from mowl.datasets import Dataset, PathDataset, RemoteDataset, TarFileDataset
 from tests.datasetFactory import PPIYeastSlimDataset, GDAHumanELDataset
 from mowl.owlapi.model import OWLOntology, OWLClass, OWLObjectProperty
@@ -12,6 +12,8 @@ from unittest import TestCase
 from random import randrange, choice
 import os
 import shutil
+import tarfile
+import tempfile
 import requests
 
 
@@ -184,6 +186,33 @@ class TestPathDataset(TestCase):
         idx = randrange(0, len(object_properties_from_owl_api))
         self.assertEqual(object_properties[idx], object_properties_from_owl_api[idx])
 
+    def test_ontologies_are_parsed_once(self):
+        """It should parse each ontology document only once when accessing dataset properties"""
+        dataset = PathDataset(self.training_ont_path, self.validation_ont_path,
+                              self.testing_ont_path)
+        _ = dataset.classes
+        _ = dataset.object_properties
+        _ = dataset.evaluation_classes
+        _ = dataset.classes
+
+        self.assertEqual(dataset.parse_counts, {"ontology": 1, "validation": 1, "testing": 1})
+
+    def test_parse_counts_without_optional_ontologies(self):
+        """It should not parse validation and testing documents when they are not provided"""
+        dataset = PathDataset(self.training_ont_path)
+        self.assertEqual(dataset.parse_counts, {"ontology": 1, "validation": 0, "testing": 0})
+
+    def test_reload(self):
+        """It should parse the documents again and reset cached properties on reload"""
+        dataset = PathDataset(self.training_ont_path, self.validation_ont_path,
+                              self.testing_ont_path)
+        classes = dataset.classes.as_str
+        dataset.reload()
+
+        self.assertEqual(dataset.parse_counts, {"ontology": 2, "validation": 2, "testing": 2})
+        self.assertIsInstance(dataset.ontology, OWLOntology)
+        self.assertEqual(dataset.classes.as_str, classes)
+
 
 #############################################################
 
@@ -213,13 +242,94 @@ class TestTarFileDataset(TestCase):
 
     def test_extract_tar_file(self):
         """It should check correct extracting behaviour"""
-        _ = TarFileDataset(self.filepath)
+        _ = TarFileDataset(self.filepath, extract=True)
 
         self.assertTrue(os.path.exists("/tmp/ppi_yeast_slim.tar.gz"))
         self.assertTrue(os.path.exists("/tmp/ppi_yeast_slim/ontology.owl"))
         self.assertTrue(os.path.exists("/tmp/ppi_yeast_slim/valid.owl"))
         self.assertTrue(os.path.exists("/tmp/ppi_yeast_slim/test.owl"))
 
+
+class TestTarFileStreaming(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.root = tempfile.mkdtemp()
+        self.filepath = shutil.copy("ppi_yeast_slim.tar.gz", self.root)
+        self.extracted = PPIYeastSlimDataset()
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self.root)
+
+    def test_parse_tar_members_without_extracting(self):
+        """It should parse the ontologies from the tar members without writing them to disk"""
+        dataset = TarFileDataset(self.filepath)
+
+        self.assertEqual(os.listdir(self.root), ["ppi_yeast_slim.tar.gz"])
+        self.assertEqual(dataset.ontology.getAxiomCount(),
+                         self.extracted.ontology.getAxiomCount())
+        self.assertEqual(dataset.validation.getAxiomCount(),
+                         self.extracted.validation.getAxiomCount())
+        self.assertEqual(dataset.testing.getAxiomCount(),
+                         self.extracted.testing.getAxiomCount())
+        self.assertEqual(dataset.classes.as_str, self.extracted.classes.as_str)
+
+    def test_member_stats(self):
+        """It should report bytes read and parse time of each tar member"""
+        dataset = TarFileDataset(self.filepath)
+        stats = dataset.member_stats
+
+        self.assertEqual(set(stats), {"ontology", "validation", "testing"})
+        with tarfile.open(self.filepath) as tarf:
+            for name, filename in TarFileDataset.MEMBERS.items():
+                member = tarf.getmember(f"ppi_yeast_slim/{filename}")
+                self.assertEqual(stats[name]["member"], member.name)
+                self.assertEqual(stats[name]["bytes"], member.size)
+                self.assertGreater(stats[name]["seconds"], 0)
+
+        dataset.reload()
+        self.assertEqual(dataset.parse_counts, {"ontology": 2, "validation": 2, "testing": 2})
+
+    def test_tar_file_with_only_training_ontology(self):
+        """It should stream tar files that only contain a training ontology"""
+        filepath = shutil.copy("family.tar.gz", self.root)
+        try:
+            dataset = TarFileDataset(filepath)
+            self.assertIsNone(dataset.validation)
+            self.assertIsNone(dataset.testing)
+            self.assertEqual(set(dataset.member_stats), {"ontology"})
+        finally:
+            os.remove(filepath)
+
+    def test_missing_training_ontology(self):
+        """It should raise an error if the tar file has no training ontology"""
+        self.assertRaises(FileNotFoundError, TarFileDataset, self.filepath,
+                          dataset_name="not_a_dataset")
+        self.assertRaises(FileNotFoundError, TarFileDataset, "/tmp/not_a_file.tar.gz")
+
+    def test_verify_tar_file(self):
+        """It should reject truncated or corrupted tar files"""
+        _verify_tar_file(self.filepath)
+
+        with open(self.filepath, "rb") as f:
+            data = f.read()
+        filepath = os.path.join(self.root, "broken.tar.gz")
+        corrupted = bytearray(data)
+        corrupted[len(data) // 2] ^= 0xff
+        try:
+            for broken in [data[:-8], data[:len(data) // 2], bytes(corrupted)]:
+                with open(filepath, "wb") as f:
+                    f.write(broken)
+                self.assertRaises(Exception, _verify_tar_file, filepath)
+        finally:
+            os.remove(filepath)
+
+    def test_extract_type(self):
+        """It should check the type of the extract parameter"""
+        self.assertRaisesRegex(TypeError, "Optional parameter extract must be of type bool",
+                               TarFileDataset, self.filepath, extract="True")
+
 #############################################################
 
 
@@ -234,7 +344,7 @@ class TestRemoteDataset(TestCase):
 
     def test_successful_download_in_default_path(self):
         """This checks if dataset is downloaded in the default path ./"""
-        _ = RemoteDataset(self.good_url)
+        _ = RemoteDataset(self.good_url, extract=True)
         self.assertTrue(os.path.exists("./ppi_yeast"))
         self.assertTrue(os.path.exists("./ppi_yeast/ontology.owl"))
         self.assertTrue(os.path.exists("./ppi_yeast/valid.owl"))
@@ -242,7 +352,7 @@ class TestRemoteDataset(TestCase):
 
     def test_successful_download_in_custom_path(self):
         """This checks if dataset is downloaded a custom path"""
-        _ = RemoteDataset(self.good_url, data_root="/tmp/")
+        _ = RemoteDataset(self.good_url, data_root="/tmp/", extract=True)
         self.assertTrue(os.path.exists("/tmp/ppi_yeast"))
         self.assertTrue(os.path.exists("/tmp/ppi_yeast/ontology.owl"))
         self.assertTrue(os.path.exists("/tmp/ppi_yeast/valid.owl"))
@@ -257,9 +367,9 @@ class TestRemoteDataset(TestCase):
 
     def test_dataset_not_downloaded_if_already_exists(self):
         """This should check that dataset is not downloaded if already exists"""
-        _ = RemoteDataset(self.good_url, data_root="/tmp/")
+        _ = RemoteDataset(self.good_url, data_root="/tmp/", extract=True)
         file_timestamp1 = os.path.getmtime("/tmp/ppi_yeast.tar.gz")
-        _ = RemoteDataset(self.good_url, data_root="/tmp/")
+        _ = RemoteDataset(self.good_url, data_root="/tmp/", extract=True)
         file_timestamp2 = os.path.getmtime("/tmp/ppi_yeast.tar.gz")
 
         self.assertEqual(file_timestamp1, file_timestamp2)
@@ -269,7 +379,7 @@ class TestRemoteDataset(TestCase):
 
     def test_dataset_with_only_training_set(self):
         """This should check that dataset is downloaded correctly if it has only training set"""
-        _ = RemoteDataset(self.only_training_set_url, data_root="/tmp/")
+        _ = RemoteDataset(self.only_training_set_url, data_root="/tmp/", extract=True)
         self.assertTrue(os.path.exists("/tmp/family"))
         self.assertTrue(os.path.exists("/tmp/family/ontology.owl"))
         self.assertFalse(os.path.exists("/tmp/family/valid.owl"))
@@ -0,0 +1,297 @@
+"""
+Test Cases for DownloadCache class. A local HTTP server with support for range requests stands in
+for the remote dataset host.
+"""
+
+from mowl.datasets.download import DownloadCache, get_data_home, sha256sum, MANIFEST_FILE
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+import threading
+import unittest.mock
+import tempfile
+import hashlib
+import shutil
+import json
+import os
+import requests
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self):
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return None, None
+
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if if_range is not None and if_range != self.server.etag:
+            range_header = None
+        if range_header is not None and self.server.ranges:
+            first, last = range_header.split("=")[1].split("-")
+            start = int(first)
+            end = int(last) if last else end
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None, None
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+        else:
+            self.send_response(200)
+
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if self.server.etag is not None:
+            self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        return content, (start, end)
+
+    def do_HEAD(self):
+        self._body()
+
+    def do_GET(self):
+        content, bounds = self._body()
+        if content is None:
+            return
+        with self.server.lock:
+            self.server.served.append(bounds)
+        self.wfile.write(content[bounds[0]:bounds[1] + 1])
+
+
+class TestDownloadCache(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.content = os.urandom(100_000)
+        self.checksum = hashlib.sha256(self.content).hexdigest()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.files = {"/data.tar.gz": self.content}
+        self.server.lock = threading.Lock()
+        self.server.ranges = True
+        self.server.etag = None
+        self.server.served = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/data.tar.gz"
+
+    @classmethod
+    def tearDownClass(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.root, "data.tar.gz")
+        self.server.served = []
+        self.server.ranges = True
+        self.server.etag = None
+        self.server.files = {"/data.tar.gz": self.content}
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_download(self):
+        """It should download the file and record its checksum in the manifest"""
+        cache = DownloadCache(self.root, workers=1)
+        filepath = cache.fetch(self.url)
+
+        self.assertEqual(filepath, self.filepath)
+        self.assertEqual(self.read(filepath), self.content)
+        self.assertFalse(os.path.exists(filepath + ".part"))
+        self.assertEqual(cache.manifest["data.tar.gz"]["sha256"], self.checksum)
+        self.assertTrue(os.path.exists(os.path.join(self.root, MANIFEST_FILE)))
+
+    def test_cached_file_is_reused(self):
+        """It should not download a file that matches its manifest entry"""
+        cache = DownloadCache(self.root)
+        cache.fetch(self.url)
+        self.server.served = []
+        cache.fetch(self.url, sha256=self.checksum)
+        self.assertEqual(self.server.served, [])
+
+    def test_resume_download(self):
+        """It should resume an interrupted download with a range request"""
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(self.content[:30_000])
+
+        DownloadCache(self.root, workers=1).fetch(self.url)
+        self.assertEqual(self.server.served, [(30_000, len(self.content) - 1)])
+        self.assertEqual(self.read(self.filepath), self.content)
+
+    def test_restart_download_without_range_support(self):
+        """It should download the whole file if the server ignores range requests"""
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(b"corrupted")
+        self.server.ranges = False
+
+        DownloadCache(self.root).fetch(self.url)
+        self.assertEqual(self.server.served, [(0, len(self.content) - 1)])
+        self.assertEqual(self.read(self.filepath), self.content)
+
+    def test_parallel_chunks(self):
+        """It should fetch ranged chunks in parallel and resume only missing chunks"""
+        cache = DownloadCache(self.root, workers=4, chunk_size=10_000)
+        cache.fetch(self.url)
+        self.assertEqual(len(self.server.served), 10)
+        self.assertEqual(self.read(self.filepath), self.content)
+
+        os.remove(self.filepath)
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(self.content[:50_000] + bytes(50_000))
+        with open(self.filepath + ".part.chunks", "w") as f:
+            json.dump([0, 1, 2, 3, 4], f)
+        self.server.served = []
+
+        cache.fetch(self.url)
+        self.assertEqual(sorted(self.server.served)[0], (50_000, 59_999))
+        self.assertEqual(len(self.server.served), 5)
+        self.assertEqual(self.read(self.filepath), self.content)
+        self.assertFalse(os.path.exists(self.filepath + ".part.chunks"))
+
+    def test_resume_with_if_range(self):
+        """It should resume only if the remote file did not change"""
+        self.server.etag = '"v1"'
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(self.content[:30_000])
+        with open(self.filepath + ".part.chunks", "w") as f:
+            json.dump({"validator": '"v1"'}, f)
+        DownloadCache(self.root, workers=1).fetch(self.url)
+        self.assertEqual(self.server.served, [(30_000, len(self.content) - 1)])
+        self.assertFalse(os.path.exists(self.filepath + ".part.chunks"))
+
+        os.remove(self.filepath)
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(b"start of a previous version of the file")
+        with open(self.filepath + ".part.chunks", "w") as f:
+            json.dump({"validator": '"v0"'}, f)
+        self.server.served = []
+        DownloadCache(self.root, workers=1).fetch(self.url)
+        self.assertEqual(self.server.served, [(0, len(self.content) - 1)])
+        self.assertEqual(self.read(self.filepath), self.content)
+
+    def test_complete_or_larger_partial_file(self):
+        """It should finalize a complete partial file and restart a larger one"""
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(self.content)
+        DownloadCache(self.root, workers=1).fetch(self.url, sha256=self.checksum)
+        self.assertEqual(self.server.served, [])
+        self.assertEqual(self.read(self.filepath), self.content)
+
+        os.remove(self.filepath)
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(self.content + b"trailing bytes of a previous version")
+        DownloadCache(self.root, workers=1).fetch(self.url, sha256=self.checksum)
+        self.assertEqual(self.server.served, [(0, len(self.content) - 1)])
+        self.assertEqual(self.read(self.filepath), self.content)
+
+    def test_range_not_satisfiable(self):
+        """It should handle a 416 response to a range at the end of the file"""
+        cache = DownloadCache(self.root, workers=1)
+        part_path = self.filepath + ".part"
+        with open(part_path, "wb") as f:
+            f.write(self.content)
+        cache._download_stream(self.url, part_path, True)
+        self.assertEqual(self.read(part_path), self.content)
+
+        with open(part_path, "wb") as f:
+            f.write(self.content + b"trailing bytes")
+        cache._download_stream(self.url, part_path, True)
+        self.assertEqual(self.read(part_path), self.content)
+
+    def test_chunks_of_a_changed_file_are_not_resumed(self):
+        """It should restart a chunked download if the remote file changed"""
+        self.server.etag = '"v2"'
+        with open(self.filepath + ".part", "wb") as f:
+            f.write(bytes(len(self.content)))
+        with open(self.filepath + ".part.chunks", "w") as f:
+            json.dump({"validator": '"v1"', "done": [0, 1, 2, 3, 4]}, f)
+
+        DownloadCache(self.root, workers=4, chunk_size=10_000).fetch(self.url)
+        self.assertEqual(len(self.server.served), 10)
+        self.assertEqual(self.read(self.filepath), self.content)
+
+    def test_incomplete_download_is_discarded(self):
+        """It should discard a download whose size does not match the remote size"""
+        cache = DownloadCache(self.root, workers=1)
+        with unittest.mock.patch.object(cache, "_download_stream",
+                                        lambda url, part_path, *args: open(part_path, "wb")
+                                        .write(b"truncated")):
+            self.assertRaisesRegex(IOError, "Incomplete download", cache.fetch, self.url)
+        self.assertFalse(os.path.exists(self.filepath + ".part"))
+        self.assertEqual(self.read(cache.fetch(self.url)), self.content)
+
+    def test_checksum_mismatch(self):
+        """It should raise an error and discard the download if the checksum does not match"""
+        cache = DownloadCache(self.root)
+        self.assertRaisesRegex(IOError, "Checksum mismatch", cache.fetch, self.url,
+                               sha256="0" * 64)
+        self.assertFalse(os.path.exists(self.filepath))
+        self.assertFalse(os.path.exists(self.filepath + ".part"))
+
+    def test_invalid_download_is_discarded(self):
+        """It should discard a download rejected by the verify function and not cache it"""
+        def verify(filepath):
+            raise ValueError("not a tar file")
+
+        cache = DownloadCache(self.root)
+        self.assertRaisesRegex(IOError, "Invalid download .* not a tar file", cache.fetch,
+                               self.url, verify=verify)
+        self.assertFalse(os.path.exists(self.filepath))
+        self.assertFalse(os.path.exists(self.filepath + ".part"))
+        self.assertFalse(cache.is_cached(self.url))
+
+    def test_corrupted_file_is_downloaded_again(self):
+        """It should download again files that do not match the manifest"""
+        cache = DownloadCache(self.root)
+        cache.fetch(self.url)
+        with open(self.filepath, "r+b") as f:
+            f.write(b"corrupted")
+
+        cache.fetch(self.url)
+        self.assertEqual(self.read(self.filepath), self.content)
+
+        with open(os.path.join(self.root, "other.tar.gz"), "wb") as f:
+            f.write(b"not in manifest")
+        self.server.files["/other.tar.gz"] = self.content
+        other_url = self.url.replace("data.tar.gz", "other.tar.gz")
+        self.assertEqual(self.read(cache.fetch(other_url)), self.content)
+        self.assertEqual(sha256sum(os.path.join(self.root, "other.tar.gz")), self.checksum)
+
+    def test_incorrect_url(self):
+        """It should raise an HTTP error for incorrect URLs"""
+        cache = DownloadCache(self.root)
+        self.assertRaises(requests.exceptions.HTTPError, cache.fetch, self.url + "q")
+
+    def test_parameter_types(self):
+        """It should raise errors for invalid parameters"""
+        self.assertRaisesRegex(ValueError, "workers must be a positive integer", DownloadCache,
+                               self.root, workers=0)
+        self.assertRaisesRegex(ValueError, "chunk_size must be a positive integer",
+                               DownloadCache, self.root, chunk_size="1")
+
+    def test_data_home(self):
+        """It should read the cache directory from the MOWL_DATA_HOME environment variable"""
+        previous = os.environ.get("MOWL_DATA_HOME")
+        try:
+            os.environ["MOWL_DATA_HOME"] = self.root
+            self.assertEqual(get_data_home(), self.root)
+            self.assertEqual(get_data_home("/tmp/other"), "/tmp/other")
+            del os.environ["MOWL_DATA_HOME"]
+            self.assertEqual(get_data_home(), os.path.expanduser("~/.mowl/datasets"))
+        finally:
+            if previous is not None:
+                os.environ["MOWL_DATA_HOME"] = previous
@@ -0,0 +1,144 @@
+"""
+Test Cases for EntityIndex class
+"""
+
+from mowl.datasets.index import EntityIndex, pack_names, unpack_names
+from mowl.owlapi.defaults import TOP, BOT
+from org.mowl import PackedStrings, Signature
+from jpype.nio import convertToDirectBuffer
+from mowl.datasets.base import OWLClasses, OWLObjectProperties
+from mowl.owlapi.model import OWLClass, OWLObjectProperty
+from tests.datasetFactory import PPIYeastSlimDataset
+from collections.abc import Mapping
+from unittest import TestCase
+import numpy as np
+
+
+class TestEntityIndex(TestCase):
+
+    def setUp(self):
+        self.names = ["http://c", "http://a", "http://b", "http://a"]
+        self.index = EntityIndex(self.names)
+
+    def test_sorted_unique_names(self):
+        """It should store sorted unique names in a read-only array"""
+        self.assertEqual(self.index.names.tolist(), ["http://a", "http://b", "http://c"])
+        self.assertEqual(len(self.index), 3)
+        self.assertFalse(self.index.names.flags.writeable)
+        self.assertIsInstance(self.index, Mapping)
+
+    def test_lookup(self):
+        """It should map names to their position in the sorted array"""
+        self.assertEqual(self.index["http://b"], 1)
+        self.assertEqual(dict(self.index), {"http://a": 0, "http://b": 1, "http://c": 2})
+        self.assertIn("http://c", self.index)
+        self.assertNotIn("http://d", self.index)
+        self.assertRaises(KeyError, self.index.__getitem__, "http://d")
+        self.assertEqual(self.index, EntityIndex(["http://a", "http://b", "http://c"]))
+        self.assertEqual(self.index, {"http://a": 0, "http://b": 1, "http://c": 2})
+
+    def test_batch_lookup(self):
+        """It should look up batches of names and indices"""
+        ids = self.index.ids_of(["http://c", "http://a", "http://c"])
+        self.assertEqual(ids.dtype, np.int64)
+        self.assertEqual(ids.tolist(), [2, 0, 2])
+        self.assertEqual(self.index.names_of(ids).tolist(), ["http://c", "http://a", "http://c"])
+        self.assertEqual(self.index.name_of(1), "http://b")
+        self.assertRaisesRegex(KeyError, "http://0", self.index.ids_of, ["http://a", "http://0"])
+        self.assertRaisesRegex(KeyError, "http://d", self.index.ids_of, ["http://d"])
+        self.assertEqual(EntityIndex([]).ids_of([]).tolist(), [])
+
+    def test_lazy_owl_objects(self):
+        """It should create OWL objects only when requested"""
+        created = []
+
+        def factory(name):
+            created.append(name)
+            return name.upper()
+
+        index = EntityIndex(self.names, factory=factory)
+        self.assertEqual(created, [])
+        self.assertEqual(index.owl_object("http://b"), "HTTP://B")
+        self.assertEqual(created, ["http://a", "http://b", "http://c"])
+
+        index = EntityIndex(self.names, objects=["C", "A1", "B", "A2"])
+        self.assertEqual(index.as_owl, ["A1", "B", "C"])
+        self.assertRaises(ValueError, EntityIndex(self.names).__getattribute__, "as_owl")
+
+
+class TestSignatureExport(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.ds = PPIYeastSlimDataset()
+
+    def test_unpack_names(self):
+        """It should decode names packed in a UTF-8 buffer"""
+        names = ["http://a", "http://\u00e9t\u00e9", "", "http://b"]
+        data = "".join(names).encode("utf-8")
+        offsets = np.cumsum([0] + [len(n.encode("utf-8")) for n in names])
+        self.assertEqual(unpack_names(data, offsets), names)
+        self.assertEqual(unpack_names(b"ab", [0, 1, 2]), ["a", "b"])
+
+    def test_pack_names(self):
+        """It should pack names that unpack_names and PackedStrings decode"""
+        names = ["http://a", "http://\u00e9t\u00e9", "", "http://b"]
+        data, offsets = pack_names(names)
+        self.assertEqual(offsets.dtype, np.int32)
+        self.assertEqual(unpack_names(data, offsets), names)
+        packed = PackedStrings.fromBuffers(convertToDirectBuffer(data),
+                                           convertToDirectBuffer(offsets))
+        self.assertEqual([str(name) for name in packed.toArray()], names)
+
+        data, offsets = pack_names(names, np.int64)
+        self.assertEqual(offsets.dtype, np.int64)
+        self.assertEqual(unpack_names(data, offsets), names)
+
+    def test_packed_strings(self):
+        """It should pack sorted unique names"""
+        packed = Signature.pack(["http://b", "http://a", "http://\u00e9"])
+        self.assertEqual(packed.size(), 3)
+        self.assertEqual(unpack_names(packed.data(), packed.offsets()),
+                         ["http://a", "http://b", "http://\u00e9"])
+
+    def test_bulk_export_matches_signature(self):
+        """It should export the same classes and object properties as the OWLAPI signature"""
+        ontologies = [self.ds.ontology, self.ds.validation, self.ds.testing]
+        classes = {str(c.toStringID()) for ont in ontologies
+                   for c in ont.getClassesInSignature()}
+        properties = {str(p.toStringID()) for ont in ontologies
+                      for p in ont.getObjectPropertiesInSignature()}
+
+        self.assertEqual(self.ds.classes.as_str, sorted(classes | {TOP, BOT}))
+        self.assertEqual(self.ds.object_properties.as_str, sorted(properties))
+
+        testing = {str(c.toStringID()) for c in self.ds.testing.getClassesInSignature()}
+        self.assertEqual(self.ds.evaluation_classes.as_str, sorted(testing))
+
+
+class TestEntitiesIndex(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.ds = PPIYeastSlimDataset()
+
+    def test_entities_index(self):
+        """It should expose the entities as an EntityIndex"""
+        classes = self.ds.classes
+        self.assertIsInstance(classes.index, EntityIndex)
+        self.assertEqual(classes.index.names.tolist(), classes.as_str)
+        self.assertEqual(len(classes), len(classes.as_str))
+        self.assertEqual(classes.index[classes.as_str[3]], 3)
+
+    def test_from_names(self):
+        """It should create entities from names and materialize OWL objects lazily"""
+        names = self.ds.classes.as_str
+        classes = OWLClasses.from_names(reversed(names))
+        self.assertEqual(classes.as_str, names)
+        self.assertIsInstance(classes.as_owl[0], OWLClass)
+        self.assertEqual(classes.as_owl, self.ds.classes.as_owl)
+
+        names = self.ds.object_properties.as_str
+        properties = OWLObjectProperties.from_names(names)
+        self.assertIsInstance(properties.as_owl[0], OWLObjectProperty)
+        self.assertEqual(properties.to_dict(), self.ds.object_properties.to_dict())
@@ -0,0 +1,122 @@
+from tests.datasetFactory import FamilyDataset, PPIYeastSlimDataset
+from mowl.projection.cache import ProjectionCache, ontology_fingerprint
+from mowl.projection import DL2VecProjector, OWL2VecStarProjector, TaxonomyWithRelsProjector
+from mowl.owlapi import OWLAPIAdapter
+from org.semanticweb.owlapi.model import IRI
+from unittest import TestCase
+import tempfile
+import shutil
+
+
+class _CountingProjector(DL2VecProjector):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def project(self, ontology):
+        self.calls += 1
+        return super().project(ontology)
+
+
+class TestProjectionCache(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.family = FamilyDataset()
+        self.ppi = PPIYeastSlimDataset()
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_hit_does_not_call_projector(self):
+        """It should return stored projections without projecting the ontology again"""
+        cache = ProjectionCache(self.root)
+        projector = _CountingProjector(bidirectional_taxonomy=True)
+
+        first = cache.project(projector, self.family.ontology)
+        second = cache.project(projector, self.family.ontology)
+
+        self.assertEqual(projector.calls, 1)
+        self.assertEqual(first.astuples(), second.astuples())
+        self.assertEqual(second.astuples(),
+                         DL2VecProjector(True).project(self.family.ontology).astuples())
+        stats = cache.stats
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertGreater(stats["size"], 0)
+
+    def test_provenance_is_stored(self):
+        """It should keep the provenance of the stored edges"""
+        cache = ProjectionCache(self.root)
+        edges = DL2VecProjector().project_with_provenance(self.family.ontology)
+        cache.put("provenance", edges)
+        self.assertEqual(cache.get("provenance").provenance.tolist(), edges.provenance.tolist())
+
+    def test_key_depends_on_parameters(self):
+        """It should use different entries for different projector parameters"""
+        cache = ProjectionCache(self.root)
+        ontology = self.family.ontology
+        fingerprint = ontology_fingerprint(ontology)
+
+        keys = {cache.key(DL2VecProjector(), fingerprint=fingerprint),
+                cache.key(DL2VecProjector(True), fingerprint=fingerprint),
+                cache.key(OWL2VecStarProjector(), fingerprint=fingerprint),
+                cache.key(OWL2VecStarProjector(include_literals=True), fingerprint=fingerprint),
+                cache.key(TaxonomyWithRelsProjector(relations=["http://a"]),
+                          fingerprint=fingerprint)}
+        self.assertEqual(len(keys), 5)
+
+        self.assertEqual(cache.key(DL2VecProjector(workers=2), ontology),
+                         cache.key(DL2VecProjector(), ontology))
+        self.assertEqual(
+            cache.key(TaxonomyWithRelsProjector(relations=["http://a", "http://b"]), ontology),
+            cache.key(TaxonomyWithRelsProjector(relations=["http://b", "http://a"]), ontology))
+
+    def test_fingerprint(self):
+        """It should compute the same fingerprint for the same axioms"""
+        fingerprint = ontology_fingerprint(self.family.ontology)
+        self.assertEqual(fingerprint, ontology_fingerprint(FamilyDataset().ontology))
+        self.assertNotEqual(fingerprint, ontology_fingerprint(self.ppi.ontology))
+
+        adapter = OWLAPIAdapter()
+        ontology = adapter.owl_manager.createOntology(IRI.create("http://mowl/fingerprint"))
+        adapter.owl_manager.addAxioms(ontology, self.family.ontology.getAxioms())
+        self.assertEqual(fingerprint, ontology_fingerprint(ontology))
+
+        axiom = adapter.data_factory.getOWLSubClassOfAxiom(adapter.create_class("http://Child"),
+                                                           adapter.create_class("http://Person"))
+        adapter.owl_manager.addAxiom(ontology, axiom)
+        self.assertNotEqual(fingerprint, ontology_fingerprint(ontology))
+
+    def test_lru_eviction(self):
+        """It should evict the least recently used entries when the cache is full"""
+        cache = ProjectionCache(self.root)
+        ontology = self.ppi.ontology
+        projectors = [DL2VecProjector(), DL2VecProjector(True), OWL2VecStarProjector()]
+        keys = [cache.key(p, ontology) for p in projectors]
+
+        cache.project(projectors[0], ontology)
+        cache.project(projectors[1], ontology)
+        entry_size = cache.stats["size"]
+
+        cache.max_size = entry_size
+        cache.get(keys[0])
+        cache.project(projectors[2], ontology)
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.stats["evictions"], 1)
+
+        cache.clear()
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_parameter_types(self):
+        """It should raise errors for invalid parameters"""
+        self.assertRaisesRegex(ValueError, "max_size must be a positive integer",
+                               ProjectionCache, self.root, max_size=0)
+        self.assertRaisesRegex(ValueError, "Either ontology or fingerprint must be given",
+                               ProjectionCache(self.root).key, DL2VecProjector())
@@ -0,0 +1,84 @@
+from tests.datasetFactory import PPIYeastSlimDataset
+from mowl.projection import DL2VecProjector, TaxonomyWithRelsProjector, TaxonomyProjector
+from mowl.owlapi import OWLAPIAdapter
+from org.semanticweb.owlapi.model.parameters import Imports
+from unittest import TestCase
+
+
+class TestDeltaProjection(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.dataset = PPIYeastSlimDataset()
+        self.ontology = self.dataset.ontology
+        self.projectors = [DL2VecProjector(bidirectional_taxonomy=True),
+                           TaxonomyWithRelsProjector(taxonomy=True,
+                                                     relations=["http://interacts_with"])]
+
+    def changed_ontology(self):
+        """Copies the ontology removing 50 subclass axioms and adding 3 new ones"""
+        adapter = OWLAPIAdapter()
+        manager = adapter.owl_manager
+        ontology = manager.createOntology()
+        manager.addAxioms(ontology, self.ontology.getAxioms(Imports.INCLUDED))
+
+        subclass_axioms = sorted(ontology.getAxioms(Imports.INCLUDED), key=str)
+        subclass_axioms = [ax for ax in subclass_axioms
+                           if str(ax.getAxiomType().getName()) == "SubClassOf"]
+        removed = subclass_axioms[:50]
+
+        factory = adapter.data_factory
+        new_class = adapter.create_class("http://4932.NEW")
+        interacts = adapter.create_object_property("http://interacts_with")
+        added = [
+            factory.getOWLSubClassOfAxiom(new_class, adapter.create_class("http://4932.Y0001")),
+            factory.getOWLSubClassOfAxiom(
+                new_class, factory.getOWLObjectSomeValuesFrom(
+                    interacts, adapter.create_class("http://4932.Y0012"))),
+            subclass_axioms[60],  # Already in the ontology
+        ]
+
+        for axiom in removed:
+            manager.removeAxiom(ontology, axiom)
+        for axiom in added:
+            manager.addAxiom(ontology, axiom)
+        return ontology, added, removed
+
+    def test_provenance_projection(self):
+        """It should produce the same edges as project, with their provenance"""
+        for projector in self.projectors:
+            with self.subTest(projector=type(projector).__name__):
+                edges = projector.project_with_provenance(self.ontology)
+                self.assertEqual(edges.astuples(), projector.project(self.ontology).astuples())
+                self.assertEqual(len(edges.provenance), len(edges))
+                self.assertIsNone(projector.project(self.ontology).provenance)
+
+    def test_project_delta(self):
+        """It should produce the edges of the changed ontology"""
+        ontology, added, removed = self.changed_ontology()
+
+        for projector in self.projectors:
+            with self.subTest(projector=type(projector).__name__):
+                previous = projector.project_with_provenance(self.ontology)
+                delta = projector.project_delta(ontology, added, removed, previous)
+                expected = projector.project(ontology)
+
+                self.assertEqual(sorted(delta.astuples()), sorted(expected.astuples()))
+                self.assertIn(("http://4932.NEW", "http://subclassof", "http://4932.Y0001"),
+                              delta.astuples())
+                self.assertLess(len(delta), len(previous))
+
+                again = projector.project_delta(ontology, [], [], delta)
+                self.assertEqual(again.astuples(), delta.astuples())
+
+    def test_unsupported_projector(self):
+        """It should raise NotImplementedError for projectors without provenance"""
+        projector = TaxonomyProjector()
+        self.assertRaises(NotImplementedError, projector.project_with_provenance, self.ontology)
+
+    def test_previous_edges_without_provenance(self):
+        """It should raise TypeError if the previous edges have no provenance"""
+        projector = DL2VecProjector()
+        self.assertRaisesRegex(TypeError, "previous_edges must be an EdgeTable with provenance",
+                               projector.project_delta, self.ontology, [], [],
+                               projector.project(self.ontology))
@@ -52,6 +52,19 @@ class TestEdge(TestCase):
         self.assertEqual(rels, ("rel1", "rel2"))
         self.assertEqual(dsts, ("dst1", "dst2"))
 
+    def test_columns_method(self):
+        """This checks if Edge.columns method works correctly"""
+
+        edge1 = Edge("src1", "rel1", "dst1")
+        edge2 = Edge("src2", "rel2", "dst2", weight=0.5)
+
+        srcs, rels, dsts, weights = Edge.columns([edge1, edge2])
+
+        self.assertEqual(srcs, ["src1", "src2"])
+        self.assertEqual(rels, ["rel1", "rel2"])
+        self.assertEqual(dsts, ["dst1", "dst2"])
+        self.assertEqual(weights, [1., 0.5])
+
     def test_as_pykeen_method(self):
         """This checks if Edge.as_pykeen method works correctly"""
 
@@ -61,3 +74,21 @@ class TestEdge(TestCase):
         triples = Edge.as_pykeen([edge1, edge2])
 
         self.assertIsInstance(triples, TriplesFactory)
+
+    def test_as_pykeen_ids(self):
+        """This checks that Edge.as_pykeen numbers names in sorted order and uses given mappings"""
+        edges = [Edge("b", "r2", "a"), Edge("c", "r1", "b"), Edge("b", "r2", "a")]
+
+        triples = Edge.as_pykeen(edges, create_inverse_triples=False)
+        self.assertEqual(triples.entity_to_id, {"a": 0, "b": 1, "c": 2})
+        self.assertEqual(triples.relation_to_id, {"r1": 0, "r2": 1})
+        self.assertEqual(triples.mapped_triples.tolist(), [[1, 1, 0], [2, 0, 1], [1, 1, 0]])
+
+        entity_to_id = {"a": 5, "b": 3, "c": 4, "d": 0, "e": 1, "f": 2}
+        relation_to_id = {"r1": 1, "r2": 0}
+        triples = Edge.as_pykeen(edges, create_inverse_triples=False,
+                                 entity_to_id=entity_to_id, relation_to_id=relation_to_id)
+        self.assertEqual(triples.mapped_triples.tolist(), [[3, 0, 5], [4, 1, 3], [3, 0, 5]])
+
+        self.assertRaises(KeyError, Edge.as_pykeen, edges, entity_to_id={"a": 0, "b": 1},
+                          relation_to_id=relation_to_id)
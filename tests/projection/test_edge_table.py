@@ -0,0 +1,119 @@
+from pykeen.triples.triples_factory import TriplesFactory
+from mowl.projection import Edge, EdgeTable, DL2VecProjector, OWL2VecStarProjector, \
+    TaxonomyProjector, TaxonomyWithRelsProjector
+from tests.datasetFactory import FamilyDataset
+from unittest import TestCase
+import numpy as np
+
+
+class TestEdgeTable(TestCase):
+
+    def setUp(self):
+        self.edges = [Edge("a", "r1", "b"), Edge("b", "r2", "c"), Edge("a", "r1", "b"),
+                      Edge("c", "r1", "a")]
+        self.table = EdgeTable.from_edges(self.edges)
+
+    def test_columns(self):
+        """This checks that edges are stored as int32 columns with shared vocabularies"""
+        self.assertEqual(self.table.src.dtype, np.int32)
+        self.assertEqual(self.table.entities.tolist(), ["a", "b", "c"])
+        self.assertEqual(self.table.relations.tolist(), ["r1", "r2"])
+        self.assertEqual(self.table.src.tolist(), [0, 1, 0, 2])
+        self.assertEqual(self.table.rel.tolist(), [0, 1, 0, 0])
+        self.assertIsNone(self.table.weight)
+        self.assertRaisesRegex(ValueError, "must have the same length", EdgeTable, [0], [0], [],
+                               ["a"], ["r"])
+
+    def test_sequence_of_edges(self):
+        """This checks that Edge objects are produced on iteration and indexing"""
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual([e.astuple() for e in self.table], [e.astuple() for e in self.edges])
+        self.assertIsInstance(self.table[1], Edge)
+        self.assertEqual(self.table[-1].astuple(), ("c", "r1", "a"))
+        self.assertEqual(self.table[1:3].astuples(), [("b", "r2", "c"), ("a", "r1", "b")])
+
+    def test_weights(self):
+        """This checks that weights are kept"""
+        table = EdgeTable.from_edges([Edge("a", "r", "b", weight=0.5), Edge("b", "r", "c")])
+        self.assertEqual(table.weight.tolist(), [0.5, 1.])
+        self.assertEqual([e.weight for e in table], [0.5, 1.])
+
+    def test_to_java(self):
+        """This checks that tables are passed to the JVM and back with their weights"""
+        table = EdgeTable.from_edges([Edge("a", "r", "b", weight=0.5), Edge("b", "r", "\u00e9")])
+        encoded = table.to_java()
+        self.assertEqual(encoded.size(), 2)
+        back = EdgeTable.from_java(encoded)
+        self.assertEqual(back.astuples(), table.astuples())
+        self.assertEqual(back.weight.tolist(), [0.5, 1.])
+        self.assertIsNone(EdgeTable.from_java(self.table.to_java()).weight)
+
+    def test_provenance(self):
+        """This checks that provenance is kept by selections and concatenation"""
+        table = EdgeTable(self.table.src, self.table.rel, self.table.dst, self.table.entities,
+                          self.table.relations, provenance=[10, 20, 10, 30])
+        self.assertEqual(table.provenance.dtype, np.int64)
+        self.assertEqual(table[1:3].provenance.tolist(), [20, 10])
+        self.assertEqual(EdgeTable.concat([table, table[:1]]).provenance.tolist(),
+                         [10, 20, 10, 30, 10])
+        self.assertIsNone(EdgeTable.concat([table, self.table]).provenance)
+        self.assertRaisesRegex(ValueError, "provenance must have the same length", EdgeTable,
+                               [0], [0], [0], ["a"], ["r"], provenance=[1, 2])
+
+    def test_get_entities_and_relations(self):
+        """This checks that entities and relations match the ones of Edge"""
+        expected = Edge.get_entities_and_relations(self.edges)
+        self.assertEqual(self.table.get_entities_and_relations(), expected)
+        self.assertEqual(Edge.get_entities_and_relations(self.table), expected)
+        self.assertEqual(self.table.filter_relations(["r2"]).get_entities_and_relations(),
+                         ({"b", "c"}, {"r2"}))
+
+    def test_deduplicate_and_filter(self):
+        """This checks deduplication and filtering by relation"""
+        self.assertEqual(self.table.deduplicate().astuples(),
+                         [("a", "r1", "b"), ("b", "r2", "c"), ("c", "r1", "a")])
+        self.assertEqual(self.table.filter_relations(["r2"]).astuples(), [("b", "r2", "c")])
+        self.assertEqual(len(self.table.filter_relations(["r2"], keep=False)), 3)
+        self.assertEqual(len(self.table.filter_relations(["r3"])), 0)
+
+    def test_concat(self):
+        """This checks that concatenation merges vocabularies"""
+        other = EdgeTable.from_edges([Edge("d", "r3", "a")])
+        table = self.table + other
+        self.assertIsInstance(table, EdgeTable)
+        self.assertEqual(table.astuples(), self.table.astuples() + [("d", "r3", "a")])
+        self.assertEqual(table.entities.tolist(), ["a", "b", "c", "d"])
+        self.assertEqual(len(self.table + [Edge("x", "y", "z")]), 5)
+
+    def test_as_pykeen(self):
+        """This checks the conversion to PyKEEN triples"""
+        triples = self.table.as_pykeen(create_inverse_triples=False)
+        self.assertIsInstance(triples, TriplesFactory)
+        self.assertEqual(triples.num_triples, 4)
+
+        entity_to_id = {"c": 0, "b": 1, "a": 2}
+        relation_to_id = {"r2": 0, "r1": 1}
+        triples = Edge.as_pykeen(self.table, entity_to_id=entity_to_id,
+                                 relation_to_id=relation_to_id, create_inverse_triples=False)
+        self.assertEqual(triples.mapped_triples[0].tolist(), [2, 1, 1])
+        self.assertRaises(KeyError, self.table.as_pykeen, entity_to_id={"a": 0})
+
+
+class TestProjectorsEdgeTable(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.ontology = FamilyDataset().ontology
+
+    def test_projectors_return_edge_tables(self):
+        """This checks that projectors return tables matching the projected triples"""
+        projectors = [DL2VecProjector(True), OWL2VecStarProjector(), TaxonomyProjector(True),
+                      TaxonomyWithRelsProjector(taxonomy=True, relations=["http://hasChild"])]
+        for projector in projectors:
+            table = projector.project(self.ontology)
+            self.assertIsInstance(table, EdgeTable)
+
+            triples = projector.projector.project(self.ontology)
+            expected = [(str(t.src()), str(t.rel()), str(t.dst())) for t in triples
+                        if str(t.dst()) != ""]
+            self.assertEqual(table.astuples(), expected)
@@ -0,0 +1,46 @@
+from tests.datasetFactory import PPIYeastSlimDataset
+from mowl.projection.factory import projector_factory, PARSING_METHODS
+from mowl.projection import TaxonomyWithRelsProjector
+from unittest import TestCase
+
+
+class TestProjectorFactory(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.ontology = PPIYeastSlimDataset().ontology
+
+    def test_unknown_method(self):
+        """It should raise an error for unknown projection methods"""
+        self.assertRaisesRegex(Exception, "Graph generation method unrecognized",
+                               projector_factory, "unknown")
+
+    def test_workers_parameter(self):
+        """It should raise ValueError if workers is not a positive integer"""
+        for method in PARSING_METHODS:
+            with self.subTest(method=method):
+                self.assertRaisesRegex(ValueError,
+                                       "Optional parameter workers must be a positive integer",
+                                       projector_factory, method, workers=0)
+                self.assertRaisesRegex(ValueError,
+                                       "Optional parameter workers must be a positive integer",
+                                       projector_factory, method, workers="2")
+
+    def test_parallel_projection_is_deterministic(self):
+        """It should produce the same edges in the same order for any number of workers"""
+        for method in PARSING_METHODS:
+            with self.subTest(method=method):
+                kwargs = {"taxonomy": True, "bidirectional_taxonomy": True}
+                if method == "taxonomy_rels":
+                    kwargs["relations"] = ["http://interacts_with"]
+                edges = projector_factory(method, workers=1, **kwargs).project(self.ontology)
+                parallel_edges = projector_factory(method, workers=4, **kwargs).project(
+                    self.ontology)
+
+                self.assertGreater(len(edges), 0)
+                self.assertEqual(edges.astuples(), parallel_edges.astuples())
+
+    def test_taxonomy_with_relations(self):
+        """It should create TaxonomyWithRelsProjector objects"""
+        projector = projector_factory("taxonomy_rels", relations=["http://has_label"])
+        self.assertIsInstance(projector, TaxonomyWithRelsProjector)
@@ -0,0 +1,60 @@
+from tests.datasetFactory import FamilyDataset, PPIYeastSlimDataset
+from mowl.projection import MultiProjector, EdgeTable
+from mowl.projection.factory import projector_factory
+from unittest import TestCase
+import numpy as np
+
+
+class TestMultiProjector(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.ontology = PPIYeastSlimDataset().ontology
+        self.configs = [
+            "taxonomy",
+            {"method": "taxonomy", "bidirectional_taxonomy": True},
+            {"method": "taxonomy_rels", "taxonomy": True,
+             "relations": ["http://interacts_with"]},
+            {"method": "dl2vec", "bidirectional_taxonomy": True},
+            {"method": "owl2vec_star", "include_literals": True},
+        ]
+
+    def test_constructor_parameter_types(self):
+        """It should raise errors for invalid configurations"""
+        self.assertRaisesRegex(TypeError, "Parameter configs must be a list", MultiProjector,
+                               "taxonomy")
+        self.assertRaisesRegex(ValueError, "must have the key 'method'", MultiProjector,
+                               [{"bidirectional_taxonomy": True}])
+        self.assertRaisesRegex(Exception, "Graph generation method unrecognized", MultiProjector,
+                               ["unknown"])
+
+    def test_project_method_parameter_types(self):
+        """It should raise TypeError if the ontology is not an OWLOntology"""
+        projector = MultiProjector(["taxonomy"])
+        self.assertRaisesRegex(
+            TypeError,
+            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology",
+            projector.project, "ontology")
+
+    def test_same_edges_as_single_projectors(self):
+        """It should produce the edges of each projector in the same order"""
+        tables = MultiProjector(self.configs).project(self.ontology)
+        self.assertEqual(len(tables), len(self.configs))
+
+        for config, table in zip(self.configs, tables):
+            config = {"method": config} if isinstance(config, str) else dict(config)
+            with self.subTest(method=config["method"]):
+                method = config.pop("method")
+                expected = projector_factory(method, **config).project(self.ontology)
+                self.assertIsInstance(table, EdgeTable)
+                self.assertEqual(table.astuples(), expected.astuples())
+
+    def test_shared_vocabularies(self):
+        """It should encode all the tables with the same vocabularies"""
+        taxonomy, dl2vec = MultiProjector(["taxonomy", "dl2vec"]).project(
+            FamilyDataset().ontology)
+        self.assertTrue(np.shares_memory(taxonomy.entities, dl2vec.entities))
+        self.assertTrue(np.shares_memory(taxonomy.relations, dl2vec.relations))
+        self.assertIn(("http://Parent", "http://hasChild", "http://www.w3.org/2002/07/owl#Thing"),
+                      dl2vec.astuples())
+        self.assertNotIn("http://hasChild", taxonomy.get_entities_and_relations()[1])
@@ -1,4 +1,6 @@
 from mowl.projection import OWL2VecStarProjector
+from mowl.owlapi import OWLAPIAdapter
+from org.semanticweb.owlapi.model import IRI
 from unicodedata import bidirectional
 from unittest import TestCase
 
@@ -41,5 +43,40 @@ class TestOwl2VecStar(TestCase):
             "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology",
             projector.project, None)
 
+    def test_annotation_index(self):
+        """This should project lexical annotations from the annotation index and report its \
+        size"""
+        adapter = OWLAPIAdapter()
+        factory = adapter.data_factory
+        ontology = adapter.owl_manager.createOntology()
+        label = factory.getRDFSLabel()
+        subset = factory.getOWLAnnotationProperty(
+            IRI.create("http://www.geneontology.org/formats/oboInOwl#inSubset"))
+        axioms = []
+        for name in ["A", "B"]:
+            owl_class = adapter.create_class(f"http://{name}")
+            axioms.append(factory.getOWLDeclarationAxiom(owl_class))
+            axioms.append(factory.getOWLAnnotationAssertionAxiom(
+                label, owl_class.getIRI(), factory.getOWLLiteral(f"class {name}")))
+            axioms.append(factory.getOWLAnnotationAssertionAxiom(
+                subset, owl_class.getIRI(), factory.getOWLLiteral("slim")))
+        for axiom in axioms:
+            adapter.owl_manager.addAxiom(ontology, axiom)
+
+        projector = OWL2VecStarProjector(include_literals=True)
+        self.assertIsNone(projector.annotation_index_stats)
+        edges = projector.project(ontology)
+        self.assertEqual({edge.astuple() for edge in edges},
+                         {("http://A", "rdfs:label", "class A"),
+                          ("http://B", "rdfs:label", "class B")})
+
+        stats = projector.annotation_index_stats
+        self.assertEqual(stats["subjects"], 2)
+        self.assertEqual(stats["axioms"], 4)
+        self.assertEqual(stats["edges"], 2)
+        self.assertGreater(stats["bytes"], 0)
+
+        self.assertEqual(len(OWL2VecStarProjector().project(ontology)), 0)
+
     # TODO: Add test to check if projection result is correct. Do this by comparing with
     # original OWL2VecStar.
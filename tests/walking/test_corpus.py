@@ -0,0 +1,104 @@
+from mowl.walking import DeepWalk, Node2Vec, Walks, WalkCorpus, walk_files
+from mowl.projection import Edge
+from unittest import TestCase
+import json
+from collections import Counter
+import os
+import tempfile
+
+
+class TestWalkCorpus(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.graph = [Edge("A", "http://rel1", "B"), Edge("B", "http://rel1", "C"),
+                      Edge("C", "http://rel1", "D"), Edge("B", "http://rel2", "D"),
+                      Edge("A", "http://rel1", "C"), Edge("C", "http://rel2", "D")]
+        self.nodes, _ = Edge.get_entities_and_relations(self.graph)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outfile = os.path.join(self.tmp.name, "walks.txt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shards_are_concatenated_by_default(self):
+        """This checks that the shards of the workers are merged into outfile and removed"""
+        walker = DeepWalk(10, 5, outfile=self.outfile, workers=3)
+        walker.walk(self.graph)
+
+        self.assertEqual(os.listdir(self.tmp.name), ["walks.txt"])
+        self.assertEqual(walker.walk_files, [self.outfile])
+        self.assertEqual(len(list(Walks(self.outfile))), 10 * len(self.nodes))
+        self.assertEqual(len(walker.walks_per_second), 3)
+
+    def test_shards_are_kept_without_concatenation(self):
+        """This checks the shards and manifest written with concatenate=False"""
+        for walker in [DeepWalk(10, 5, outfile=self.outfile, workers=3, concatenate=False),
+                       Node2Vec(10, 5, p=0.5, outfile=self.outfile, workers=3,
+                                concatenate=False)]:
+            with self.subTest(walker=type(walker).__name__):
+                walker.walk(self.graph)
+                files = walker.walk_files
+                self.assertEqual([os.path.basename(f) for f in files],
+                                 ["walks.txt.part-0000", "walks.txt.part-0001",
+                                  "walks.txt.part-0002"])
+
+                with open(self.outfile + ".manifest.json") as f:
+                    manifest = json.load(f)
+                walks = list(Walks(self.outfile))
+                self.assertEqual(manifest["walks"], len(walks))
+                self.assertEqual(len(walks), 10 * len(self.nodes))
+                self.assertEqual(files, walk_files(self.outfile + ".manifest.json"))
+                self.assertTrue(all(walk[0] in self.nodes for walk in walks))
+
+    def test_walk_files_of_missing_path(self):
+        """This checks that reading walks that do not exist raises an error"""
+        self.assertRaises(FileNotFoundError, walk_files, self.outfile)
+        self.assertRaisesRegex(TypeError, "Parameter path must be a string", walk_files, 1)
+
+    def test_concatenate_type(self):
+        """This checks the type of the concatenate parameter"""
+        self.assertRaisesRegex(TypeError, "Optional parameter concatenate must be a boolean",
+                               DeepWalk, 10, 5, concatenate="no")
+
+    def test_binary_corpus(self):
+        """This checks that binary walks hold the same walks as text walks"""
+        for concatenate in [True, False]:
+            with self.subTest(concatenate=concatenate):
+                outfile = os.path.join(self.tmp.name, f"walks_{concatenate}.bin")
+                walker = Node2Vec(10, 5, p=0.5, outfile=outfile, workers=3,
+                                  concatenate=concatenate, walks_format="binary")
+                walker.walk(self.graph)
+                corpus = WalkCorpus(outfile)
+
+                self.assertEqual(len(corpus), 10 * len(self.nodes))
+                walks = list(corpus)
+                self.assertEqual(len(walks), len(corpus))
+                self.assertEqual(sum(len(walk) for walk in walks), corpus.num_tokens)
+                for i, (walk, ids) in enumerate(zip(walks, corpus.walk_ids())):
+                    self.assertEqual(walk, [corpus.vocabulary[j] for j in ids])
+                    self.assertEqual(ids.tolist(), corpus[i].tolist())
+                    self.assertIn(walk[0], self.nodes)
+                    self.assertLessEqual(len(walk), 2 * 5 - 1)
+                self.assertEqual(corpus[-1].tolist(), corpus[len(corpus) - 1].tolist())
+                counts = dict(zip(corpus.vocabulary, corpus.counts().tolist()))
+                self.assertEqual({k: v for k, v in counts.items() if v > 0},
+                                 dict(Counter(token for walk in walks for token in walk)))
+                self.assertRaises(IndexError, corpus.__getitem__, len(corpus))
+
+    def test_binary_and_text_readers_check_format(self):
+        """This checks that each reader rejects shards of the other format"""
+        DeepWalk(2, 5, outfile=self.outfile, concatenate=False,
+                 walks_format="binary").walk(self.graph)
+        self.assertRaisesRegex(ValueError, "not in text format", Walks, self.outfile)
+
+        text = os.path.join(self.tmp.name, "text.txt")
+        DeepWalk(2, 5, outfile=text, concatenate=False).walk(self.graph)
+        self.assertRaisesRegex(ValueError, "not in binary format", WalkCorpus, text)
+
+    def test_walks_format_value(self):
+        """This checks the value of the walks_format parameter"""
+        self.assertRaisesRegex(ValueError, "Optional parameter walks_format must be one of",
+                               Node2Vec, 10, 5, walks_format="parquet")
@@ -74,6 +74,24 @@ class TestDeepWalk(TestCase):
         self.assertEqual(cm.output, ["INFO:deepwalk:Node X does not exist in the graph. \
 Ignoring it."])
 
+    def test_walks_follow_edges(self):
+        """This checks that every step of a walk is an edge of the graph"""
+        edges = {edge.astuple() for edge in self.graph}
+        walker = DeepWalk(10, 5, alpha=0.2, workers=2)
+        walker.walk(self.graph)
+        with open(walker.outfile, "r") as f:
+            walks = [line.split() for line in f]
+
+        self.assertEqual(len(walks), 10 * len(self.nodes))
+        for walk in walks:
+            self.assertLessEqual(len(walk), 2 * 5 - 1)
+            for i in range(1, len(walk), 2):
+                src, rel, dst = walk[i - 1:i + 2]
+                if rel == "*****":
+                    self.assertEqual(dst, walk[0])
+                    continue
+                self.assertIn((src, rel, dst), edges)
+
     def test_passing_outfile_name(self):
         """This checks that outfile name passed to walking method is created"""
         num_walks = 10
@@ -85,3 +103,26 @@ Ignoring it."])
         time.sleep(1)
         self.assertTrue(os.path.exists(outfile))
         os.remove(outfile)
+
+    def test_seed_gives_identical_walks(self):
+        """This checks that walks with the same seed and workers are byte-identical"""
+        contents = []
+        for seed in [42, 42, 7]:
+            walker = DeepWalk(10, 5, alpha=0.2, workers=3, seed=seed)
+            walker.walk(self.graph)
+            with open(walker.outfile, "rb") as f:
+                contents.append(f.read())
+
+        self.assertEqual(contents[0], contents[1])
+        self.assertNotEqual(contents[0], contents[2])
+        self.assertRaisesRegex(TypeError, "Optional parameter seed must be an integer",
+                               DeepWalk, 10, 5, seed="42")
+
+    def test_start_nodes(self):
+        """This checks that walks only start from start_nodes"""
+        walker = DeepWalk(10, 5, alpha=0.2, workers=2)
+        walker.walk(self.graph, start_nodes=["A", "C"])
+        with open(walker.outfile, "r") as f:
+            starts = [line.split()[0] for line in f]
+
+        self.assertEqual(sorted(starts), ["A"] * 10 + ["C"] * 10)
@@ -13,6 +13,8 @@ class TestFactoryMethod(TestCase):
 
         # Test Node2Vec
         self.assertIsInstance(walker_factory("node2vec", 1, 1), Node2Vec)
+        walker = walker_factory("node2vec", 1, 1, p=0.5, sampler="rejection")
+        self.assertEqual(walker.sampler, "rejection")
 
         # Test if exception is raised when walker name is not valid
         self.assertRaisesRegex(ValueError, err.INVALID_WALKER_NAME, walker_factory,
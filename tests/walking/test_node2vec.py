@@ -1,6 +1,7 @@
 import time
 from mowl.walking import Node2Vec
-from mowl.projection import Edge
+from mowl.walking.node2vec.model import SAMPLERS
+from mowl.projection import Edge, EdgeTable
 from unittest import TestCase
 
 
@@ -55,6 +56,9 @@ class TestNode2Vec(TestCase):
         self.assertRaisesRegex(TypeError, "Optional parameter q must be a float", Node2Vec,
                                num_walks, walk_length, q=q)
 
+        self.assertRaisesRegex(ValueError, "Optional parameter sampler must be one of",
+                               Node2Vec, num_walks, walk_length, sampler="metropolis")
+
     def test_node2vec_number_of_walks(self):
         """This method tests if the number of walks is correct"""
         num_walks = 10
@@ -78,3 +82,131 @@ class TestNode2Vec(TestCase):
 
         self.assertEqual(cm.output, ["INFO:node2vec:Node X does not exist in the graph. \
 Ignoring it."])
+
+    def test_walks_follow_edges(self):
+        """This checks that every step of a walk is an edge of the graph"""
+        edges = {edge.astuple() for edge in self.graph}
+        for sampler in SAMPLERS:
+            for p, q in [(0.5, 2.), (1., 1.)]:
+                with self.subTest(sampler=sampler, p=p, q=q):
+                    walker = Node2Vec(10, 5, p=p, q=q, workers=2, sampler=sampler)
+                    walker.walk(self.graph)
+                    with open(walker.outfile, "r") as f:
+                        walks = [line.split() for line in f]
+
+                    self.assertEqual(len(walks), 10 * len(self.nodes))
+                    for walk in walks:
+                        self.assertLessEqual(len(walk), 2 * 5 - 1)
+                        for i in range(1, len(walk), 2):
+                            src, rel, dst = walk[i - 1:i + 2]
+                            self.assertIn((src, rel, dst), edges)
+
+    def test_second_order_probabilities(self):
+        """This checks that both samplers follow the transition probabilities of node2vec"""
+        graph = [Edge("A", "r", "B"), Edge("B", "r", "A"), Edge("B", "r", "C"),
+                 Edge("B", "r", "D"), Edge("C", "r", "A")]
+        # After A -> B, returning to A is weighted 1 / p, C is a neighbor of A and is weighted
+        # 1 and D is weighted 1 / q.
+        expected = {"A": 2 / 3.5, "C": 1 / 3.5, "D": 0.5 / 3.5}
+        num_walks = 4000
+
+        for sampler in SAMPLERS:
+            with self.subTest(sampler=sampler):
+                walker = Node2Vec(num_walks, 3, p=0.5, q=2., sampler=sampler)
+                walker.walk(graph)
+                with open(walker.outfile, "r") as f:
+                    steps = [line.split()[4] for line in f if line.startswith("A ")]
+
+                self.assertEqual(len(steps), num_walks)
+                for node, probability in expected.items():
+                    self.assertAlmostEqual(steps.count(node) / num_walks, probability, delta=0.03)
+
+    def test_seed_gives_identical_walks(self):
+        """This checks that walks with the same seed and workers are byte-identical"""
+        for sampler in SAMPLERS:
+            with self.subTest(sampler=sampler):
+                contents = []
+                for seed in [42, 42, 7]:
+                    walker = Node2Vec(10, 5, p=0.5, q=2., workers=3, sampler=sampler,
+                                      seed=seed, walks_format="binary")
+                    walker.walk(self.graph)
+                    with open(walker.outfile, "rb") as f:
+                        contents.append(f.read())
+
+                self.assertEqual(contents[0], contents[1])
+                self.assertNotEqual(contents[0], contents[2])
+
+    def test_edge_table_input(self):
+        """This checks that an EdgeTable gives the walks of its edges, weights included"""
+        graph = [Edge("A", "r", "B", weight=1.), Edge("A", "r", "C", weight=0.),
+                 Edge("B", "s", "A"), Edge("C", "s", "A")]
+        walks = []
+        for edges in [graph, EdgeTable.from_edges(graph)]:
+            walker = Node2Vec(20, 4, seed=3)
+            walker.walk(edges, start_nodes=["A"])
+            with open(walker.outfile, "r") as f:
+                walks.append(f.read())
+
+        self.assertEqual(walks[0], walks[1])
+        self.assertEqual(len(walks[0].splitlines()), 20)
+        self.assertNotIn("C", walks[0].split())
+
+    def test_preprocessing_stats(self):
+        """This checks that the size of the alias tables is reported"""
+        walker = Node2Vec(2, 5, p=0.5, q=2., workers=2)
+        self.assertIsNone(walker.preprocessing_stats)
+        walker.walk(self.graph)
+        stats = walker.preprocessing_stats
+        num_nodes_with_edges = len({edge.src for edge in self.graph})
+        self.assertEqual(stats["nodes"], num_nodes_with_edges)
+        # Node tables have one entry per edge and edge tables one per neighbor of the
+        # destination. Entries are an int and a float, and each edge stores where its table
+        # starts.
+        degree = {node: sum(edge.src == node for edge in self.graph) for node in self.nodes}
+        entries = len(self.graph) + sum(degree[edge.dst] for edge in self.graph)
+        self.assertEqual(stats["bytes"], 8 * entries + 4 * len(self.graph))
+        self.assertEqual(stats["edges"], sum(degree[edge.dst] > 0 for edge in self.graph))
+        self.assertGreater(stats["peak_heap_bytes"], 0)
+
+    def test_start_nodes(self):
+        """This checks that walks only start from start_nodes and keep the probabilities"""
+        graph = [Edge("A", "r", "B"), Edge("B", "r", "A"), Edge("B", "r", "C"),
+                 Edge("B", "r", "D"), Edge("C", "r", "A")]
+        expected = {"A": 2 / 3.5, "C": 1 / 3.5, "D": 0.5 / 3.5}
+        num_walks = 4000
+
+        for sampler in SAMPLERS:
+            with self.subTest(sampler=sampler):
+                walker = Node2Vec(num_walks, 3, p=0.5, q=2., sampler=sampler, workers=2)
+                with self.assertLogs("node2vec", level="INFO") as cm:
+                    walker.walk(graph, start_nodes=["A", "X"])
+                self.assertEqual(cm.output, ["INFO:node2vec:Node X does not exist in the graph. "
+                                             "Ignoring it."])
+                with open(walker.outfile, "r") as f:
+                    walks = [line.split() for line in f]
+
+                self.assertEqual(len(walks), num_walks)
+                self.assertTrue(all(walk[0] == "A" for walk in walks))
+                steps = [walk[4] for walk in walks]
+                for node, probability in expected.items():
+                    self.assertAlmostEqual(steps.count(node) / num_walks, probability, delta=0.03)
+
+    def test_start_nodes_limit_preprocessing(self):
+        """This checks that alias tables are only built near the start nodes"""
+        chain = [Edge(f"N{i}", "r", f"N{i + 1}") for i in range(10)]
+        chain += [Edge(f"N{i + 1}", "r", f"N{i}") for i in range(10)]
+
+        walker = Node2Vec(2, 4, p=0.5, q=2.)
+        java_walker = walker._walker(chain, None, ["N0"])
+        java_walker.walk()
+        # Steps are taken from N0, N1 and N2, and edge tables are only needed after the edges
+        # leaving N0 and N1.
+        self.assertEqual(java_walker.preprocessedNodes(), 1)
+        self.assertEqual(java_walker.preprocessedEdges(), 3)
+        with open(walker.outfile, "r") as f:
+            self.assertTrue(all(line.startswith("N0 ") for line in f))
+
+        java_walker = walker._walker(chain, None, None)
+        java_walker.walk()
+        self.assertEqual(java_walker.preprocessedNodes(), 11)
+        self.assertEqual(java_walker.preprocessedEdges(), 20)
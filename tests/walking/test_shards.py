@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from mowl.projection import Edge
+from mowl.walking import DeepWalk, merge_walk_shards, Node2Vec, WalkCorpus, Walks
+from mowl.walking.corpus import manifest_path
+from mowl.walking.output import walk_shard_path
+
+
+def sorted_walks(walks):
+    return sorted(" ".join(walk) for walk in walks)
+
+
+class TestWalkShards(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.graph = [
+            Edge("A", "http://rel1", "B"),
+            Edge("B", "http://rel1", "C"),
+            Edge("C", "http://rel1", "D"),
+            Edge("B", "http://rel2", "D"),
+            Edge("A", "http://rel1", "C"),
+            Edge("C", "http://rel2", "D"),
+            Edge("D", "http://rel2", "A"),
+            Edge("D", "http://rel1", "E"),
+            Edge("E", "http://rel1", "B"),
+        ]
+
+    def walkers(self, outfile):
+        for backend in ["jvm", "numpy"]:
+            yield DeepWalk(7, 6, 0.2, outfile=outfile, workers=2, seed=11, backend=backend)
+            yield Node2Vec(7, 6, p=0.5, q=2., outfile=outfile, workers=2, seed=11,
+                           backend=backend)
+            yield Node2Vec(7, 6, p=0.5, q=2., sampler="rejection", outfile=outfile, workers=2,
+                           seed=11, backend=backend)
+
+    def test_shards_give_the_walks_of_a_single_run(self):
+        """This checks that the union of the shards are the walks of a single run"""
+        directory = tempfile.mkdtemp()
+        for walker in self.walkers(os.path.join(directory, "single")):
+            with self.subTest(walker=type(walker).__name__, backend=walker.backend):
+                walker.walk(self.graph)
+                expected = sorted_walks(Walks(walker.outfile))
+
+                walker.outfile = os.path.join(directory, f"sharded-{id(walker)}")
+                for shard_id in range(3):
+                    manifest = walker.walk_shard(self.graph, shard_id, 3)
+                    self.assertEqual(manifest,
+                                     manifest_path(walk_shard_path(walker.outfile, shard_id)))
+                merge_walk_shards(walker.outfile)
+
+                self.assertEqual(sorted_walks(Walks(walker.outfile)), expected)
+
+    def test_jvm_walks_do_not_depend_on_workers(self):
+        """This checks that seeded walks of the JVM are the same for any number of workers"""
+        walks = []
+        for workers in [1, 3]:
+            walker = Node2Vec(6, 5, p=2., q=0.5, workers=workers, seed=5)
+            walker.walk(self.graph)
+            walks.append(sorted_walks(Walks(walker.outfile)))
+        self.assertEqual(walks[0], walks[1])
+
+    def test_shards_in_processes(self):
+        """This checks that shards written by separate processes merge into a single run"""
+        outfile = os.path.join(tempfile.mkdtemp(), "walks")
+        triples = [(edge.src, edge.rel, edge.dst) for edge in self.graph]
+        code = ("import sys\n"
+                "from mowl.projection import Edge\n"
+                "from mowl.walking import Node2Vec\n"
+                f"edges = [Edge(*edge) for edge in {triples}]\n"
+                f"walker = Node2Vec(5, 6, p=2., q=0.5, outfile={outfile!r}, "
+                "walks_format='binary', backend='numpy')\n"
+                "walker.walk_shard(edges, int(sys.argv[1]), 3, seed=99)\n")
+        processes = [subprocess.Popen([sys.executable, "-c", code, str(shard_id)])
+                     for shard_id in range(3)]
+        self.assertEqual([process.wait() for process in processes], [0, 0, 0])
+
+        merge_walk_shards(outfile, num_shards=3)
+        with open(manifest_path(outfile)) as f:
+            self.assertEqual(json.load(f)["walks"], 5 * 5)
+
+        single = Node2Vec(5, 6, p=2., q=0.5, walks_format="binary", seed=99, backend="numpy")
+        single.walk(self.graph)
+        self.assertEqual(sorted_walks(WalkCorpus(outfile)),
+                         sorted_walks(WalkCorpus(single.outfile)))
+
+    def test_merge_validates_shards(self):
+        """This checks that incomplete or inconsistent shards are not merged"""
+        outfile = os.path.join(tempfile.mkdtemp(), "walks")
+        self.assertRaises(FileNotFoundError, merge_walk_shards, outfile)
+
+        DeepWalk(2, 3, 0.1, outfile=outfile, seed=1, backend="numpy").walk_shard(
+            self.graph, 0, 2)
+        self.assertRaisesRegex(ValueError, r"Missing walk shards \[1\]", merge_walk_shards,
+                               outfile)
+
+        DeepWalk(2, 3, 0.1, outfile=outfile, seed=2, backend="numpy").walk_shard(
+            self.graph, 1, 2)
+        self.assertRaisesRegex(ValueError, "Shard 1 was generated with seed=2",
+                               merge_walk_shards, outfile)
+
+        DeepWalk(2, 3, 0.1, outfile=outfile, seed=1, backend="numpy").walk_shard(
+            self.graph, 1, 2)
+        merge_walk_shards(outfile)
+        self.assertEqual(len(list(Walks(outfile))), 2 * 5)
+
+    def test_walk_shard_parameters(self):
+        """This checks the parameters of walk_shard"""
+        walker = DeepWalk(2, 3, 0.1, backend="numpy")
+        self.assertRaisesRegex(ValueError, "Walk shards require a seed", walker.walk_shard,
+                               self.graph, 0, 2)
+        self.assertRaisesRegex(TypeError, "Parameter num_shards must be a positive integer",
+                               walker.walk_shard, self.graph, 0, 0, seed=1)
+        self.assertRaisesRegex(ValueError, "Parameter shard_id must be between 0 and",
+                               walker.walk_shard, self.graph, 2, 2, seed=1)
@@ -0,0 +1,70 @@
+from mowl.walking import DeepWalk, Node2Vec
+from mowl.walking.stream import WalkStream
+from mowl.projection import Edge
+from gensim.models import Word2Vec
+from unittest import TestCase
+import os
+import tempfile
+
+
+class TestWalkStream(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.graph = [Edge("A", "http://rel1", "B"), Edge("B", "http://rel1", "C"),
+                      Edge("C", "http://rel1", "D"), Edge("B", "http://rel2", "D"),
+                      Edge("A", "http://rel1", "C"), Edge("C", "http://rel2", "D")]
+        self.nodes, _ = Edge.get_entities_and_relations(self.graph)
+        self.edges = {edge.astuple() for edge in self.graph}
+
+    def test_stream_yields_walks(self):
+        """This checks that streamed walks follow the edges and no walk file is written"""
+        with tempfile.TemporaryDirectory() as tmp:
+            outfile = os.path.join(tmp, "walks.txt")
+            for walker in [DeepWalk(10, 5, outfile=outfile, workers=2),
+                           Node2Vec(10, 5, p=0.5, q=2., outfile=outfile, workers=2)]:
+                with self.subTest(walker=type(walker).__name__):
+                    stream = walker.stream(self.graph, queue_size=2, batch_size=3)
+                    self.assertIsInstance(stream, WalkStream)
+                    walks = list(stream)
+                    self.assertEqual(len(walks), 10 * len(self.nodes))
+                    for walk in walks:
+                        self.assertIn(walk[0], self.nodes)
+                        for i in range(1, len(walk), 2):
+                            if walk[i] != "*****":
+                                self.assertIn(tuple(walk[i - 1:i + 2]), self.edges)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_stream_is_restartable(self):
+        """This checks that every iteration of a stream runs the walker again"""
+        stream = Node2Vec(4, 5, p=0.5, workers=3).stream(self.graph, batch_size=2, as_ids=True)
+        first = list(stream)
+        second = list(stream)
+        self.assertEqual(len(first), 4 * len(self.nodes))
+        self.assertEqual(len(second), len(first))
+        names = [stream.vocabulary[i] for i in first[0]]
+        self.assertIn(names[0], self.nodes)
+
+    def test_stopping_iteration_early(self):
+        """This checks that a stream can be restarted after the consumer stops early"""
+        stream = DeepWalk(200, 5, workers=2).stream(self.graph, queue_size=1, batch_size=1)
+        for i, _ in enumerate(stream):
+            if i == 3:
+                break
+        self.assertEqual(len(list(stream)), 200 * len(self.nodes))
+
+    def test_stream_to_word2vec(self):
+        """This checks that a stream can be given to Word2Vec"""
+        stream = DeepWalk(10, 5).stream(self.graph)
+        w2v = Word2Vec(stream, vector_size=5, min_count=1, epochs=2)
+        self.assertTrue(all(node in w2v.wv for node in self.nodes))
+
+    def test_stream_parameter_types(self):
+        """This checks the types of the parameters of stream"""
+        walker = DeepWalk(10, 5)
+        self.assertRaisesRegex(TypeError, "Optional parameter queue_size must be a positive "
+                               "integer", walker.stream, self.graph, queue_size=0)
+        self.assertRaisesRegex(TypeError, "Optional parameter batch_size must be a positive "
+                               "integer", walker.stream, self.graph, batch_size="1")
+        self.assertRaisesRegex(TypeError, "Optional parameter as_ids must be a boolean",
+                               walker.stream, self.graph, as_ids=1)
@@ -0,0 +1,198 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from unittest import TestCase
+
+import numpy as np
+
+from mowl.projection import Edge, EdgeTable
+from mowl.walking import DeepWalk, Node2Vec
+from mowl.walking.corpus import manifest_path, WalkCorpus, Walks
+from mowl.walking.vectorized import alias_tables, CSRGraph, VectorizedNode2Vec
+
+
+class TestVectorized(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.graph = [
+            Edge("A", "http://rel1", "B"),
+            Edge("B", "http://rel1", "C"),
+            Edge("C", "http://rel1", "D"),
+            Edge("B", "http://rel2", "D"),
+            Edge("A", "http://rel1", "C"),
+            Edge("C", "http://rel2", "D"),
+            Edge("D", "http://rel2", "A"),
+        ]
+        self.nodes, self.rels = Edge.get_entities_and_relations(self.graph)
+        self.pairs = {(edge.src, edge.rel, edge.dst) for edge in self.graph}
+
+    def assertFollowsEdges(self, walks, restart_token=None):
+        for walk in walks:
+            for i in range(1, len(walk), 2):
+                if walk[i] == restart_token:
+                    self.assertEqual(walk[i + 1], walk[0])
+                else:
+                    self.assertIn((walk[i - 1], walk[i], walk[i + 1]), self.pairs)
+
+    def test_alias_tables(self):
+        """This method tests that alias tables built in lockstep give their distributions"""
+        probs = np.array([1., 2., 3., 4., 5., 5.])
+        sizes = np.array([1, 3, 2])
+        J, q = alias_tables(probs, sizes)
+
+        starts = [0, 1, 4]
+        for start, size in zip(starts, sizes):
+            expected = probs[start:start + size] / probs[start:start + size].sum()
+            actual = np.zeros(size)
+            for k in range(size):
+                actual[k] += q[start + k] / size
+                actual[J[start + k]] += (1 - q[start + k]) / size
+            np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+    def test_csr_graph(self):
+        """This method tests the rows of the graph of an edge table"""
+        table = EdgeTable.from_edges(self.graph)
+        graph = CSRGraph.from_table(table, ["*****"], sort_neighbors=True)
+        names = graph.names
+
+        self.assertEqual(names[:len(table.entities)], table.entities.tolist())
+        self.assertIn("*****", names)
+        self.assertEqual(graph.num_edges, len(self.graph))
+        rows = set()
+        for node in range(graph.num_nodes):
+            neighbors = graph.neighbors[graph.offsets[node]:graph.offsets[node + 1]]
+            self.assertEqual(neighbors.tolist(), sorted(neighbors.tolist()))
+            for edge in range(graph.offsets[node], graph.offsets[node + 1]):
+                rows.add((names[node], names[graph.relations[edge]],
+                          names[graph.neighbors[edge]]))
+        self.assertEqual(rows, self.pairs)
+
+        ids = {name: i for i, name in enumerate(names)}
+        self.assertEqual(graph.has_edge([ids["A"], ids["D"], ids["B"]],
+                                        [ids["B"], ids["A"], ids["A"]]).tolist(),
+                         [True, True, False])
+
+    def test_deepwalk_numpy_walks_follow_edges(self):
+        """This method tests that the walks of the NumPy backend follow the edges"""
+        num_walks = 10
+        walk_length = 5
+        deepwalk = DeepWalk(num_walks, walk_length, 0.2, workers=2, seed=1, backend="numpy")
+        deepwalk.walk(self.graph)
+
+        walks = list(Walks(deepwalk.outfile))
+        self.assertEqual(len(walks), num_walks * len(self.nodes))
+        self.assertTrue(all(len(walk) == 2 * walk_length - 1 for walk in walks))
+        self.assertFollowsEdges(walks, restart_token="*****")
+        self.assertEqual(len(deepwalk.walks_per_second), 2)
+
+    def test_node2vec_numpy_walks_follow_edges(self):
+        """This method tests that Node2Vec walks of both samplers follow the edges"""
+        for sampler in ["alias", "rejection"]:
+            with self.subTest(sampler=sampler):
+                node2vec = Node2Vec(10, 6, p=0.5, q=2., sampler=sampler, seed=1,
+                                    backend="numpy")
+                node2vec.walk(self.graph)
+                walks = list(Walks(node2vec.outfile))
+                self.assertEqual(len(walks), 10 * len(self.nodes))
+                self.assertFollowsEdges(walks)
+                self.assertEqual(node2vec.preprocessing_stats["nodes"], len(self.nodes))
+
+    def test_numpy_walks_are_reproducible(self):
+        """This method tests that a seed gives the same walks for any number of workers"""
+        walks = []
+        for workers in [1, 3]:
+            node2vec = Node2Vec(6, 8, p=2., q=0.5, workers=workers, seed=7, backend="numpy")
+            node2vec.walk(self.graph)
+            with open(node2vec.outfile) as f:
+                walks.append(f.read())
+        self.assertEqual(walks[0], walks[1])
+
+        node2vec = Node2Vec(6, 8, p=2., q=0.5, seed=8, backend="numpy")
+        node2vec.walk(self.graph)
+        with open(node2vec.outfile) as f:
+            self.assertNotEqual(f.read(), walks[0])
+
+    def test_numpy_binary_shards(self):
+        """This method tests binary walks written in shards with a manifest"""
+        outfile = os.path.join(tempfile.mkdtemp(), "walks")
+        deepwalk = DeepWalk(5, 4, 0.1, outfile=outfile, workers=2, concatenate=False,
+                            walks_format="binary", seed=3, backend="numpy")
+        deepwalk.walk(self.graph)
+
+        with open(manifest_path(outfile)) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["format"], "binary")
+        self.assertEqual(len(manifest["shards"]), 2)
+        self.assertEqual(manifest["walks"], 5 * len(self.nodes))
+
+        corpus = WalkCorpus(outfile)
+        self.assertEqual(len(corpus), 5 * len(self.nodes))
+        self.assertFollowsEdges(list(corpus), restart_token="*****")
+
+    def test_numpy_start_nodes_and_nodes_of_interest(self):
+        """This method tests that walks start from start_nodes and contain nodes of interest"""
+        deepwalk = DeepWalk(10, 3, 0., seed=1, backend="numpy")
+        deepwalk.walk(self.graph, start_nodes=["A", "B"])
+        walks = list(Walks(deepwalk.outfile))
+        self.assertEqual(len(walks), 20)
+        self.assertEqual(Counter(walk[0] for walk in walks), {"A": 10, "B": 10})
+
+        deepwalk.walk(self.graph, nodes_of_interest=["D"])
+        walks = list(Walks(deepwalk.outfile))
+        self.assertLess(len(walks), 10 * len(self.nodes))
+        self.assertTrue(all("D" in walk for walk in walks))
+
+    def test_node2vec_numpy_transition_probabilities(self):
+        """This method tests that the second step follows the Node2Vec distribution"""
+        # From B after A -> B: back to A with weight 1 / p, to C, which has an edge to A, with
+        # weight 1 and to D with weight 1 / q.
+        graph = [Edge("A", "r", "B"), Edge("B", "r", "A"), Edge("C", "r", "A"),
+                 Edge("B", "r", "C"), Edge("B", "r", "D")]
+        p, q = 0.5, 4.
+        expected = np.array([1 / p, 1., 1 / q])
+        expected /= expected.sum()
+
+        for sampler in ["alias", "rejection"]:
+            with self.subTest(sampler=sampler):
+                walker = VectorizedNode2Vec(EdgeTable.from_edges(graph), 1, 3, p, q, sampler,
+                                            None, seed=5, start_nodes=["A"])
+                walker.preprocess()
+                counts = Counter()
+                for walk_round in range(4000):
+                    ids, offsets = next(walker._batches([walk_round]))
+                    walk = [walker.vocabulary[i] for i in ids]
+                    if walk[2] == "B":
+                        counts[walk[4]] += 1
+                total = sum(counts.values())
+                actual = np.array([counts["A"], counts["C"], counts["D"]]) / total
+                np.testing.assert_allclose(actual, expected, atol=0.04)
+
+    def test_numpy_backend_does_not_start_the_jvm(self):
+        """This method tests that the NumPy backend walks without the JVM"""
+        code = ("import jpype\n"
+                "from mowl.projection import Edge\n"
+                "from mowl.walking import DeepWalk, Node2Vec\n"
+                "edges = [Edge('A', 'r', 'B'), Edge('B', 'r', 'A')]\n"
+                "DeepWalk(2, 3, 0.1, seed=0, backend='numpy').walk(edges)\n"
+                "Node2Vec(2, 3, p=2., seed=0, backend='numpy').walk(edges)\n"
+                "print(jpype.isJVMStarted())\n")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+    def test_backend_must_be_known(self):
+        """This method tests that unknown backends raise an error"""
+        self.assertRaisesRegex(ValueError, "Optional parameter backend must be one of",
+                               DeepWalk, 1, 2, 0.1, backend="torch")
+
+    def test_numpy_stream(self):
+        """This method tests that the NumPy backend streams the walks of all rounds"""
+        deepwalk = DeepWalk(4, 3, 0.1, seed=2, backend="numpy")
+        walks = list(deepwalk.stream(self.graph, batch_size=3))
+        self.assertEqual(len(walks), 4 * len(self.nodes))
+        self.assertFollowsEdges(walks, restart_token="*****")
+        self.assertEqual(walks, list(deepwalk.stream(self.graph, batch_size=100)))